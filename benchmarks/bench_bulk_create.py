@@ -0,0 +1,44 @@
+"""
+Creating a wave of users one at a time with create_user, against
+bulk_create_users, with network latency on every request.
+
+    python benchmarks/bench_bulk_create.py [users] [latency ms]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+from okta.models.user.User import User
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.02
+
+    with open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'created_user.json'), 'rb') as f:
+        base_url, server = mock_server.start(f.read(), latency=latency)
+    client = UsersClient(base_url, 'benchmark-token')
+    users = [User(login='user{0}@example.com'.format(n), email='user{0}@example.com'.format(n),
+                  firstName='User', lastName=str(n)) for n in range(count)]
+
+    print("{0} users, {1:.0f} ms latency".format(count, latency * 1000))
+    start = time.perf_counter()
+    for user in users:
+        client.create_user(user, activate=False)
+    print("  create_user loop            {0:6.2f} s".format(time.perf_counter() - start))
+
+    for workers in (4, 8):
+        start = time.perf_counter()
+        result = client.bulk_create_users(users, activate=False, workers=workers)
+        print("  bulk_create_users({0} workers) {1:6.2f} s  ({2} created)".format(
+            workers, time.perf_counter() - start, len(result.succeeded)))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
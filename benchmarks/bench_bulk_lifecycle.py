@@ -0,0 +1,46 @@
+"""
+Deactivating users one at a time with deactivate_user, against
+bulk_lifecycle, with network latency on every request.
+
+    python benchmarks/bench_bulk_lifecycle.py [users] [latency ms]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.02
+
+    with open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'user.json'), 'rb') as f:
+        base_url, server = mock_server.start(f.read(), latency=latency)
+    client = UsersClient(base_url, 'benchmark-token')
+    uids = ['00u{0:017d}'.format(n) for n in range(count)]
+
+    print("{0} users, {1:.0f} ms latency".format(count, latency * 1000))
+    start = time.perf_counter()
+    for uid in uids:
+        client.deactivate_user(uid)
+    print("  deactivate_user loop          {0:6.2f} s".format(time.perf_counter() - start))
+
+    for workers in (8, 16):
+        # Workers beyond the pool's size would open a new connection per request
+        client = UsersClient(base_url, 'benchmark-token', pool_maxsize=workers)
+        result = client.bulk_lifecycle(uids, 'deactivate', workers=workers)
+        stats = result.stats()
+        print("  bulk_lifecycle({0:2} workers)    {1:6.2f} s  {2:6.0f}/s  p50 {3:5.1f} ms  p95 {4:5.1f} ms".format(
+            workers, stats['elapsed'], stats['per_second'], stats['latency_p50'] * 1000,
+            stats['latency_p95'] * 1000))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
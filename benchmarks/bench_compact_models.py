@@ -0,0 +1,50 @@
+"""
+Memory held by a decoded user directory with the regular models and with
+the slot-based compact models.
+
+    python benchmarks/bench_compact_models.py [records]
+"""
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from okta.framework.Utils import Utils
+from okta.models.user.CompactUser import CompactUser
+from okta.models.user.User import User
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def measure(label, data, to_class):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    users = Utils.deserialize(data, to_class, timestamps='raw')
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("{0:<10} {1:8.1f} MB   {2:6.0f} bytes/user   {3:6.3f} s".format(
+        label, held / 1e6, held / len(users), elapsed))
+    return held
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with open(os.path.join(DATA, 'users.json')) as f:
+        users = json.load(f)
+    data = (users * (records // len(users) + 1))[:records]
+
+    print("Holding {0:,} decoded users (timestamps kept raw, so only the models differ)".format(records))
+    regular = measure('regular', data, User)
+    compact = measure('compact', data, CompactUser)
+    print("compact models use {0:.0%} of the memory".format(compact / float(regular)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Repeated lookups of the same users through a cache whose entries have
+already expired, fetching and decoding every user again versus
+revalidating it with If-None-Match and getting a 304 Not Modified.
+
+    python benchmarks/bench_conditional_requests.py [lookups] [distinct users] [latency ms]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+from okta.framework.Cache import Cache
+
+
+def run(base_url, uids):
+    # A ttl of 0 makes every lookup after the first go back to the server
+    cache = Cache(max_size=1000, ttl=0)
+    client = UsersClient(base_url, 'benchmark-token', cache=cache)
+    start = time.perf_counter()
+    for uid in uids:
+        client.get_user(uid)
+    return time.perf_counter() - start, cache.stats()
+
+
+def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    latency = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0
+
+    with open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'user.json'), 'rb') as f:
+        body = f.read()
+    random.seed(1)
+    uids = ['00u{0:017d}'.format(random.randrange(distinct)) for _ in range(lookups)]
+    print("{0:,} lookups of {1} distinct users, {2:.0f} ms latency".format(lookups, distinct, latency * 1000))
+
+    base_url, server = mock_server.start(body, latency=latency)
+    elapsed, stats = run(base_url, uids)
+    print("  no ETag      {0:6.2f} s  ({1:,} bodies decoded)".format(elapsed, stats['misses']))
+    server.shutdown()
+
+    base_url, server = mock_server.start(body, latency=latency, etag='W/"1"')
+    elapsed, stats = run(base_url, uids)
+    print("  ETag         {0:6.2f} s  ({1:,} bodies decoded, {2:,} revalidated)".format(
+        elapsed, stats['misses'] - stats['revalidations'], stats['revalidations']))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Decoding a large user listing with the compiled per-class decoders, against
+the reflective Utils.deserialize they replaced.
+
+    python benchmarks/bench_deserialize.py [records]
+
+The fixture in tests/data/users.json is repeated until the listing holds
+the requested number of records (100,000 by default).
+"""
+import json
+import os
+import sys
+import time
+import types
+
+import dateutil.parser
+import six
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def reflective_deserialize(from_data, to_class):
+    """Utils.deserialize as it was before decoders were compiled, kept as the baseline"""
+
+    def custom_setattr(o, a, v):
+        if hasattr(o, 'alt_names') and a in o.alt_names:
+            a = o.alt_names[a]
+
+        setattr(o, a, v)
+
+    json_dump = {}
+    if from_data is None or len(from_data) == 0:
+        json_dump = {}
+    elif isinstance(from_data, six.text_type) or isinstance(from_data, six.string_types):
+        json_dump = json.loads(from_data)
+    else:
+        json_dump = from_data
+
+    list_type = types.ListType if six.PY2 else list
+    if isinstance(json_dump, list_type):
+        return [reflective_deserialize(obj, to_class) for obj in json_dump]
+
+    obj = to_class()
+    if hasattr(to_class, 'types'):
+        for attr, attr_type in six.iteritems(to_class.types):
+            if attr in json_dump:
+                val = json_dump[attr]
+                if not val:
+                    continue
+                if attr_type == datetime:
+                    val = dateutil.parser.parse(val)
+                elif attr_type == str or attr_type == int or attr_type == dict or attr_type == bool:
+                    pass
+                else:
+                    val = reflective_deserialize(val, attr_type)
+                custom_setattr(obj, attr, val)
+    else:
+        for key, value in six.iteritems(json_dump):
+            if key in to_class.__dict__:
+                custom_setattr(obj, key, json_dump[key])
+
+    if hasattr(to_class, 'dict_types'):
+        for attr, attr_type in six.iteritems(to_class.dict_types):
+            if attr in json_dump:
+                new_dict = dict()
+                for key, value in six.iteritems(json_dump[attr]):
+                    new_dict[key] = reflective_deserialize(value, attr_type)
+                custom_setattr(obj, attr, new_dict)
+
+    return obj
+
+
+def scaled_users(records):
+    with open(os.path.join(DATA, 'users.json')) as f:
+        users = json.load(f)
+    return (users * (records // len(users) + 1))[:records]
+
+
+def bench(label, fn, data):
+    start = time.perf_counter()
+    result = fn(data, User)
+    elapsed = time.perf_counter() - start
+    print("{0:<14} {1:8.3f} s   {2:10,.0f} records/s".format(label, elapsed, len(result) / elapsed))
+    return elapsed
+
+
+def compare(data):
+    before = bench('reflective', reflective_deserialize, data)
+    after = bench('compiled', Utils.deserialize, data)
+    print("speedup        {0:8.2f}x".format(before / after))
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = scaled_users(records)
+    print("Decoding {0:,} users".format(records))
+    compare(data)
+
+    # Timestamp parsing costs the same either way, so show the decoding cost on its own too
+    timestamps = [key for key, attr_type in six.iteritems(User.types) if attr_type == datetime]
+    data = [dict((k, v) for k, v in six.iteritems(user) if k not in timestamps) for user in data]
+    print("\nDecoding {0:,} users without timestamps".format(records))
+    compare(data)
+
+
+if __name__ == '__main__':
+    main()
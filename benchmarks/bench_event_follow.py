@@ -0,0 +1,51 @@
+"""
+Requests spent tailing a quiet event log: polling at a fixed interval,
+against follow() backing off while no events arrive. The worst case
+delay before an event is yielded is the longest wait between polls.
+
+    python benchmarks/bench_event_follow.py [seconds] [min interval ms] [max interval ms]
+"""
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.EventsClient import EventsClient
+from okta.framework.Serializer import Serializer
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    min_interval = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.05
+    max_interval = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 1.0
+
+    base_url, server = mock_server.start(b'[]', latency=0.005)
+    client = EventsClient(base_url, 'benchmark-token')
+    print("Quiet log for {0:.0f} s, polling every {1:.0f} ms, backing off to {2:.0f} ms".format(
+        seconds, min_interval * 1000, max_interval * 1000))
+
+    requests = 0
+    deadline = time.perf_counter() + seconds
+    since = Serializer.format_filter_timestamp(datetime.utcnow())
+    while time.perf_counter() < deadline:
+        client.get_events(filter_string='published gt "{0}"'.format(since))
+        requests += 1
+        time.sleep(min_interval)
+    print("  fixed interval     {0:5} requests  worst delay {1:5.0f} ms".format(requests, min_interval * 1000))
+
+    follower = client.follow(min_interval=min_interval, max_interval=max_interval)
+    timer = threading.Timer(seconds, follower.stop)
+    timer.start()
+    for event in follower:
+        pass
+    print("  follow()           {0:5} requests  worst delay {1:5.0f} ms".format(follower.polls, max_interval * 1000))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Exporting a paged user directory to CSV by hand, building rows from the
+User objects of every page and writing them at the end, against
+UserExporter, which flattens each page's JSON straight into columns.
+
+    python benchmarks/bench_export.py [pages] [users per page]
+"""
+import csv
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+from okta.framework.UserExporter import UserExporter
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def measure(label, fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("  {0:<14} peak {1:7.1f} MB  {2:6.2f} s  ({3:,} users)".format(label, peak / 1e6, elapsed, count))
+
+
+def by_hand(client, columns):
+    rows = []
+    for user in client.iter_users():
+        row = [getattr(user, column) for column in columns if '.' not in column]
+        row += [getattr(user.profile, column[len('profile.'):]) for column in columns if '.' in column]
+        rows.append(row)
+    writer = csv.writer(io.StringIO())
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return len(rows)
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    per_page = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    with open(os.path.join(DATA, 'users.json')) as f:
+        users = json.load(f)
+    body = json.dumps((users * (per_page // len(users) + 1))[:per_page]).encode('utf-8')
+    base_url, server = mock_server.start(body, pages=pages)
+    client = UsersClient(base_url, 'benchmark-token')
+    columns = UserExporter(client).columns
+
+    print("{0} pages of {1:,} users, {2} columns".format(pages, per_page, len(columns)))
+    measure('by hand', lambda: by_hand(client, columns))
+    measure('UserExporter', lambda: UserExporter(client, batch_size=per_page).to_csv(io.StringIO()))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Listing the members of many groups, each spread over several pages:
+one group after another with iter_group_users, against
+iter_members_of_groups paging through several groups at once.
+
+    python benchmarks/bench_group_members.py [groups] [pages per group] [latency ms]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UserGroupsClient import UserGroupsClient
+
+
+def main():
+    groups = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    latency = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.02
+
+    records = [{'id': '00u{0:017d}'.format(n), 'profile': {}} for n in range(200)]
+    base_url, server = mock_server.start(json.dumps(records).encode('utf-8'), latency=latency, pages=pages)
+    gids = ['00g{0:017d}'.format(n) for n in range(groups)]
+    client = UserGroupsClient(base_url, 'benchmark-token', pool_maxsize=8)
+    print("Members of {0} groups, {1} pages each, {2:.0f} ms latency".format(groups, pages, latency * 1000))
+
+    start = time.perf_counter()
+    count = sum(1 for gid in gids for user in client.iter_group_users(gid))
+    print("  one group at a time        {0:6.2f} s  ({1:,} members)".format(time.perf_counter() - start, count))
+
+    for workers in (4, 8):
+        start = time.perf_counter()
+        count = sum(1 for member in client.iter_members_of_groups(gids, workers=workers))
+        print("  {0} groups at once          {1:6.2f} s  ({2:,} members)".format(
+            workers, time.perf_counter() - start, count))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
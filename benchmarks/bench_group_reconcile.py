@@ -0,0 +1,60 @@
+"""
+Aligning group members with an HR feed: one group after another, listing
+its members and adding and removing the differences one call at a time,
+against reconcile_group_members.
+
+Every group of the mock org has the same members, and each group's desired
+members drop some of them and add as many new ones.
+
+    python benchmarks/bench_group_reconcile.py [groups] [changes per group] [latency ms]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UserGroupsClient import UserGroupsClient
+
+
+def main():
+    groups = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    latency = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.02
+
+    members = ['00u{0:017d}'.format(n) for n in range(200)]
+    body = json.dumps([{'id': uid, 'profile': {}} for uid in members]).encode('utf-8')
+    base_url, server = mock_server.start(body, latency=latency, pages=2)
+    desired = dict(('00g{0:017d}'.format(n), members[changes:] + ['00n{0:017d}'.format(m) for m in range(changes)])
+                   for n in range(groups))
+    print("{0} groups, {1} additions and {1} removals each, {2:.0f} ms latency".format(
+        groups, changes, latency * 1000))
+
+    client = UserGroupsClient(base_url, 'benchmark-token', pool_maxsize=8)
+    start = time.perf_counter()
+    for gid, uids in desired.items():
+        current = [user.id for user in client.iter_group_users(gid)]
+        for uid in uids:
+            if uid not in current:
+                client.add_user_to_group_by_id(gid, uid)
+        for uid in current:
+            if uid not in uids:
+                client.remove_user_from_group_by_id(gid, uid)
+    print("  one call at a time         {0:6.2f} s".format(time.perf_counter() - start))
+
+    client = UserGroupsClient(base_url, 'benchmark-token', pool_maxsize=8)
+    result = client.reconcile_group_members(desired, workers=8)
+    summary = result.summary()
+    print("  reconcile_group_members    {0:6.2f} s  (+{1} -{2}, {3} failed)".format(
+        summary['elapsed'], summary['added'], summary['removed'], summary['failed']))
+
+    result = client.reconcile_group_members(desired, dry_run=True, workers=8)
+    print("  dry run                    {0:6.2f} s".format(result.summary()['elapsed']))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Decoding a page of users from response bytes and encoding it back with
+each installed JSON backend, against the json.loads(response.text) and
+json.dumps(cls=Serializer) used before.
+
+    python benchmarks/bench_json_codec.py [users] [rounds]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from okta.framework.JsonCodec import JsonCodec
+from okta.framework.Serializer import Serializer
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def timed(label, rounds, fn):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    elapsed = time.perf_counter() - start
+    print("  {0:<28} {1:8.2f} ms".format(label, elapsed / rounds * 1000))
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    with open(os.path.join(DATA, 'users.json')) as f:
+        users = json.load(f)
+    users = (users * (records // len(users) + 1))[:records]
+    body = json.dumps(users).encode('utf-8')
+    models = Utils.deserialize(users, User, timestamps='raw')
+
+    print("Decoding a {0:,} byte page of {1:,} users".format(len(body), records))
+    timed('json.loads(text)', rounds, lambda: json.loads(body.decode('utf-8')))
+    for backend in JsonCodec.available_backends():
+        codec = JsonCodec(backend)
+        timed(backend, rounds, lambda: codec.loads(body))
+
+    print("Encoding {0:,} users".format(records))
+    timed('json.dumps(cls=Serializer)', rounds, lambda: json.dumps(models, cls=Serializer))
+    for backend in JsonCodec.available_backends():
+        codec = JsonCodec(backend)
+        timed(backend, rounds, lambda: codec.dumps(models))
+
+
+if __name__ == '__main__':
+    main()
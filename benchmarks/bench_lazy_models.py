@@ -0,0 +1,52 @@
+"""
+CPU time and peak memory of decoding a wide user listing eagerly and
+lazily, when only id, status and profile.login are read.
+
+    python benchmarks/bench_lazy_models.py [records]
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def listing(text, lazy):
+    users = Utils.deserialize(text, User, lazy=lazy)
+    return [(user.id, user.status, user.profile.login) for user in users], users
+
+
+def measure(label, text, lazy):
+    start = time.perf_counter()
+    listing(text, lazy)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = listing(text, lazy)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print("{0:<8} {1:8.3f} s   peak {2:8.1f} MB".format(label, elapsed, peak / 1e6))
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with open(os.path.join(DATA, 'users.json')) as f:
+        users = json.load(f)
+    text = json.dumps((users * (records // len(users) + 1))[:records])
+
+    print("Listing {0:,} users, reading id, status and profile.login".format(records))
+    measure('eager', text, False)
+    measure('lazy', text, True)
+
+
+if __name__ == '__main__':
+    main()
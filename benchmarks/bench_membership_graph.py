@@ -0,0 +1,55 @@
+"""
+An access review asking which groups each user is in, one
+get_user_groups call per user, against crawling the groups' members
+once into a MembershipGraph and answering from memory.
+
+The mock org answers every request with the same listing, so it has as
+many groups as users and every user is in every group.
+
+    python benchmarks/bench_membership_graph.py [groups] [users] [latency ms]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UserGroupsClient import UserGroupsClient
+from okta.UsersClient import UsersClient
+from okta.framework.MembershipGraph import MembershipGraph
+
+
+def main():
+    groups = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    latency = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.02
+
+    records = [{'id': '00x{0:017d}'.format(n), 'profile': {}} for n in range(max(groups, users))]
+    base_url, server = mock_server.start(json.dumps(records).encode('utf-8'), latency=latency)
+    uids = [record['id'] for record in records[:users]]
+    gids = [record['id'] for record in records[:groups]]
+    print("Groups of {0} users across {1} groups, {2:.0f} ms latency".format(users, groups, latency * 1000))
+
+    client = UsersClient(base_url, 'benchmark-token', pool_maxsize=8)
+    start = time.perf_counter()
+    for uid in uids:
+        client.get_user_groups(uid)
+    print("  get_user_groups per user   {0:6.2f} s".format(time.perf_counter() - start))
+
+    groups_client = UserGroupsClient(base_url, 'benchmark-token', pool_maxsize=8)
+    start = time.perf_counter()
+    graph = MembershipGraph.crawl(groups_client, gids, workers=8)
+    crawled = time.perf_counter() - start
+    start = time.perf_counter()
+    for uid in uids:
+        graph.groups_of(uid)
+    print("  MembershipGraph            {0:6.2f} s  (crawl {1:.2f} s, {2:,} memberships)".format(
+        crawled + time.perf_counter() - start, crawled, graph.stats()['memberships']))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
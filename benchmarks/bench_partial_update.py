@@ -0,0 +1,53 @@
+"""
+Setting one profile attribute on many users, sending each whole user
+versus only the fields the ChangeTracker found changed.
+
+    python benchmarks/bench_partial_update.py [users] [latency ms]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+from okta.framework.ChangeTracker import ChangeTracker
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+
+def run(client, users):
+    sent = 0
+    start = time.perf_counter()
+    for user in users:
+        user.profile.department = 'Engineering'
+        changes = ChangeTracker.changes(user)
+        sent += len(client.json_codec.dumps(user if changes is None else changes))
+        client.update_user(user)
+    return time.perf_counter() - start, sent
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0
+
+    with open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'user.json'), 'rb') as f:
+        body = f.read()
+    base_url, server = mock_server.start(body, latency=latency)
+    client = UsersClient(base_url, 'benchmark-token')
+    print("Setting the department of {0:,} users, {1:.0f} ms latency".format(count, latency * 1000))
+
+    users = [Utils.deserialize(body, User) for _ in range(count)]
+    elapsed, sent = run(client, users)
+    print("  whole user   {0:6.2f} s  {1:>12,} bytes sent".format(elapsed, sent))
+
+    users = [Utils.deserialize(body, User, track=True) for _ in range(count)]
+    elapsed, sent = run(client, users)
+    print("  changes      {0:6.2f} s  {1:>12,} bytes sent".format(elapsed, sent))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
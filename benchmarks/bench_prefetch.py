@@ -0,0 +1,49 @@
+"""
+A full sweep of a paged user listing, with and without fetching the next
+pages ahead, when both the network and the caller take time per page.
+
+    python benchmarks/bench_prefetch.py [pages] [latency ms] [processing ms]
+
+Without prefetching the sweep takes roughly pages * (latency +
+processing); with it, roughly pages * max(latency, processing).
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+
+
+def sweep(client, prefetch, processing):
+    start = time.perf_counter()
+    count = 0
+    for count, user in enumerate(client.iter_users(prefetch=prefetch), 1):
+        if count % 5 == 0:
+            # Stands in for whatever the caller does with a page's records
+            time.sleep(processing)
+    return time.perf_counter() - start, count
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.03
+    processing = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.03
+
+    with open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'users.json'), 'rb') as f:
+        base_url, server = mock_server.start(f.read(), latency=latency, pages=pages)
+    client = UsersClient(base_url, 'benchmark-token')
+
+    print("{0} pages, {1:.0f} ms latency and {2:.0f} ms processing per page".format(
+        pages, latency * 1000, processing * 1000))
+    for prefetch in (0, 1, 2):
+        elapsed, count = sweep(client, prefetch, processing)
+        print("  prefetch={0}  {1:6.2f} s  ({2} users)".format(prefetch, elapsed, count))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Encoding a large batch of users, as bulk create and update payloads are,
+with the compiled per-class encoders against the reflective
+remove_nulls/replace_alt_names conversion they replaced.
+
+    python benchmarks/bench_serialize.py [users]
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from okta.framework.JsonCodec import JsonCodec
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+
+class ReflectiveSerializer(json.JSONEncoder):
+    """Serializer as it was before encoders were compiled, kept as the baseline"""
+
+    def default(self, obj):
+        if isinstance(obj, datetime):
+            return obj.strftime('dt(%Y-%m-%dT%H:%M:%SZ)')
+        no_nulls = Utils.remove_nulls(Utils.model_attributes(obj))
+        return Utils.replace_alt_names(obj, no_nulls)
+
+
+def measure(label, encode, users, baseline=None):
+    start = time.perf_counter()
+    for user in users:
+        encode(user)
+    elapsed = time.perf_counter() - start
+    speedup = '  {0:5.2f}x'.format(baseline / elapsed) if baseline else ''
+    print("  {0:<16} {1:6.3f} s  {2:>9,.0f} users/s{3}".format(label, elapsed, len(users) / elapsed, speedup))
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    with open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'user.json'), 'rb') as f:
+        body = f.read()
+    users = [Utils.deserialize(body, User) for _ in range(count)]
+
+    print("Encoding {0:,} users".format(count))
+    baseline = measure('reflective', lambda user: json.dumps(user, cls=ReflectiveSerializer).encode('utf-8'), users)
+    for backend in JsonCodec.available_backends():
+        measure('compiled ' + backend, JsonCodec(backend).dumps, users, baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Per-request latency of bare requests.get (a new connection per call)
+against ApiClient's pooled keep-alive session, using a local mock org.
+
+    python benchmarks/bench_session_pool.py [requests]
+
+Against a real org the gap is larger, since every new connection there
+also pays a TLS handshake.
+"""
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+
+
+def bench(label, fn, count):
+    fn()  # warm up
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    print("{0:<24} mean {1:7.3f} ms   p50 {2:7.3f} ms   p99 {3:7.3f} ms".format(
+        label,
+        1000 * sum(samples) / count,
+        1000 * samples[count // 2],
+        1000 * samples[int(count * 0.99)]))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'user.json'), 'rb') as f:
+        base_url, server = mock_server.start(f.read())
+
+    client = UsersClient(base_url=base_url, api_token='benchmark')
+    url = client.base_url + '/00ub0oNGTSWTBKOLGLNR'
+
+    bench('requests.get', lambda: requests.get(url, headers=client.headers), count)
+    bench('ApiClient pooled', lambda: client.get(url), count)
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Peak memory of reading one very large page of users through get_users,
+against get_users(stream=True), when each user is used and then dropped.
+
+    python benchmarks/bench_streaming.py [users]
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def measure(label, fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("  {0:<22} peak {1:7.1f} MB  {2:6.2f} s  ({3:,} users)".format(label, peak / 1e6, elapsed, count))
+
+
+def consume(users):
+    count = 0
+    for user in users:
+        user.profile.login
+        count += 1
+    return count
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with open(os.path.join(DATA, 'users.json')) as f:
+        users = json.load(f)
+    body = json.dumps((users * (records // len(users) + 1))[:records]).encode('utf-8')
+    base_url, server = mock_server.start(body)
+    client = UsersClient(base_url, 'benchmark-token')
+
+    print("One page of {0:,} users, {1:.1f} MB".format(records, len(body) / 1e6))
+    measure('get_users()', lambda: consume(client.get_users()))
+    measure('get_users(stream=True)', lambda: consume(client.get_users(stream=True)))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
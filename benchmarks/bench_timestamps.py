@@ -0,0 +1,87 @@
+"""
+Decoding full user and event exports with each timestamp mode, against
+the dateutil parsing used before.
+
+    python benchmarks/bench_timestamps.py [records]
+"""
+import json
+import os
+import sys
+import time
+
+import dateutil.parser
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from okta.framework.Deserializer import Deserializer
+from okta.framework.Utils import Utils
+from okta.models.event.Event import Event
+from okta.models.user.User import User
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+EVENT = {
+    "eventId": "tevJaSvrF0CQYO_HbEMa03zYg1428346536000",
+    "sessionId": "trsXfYxlFT6SJiG4rhi-EskUQ",
+    "requestId": "reqjDcKHbAKTMewdiRIAI__-Q",
+    "published": "2015-04-06T18:55:36.000Z",
+    "action": {
+        "message": "App configuration updated ",
+        "categories": [],
+        "objectType": "app.generic.config.app_updated",
+        "requestUri": "/fake"
+    },
+    "actors": [{"id": "00uh7tCkIn4yHncnR0g3", "displayName": "BB", "login": "q@vinegar.com", "objectType": "User"}],
+    "targets": [{"id": "0oah8iGK5tNBNwX6e0g3", "displayName": "Okta Administration", "objectType": "AppInstance"}]
+}
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print("  {0:<34} {1:8.3f} s".format(label, elapsed))
+
+
+def read_users(users):
+    for user in users:
+        user.id, user.status, user.profile.login
+
+
+def read_users_with_timestamps(users):
+    for user in users:
+        user.id, user.status, user.profile.login, user.lastUpdated
+
+
+def export(label, data, to_class, read, read_timestamps):
+    print("{0} ({1:,} records)".format(label, len(data)))
+
+    fast_parse = Deserializer.parse_timestamp
+    Deserializer.parse_timestamp = staticmethod(dateutil.parser.parse)
+    Deserializer.clear()
+    timed('dateutil', lambda: Utils.deserialize(data, to_class))
+    Deserializer.parse_timestamp = fast_parse
+    Deserializer.clear()
+
+    timed("timestamps='parse'", lambda: Utils.deserialize(data, to_class))
+    timed("timestamps='raw'", lambda: Utils.deserialize(data, to_class, timestamps='raw'))
+    timed("timestamps='lazy', unread", lambda: read(Utils.deserialize(data, to_class, timestamps='lazy')))
+    timed("timestamps='lazy', one read each",
+          lambda: read_timestamps(Utils.deserialize(data, to_class, timestamps='lazy')))
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with open(os.path.join(DATA, 'users.json')) as f:
+        users = json.load(f)
+    users = (users * (records // len(users) + 1))[:records]
+    events = [EVENT] * records
+
+    export('Users', users, User, read_users, read_users_with_timestamps)
+    export('Events', events, Event,
+           lambda events: [event.requestId for event in events],
+           lambda events: [event.published for event in events])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+A hot path that looks up the same few users and their groups over and
+over, with and without a Cache, with network latency on every request.
+
+    python benchmarks/bench_user_cache.py [lookups] [distinct users] [latency ms]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+from okta.framework.Cache import Cache
+
+
+def run(client, uids):
+    start = time.perf_counter()
+    for uid in uids:
+        client.get_user(uid)
+    return time.perf_counter() - start
+
+
+def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    latency = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.005
+
+    with open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'user.json'), 'rb') as f:
+        base_url, server = mock_server.start(f.read(), latency=latency)
+    random.seed(1)
+    uids = ['00u{0:017d}'.format(random.randrange(distinct)) for _ in range(lookups)]
+
+    print("{0:,} lookups of {1} distinct users, {2:.0f} ms latency".format(lookups, distinct, latency * 1000))
+    elapsed = run(UsersClient(base_url, 'benchmark-token'), uids)
+    print("  no cache   {0:6.2f} s".format(elapsed))
+
+    cache = Cache(max_size=1000, ttl=300)
+    elapsed = run(UsersClient(base_url, 'benchmark-token', cache=cache), uids)
+    stats = cache.stats()
+    print("  Cache      {0:6.2f} s  ({1} hits, {2} misses)".format(elapsed, stats['hits'], stats['misses']))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Finding users by login, email and employee number in a local directory,
+scanning the list get_users returned against looking them up in a
+UserIndex.
+
+    python benchmarks/bench_user_index.py [users] [lookups]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from okta.framework.UserIndex import UserIndex
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def scan(users, attribute, value):
+    value = value.lower()
+    for user in users:
+        if (getattr(user.profile, attribute) or '').lower() == value:
+            return user
+    return None
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with open(os.path.join(DATA, 'user.json')) as f:
+        template = json.load(f)
+    records = []
+    for n in range(count):
+        profile = dict(template['profile'], login='user{0}@example.com'.format(n),
+                       email='user{0}@example.com'.format(n), employeeNumber=str(100000 + n))
+        records.append(dict(template, id='00u{0:017d}'.format(n), profile=profile))
+    users = Utils.deserialize(records, User, timestamps='raw')
+
+    random.seed(1)
+    queries = [random.choice([('login', 'user{0}@example.com'), ('email', 'USER{0}@EXAMPLE.COM'),
+                              ('employeeNumber', '{0}')]) for _ in range(lookups)]
+    queries = [(attribute, value.format(random.randrange(count) if attribute != 'employeeNumber'
+                                        else 100000 + random.randrange(count))) for attribute, value in queries]
+    print("{0:,} lookups in a directory of {1:,} users".format(lookups, count))
+
+    start = time.perf_counter()
+    for attribute, value in queries:
+        scan(users, attribute, value)
+    print("  list scan        {0:8.3f} s".format(time.perf_counter() - start))
+
+    start = time.perf_counter()
+    index = UserIndex(users=users)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    for attribute, value in queries:
+        index.find_one(attribute, value)
+    print("  UserIndex        {0:8.3f} s  (built in {1:.3f} s)".format(time.perf_counter() - start, built))
+
+    start = time.perf_counter()
+    for n in range(lookups):
+        list(index.find_prefix('login', 'user{0}'.format(n % 1000)))
+    print("  prefix queries   {0:8.3f} s".format(time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
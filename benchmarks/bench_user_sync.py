@@ -0,0 +1,61 @@
+"""
+A nightly sync of a paged user directory, re-downloading every user
+against a UserSync run that fetches only the users changed since the
+last one.
+
+    python benchmarks/bench_user_sync.py [pages] [users per page] [changed users] [latency ms]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_server
+from okta.UsersClient import UsersClient
+from okta.framework.UserSync import UserSync
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
+
+
+def listing(users, count, last_updated=None):
+    records = []
+    for n in range(count):
+        user = dict(users[n % len(users)], id='00u{0:017d}'.format(n))
+        if last_updated:
+            user['lastUpdated'] = last_updated
+        records.append(user)
+    return json.dumps(records).encode('utf-8')
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    per_page = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    changed = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    latency = float(sys.argv[4]) / 1000 if len(sys.argv) > 4 else 0.05
+
+    with open(os.path.join(DATA, 'users.json')) as f:
+        users = json.load(f)
+    directory_url, directory = mock_server.start(listing(users, per_page), latency=latency, pages=pages)
+    changes_url, changes = mock_server.start(listing(users, changed, '2020-07-01T00:00:00.000Z'), latency=latency)
+
+    print("{0:,} users in {1} pages, {2} changed, {3:.0f} ms latency".format(pages * per_page, pages, changed,
+                                                                             latency * 1000))
+    sync = UserSync(UsersClient(directory_url, 'benchmark-token'))
+    start = time.perf_counter()
+    sync.run()
+    print("  full download   {0:6.2f} s".format(time.perf_counter() - start))
+
+    sync.client = UsersClient(changes_url, 'benchmark-token')
+    start = time.perf_counter()
+    result = sync.run()
+    print("  incremental     {0:6.2f} s  ({1} updated)".format(time.perf_counter() - start,
+                                                             result.summary()['updated']))
+
+    directory.shutdown()
+    changes.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+A tiny local stand-in for an Okta org, used by the benchmark scripts.
+
+It speaks HTTP/1.1 so clients can keep connections alive, and answers
+every GET with the contents of a fixture file. It can also wait before
+answering, to stand in for network latency, link a number of pages
+together with next links, and tag the body with an ETag, answering
+304 Not Modified to requests that already hold it.
+"""
+import re
+import threading
+import time
+
+from six.moves import BaseHTTPServer, socketserver
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    body = b'[]'
+    latency = 0
+    pages = 0
+    etag = None
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        if self.latency:
+            time.sleep(self.latency)
+        if self.etag is not None and self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        if self.etag is not None:
+            self.send_header('ETag', self.etag)
+        self._link_next_page()
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    do_GET = _respond
+    do_POST = _respond
+    do_PUT = _respond
+    do_DELETE = _respond
+
+    def _link_next_page(self):
+        match = re.search(r'[?&]page=(\d+)', self.path)
+        number = int(match.group(1)) if match else 0
+        if number + 1 < self.pages:
+            url = 'http://{0}:{1}{2}?page={3}'.format(self.server.server_address[0], self.server.server_address[1],
+                                                       self.path.split('?')[0], number + 1)
+            self.send_header('Link', '<{0}>; rel="next"'.format(url))
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    # Room for many clients connecting at once
+    request_queue_size = 128
+
+
+def start(body=b'[]', latency=0, pages=0, etag=None):
+    """Start the server on a free port and return (base_url, server)
+
+    latency is the seconds waited before each response, and pages the
+    number of pages linked together by next links. With an etag, every
+    response carries it and conditional requests for it get a 304.
+    """
+    handler = type('Handler', (_Handler,), {'body': body, 'latency': latency, 'pages': pages, 'etag': etag})
+    server = _Server(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return 'http://127.0.0.1:{0}'.format(server.server_address[1]), server
@@ -1,26 +1,26 @@
 """
 If you have custom attributes on your Okta user profile, you need to
 create a subclass of User and UserProfile.
+
+Declare the extended types at class level, so the base classes' tables
+are left alone and the deserializer sees them from the start.
 """
 from okta.models.user.User import User
 from okta.models.user.UserProfile import UserProfile
 
-class ExtendedUser(User):
-    def __init__(self, **kwargs):
-        self.types["profile"] = ExtendedUserProfile
-        self.profile = ExtendedUserProfile()
-        self.set_profile(**kwargs)
-
 
 class ExtendedUserProfile(UserProfile):
-    types = {
+    types = dict(UserProfile.types, **{
         'windows_username': str,
         'sfdc_id': str
-    }
+    })
 
     def __init__(self):
-        # merge the types dict from super
-        self.types.update(super().types)
+        UserProfile.__init__(self)
 
         self.windows_username = None
         self.sfdc_id = None
+
+
+class ExtendedUser(User):
+    types = dict(User.types, profile=ExtendedUserProfile)
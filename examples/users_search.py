@@ -12,17 +12,8 @@ usersClient = UsersClient(
 print("Search users...")
 try:
     # set a low limit to guarantee we get at least 2 pages of results
-    users = usersClient.get_paged_users(limit=2)
-    pageNo = 1
-    while not users.is_last_page():
-        print("Page number {0}".format(pageNo))
-        
-        for user in users.result:
-            print("{0} {1}".format(user.profile.firstName, user.profile.lastName))
-        
-        if not users.is_last_page():
-            users = usersClient.get_paged_users(url=users.next_url)
-            pageNo = pageNo + 1
+    for user in usersClient.iter_users(limit=2):
+        print("{0} {1}".format(user.profile.firstName, user.profile.lastName))
 
 except OktaError as e:
     print(e.error_summary)
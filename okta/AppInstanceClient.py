@@ -1,5 +1,4 @@
 from okta.framework.ApiClient import ApiClient
-from okta.framework.Utils import Utils
 from okta.framework.PagedResults import PagedResults
 from okta.models.app.AppInstance import AppInstance
 
@@ -25,7 +24,7 @@ class AppInstanceClient(ApiClient):
             'filter': filter_string
         }
         response = ApiClient.get_path(self, '/', params=params)
-        return Utils.deserialize(response.text, AppInstance)
+        return ApiClient.deserialize(self, response, AppInstance)
 
     def get_paged_app_instances(self, limit=None, filter_string=None, after=None, url=None):
         """Get a paged list of AppInstances
@@ -51,7 +50,23 @@ class AppInstanceClient(ApiClient):
             }
             response = ApiClient.get_path(self, '/', params=params)
 
-        return PagedResults(response, AppInstance)
+        return PagedResults(response, AppInstance, self.deserialize_options)
+
+    def iter_app_instances(self, limit=None, filter_string=None, after=None, prefetch=0):
+        """Iterate over every AppInstance, fetching pages as they are needed
+
+        :param limit: number of apps fetched per page
+        :type limit: int or None
+        :param filter_string: string to filter apps
+        :type filter_string: str or None
+        :param after: app id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: generator of AppInstance
+        """
+        return PagedResults.iterate(self.get_paged_app_instances, prefetch,
+                                    limit=limit, filter_string=filter_string, after=after)
 
     def create_app_instance(self, app_instance):
         """Create a app instance
@@ -61,7 +76,7 @@ class AppInstanceClient(ApiClient):
         :rtype: AppInstance
         """
         response = ApiClient.post_path(self, '/', app_instance)
-        return Utils.deserialize(response.text, AppInstance)
+        return ApiClient.deserialize(self, response, AppInstance)
 
     def get_app_instance(self, id):
         """Get a single app
@@ -70,8 +85,7 @@ class AppInstanceClient(ApiClient):
         :type id: str
         :rtype: AppInstance
         """
-        response = ApiClient.get_path(self, '/{0}'.format(id))
-        return Utils.deserialize(response.text, AppInstance)
+        return ApiClient.get_cached(self, '/{0}'.format(id), AppInstance, ('app_instance', id))
 
     def update_app_instance(self, app_instance):
         """Update an app
@@ -92,7 +106,8 @@ class AppInstanceClient(ApiClient):
         :rtype: AppInstance
         """
         response = ApiClient.put_path(self, '/{0}'.format(id), app_instance)
-        return Utils.deserialize(response.text, AppInstance)
+        self.__invalidate_cached(id)
+        return ApiClient.deserialize(self, response, AppInstance)
 
     def delete_app_instance(self, id):
         """Delete app by target id
@@ -102,6 +117,7 @@ class AppInstanceClient(ApiClient):
         :return: None
         """
         ApiClient.delete_path(self, '/{0}'.format(id))
+        self.__invalidate_cached(id)
 
     # LIFECYCLE
 
@@ -113,6 +129,7 @@ class AppInstanceClient(ApiClient):
         :return: None
         """
         ApiClient.post_path(self, '/{0}/lifecycle/activate'.format(id), None)
+        self.__invalidate_cached(id)
 
     def deactivate_app_instance(self, id):
         """Deactivate app by target id
@@ -121,4 +138,9 @@ class AppInstanceClient(ApiClient):
         :type id: str
         :return: None
         """
-        ApiClient.post_path(self, '/{0}/lifecycle/deactivate'.format(id), None)
\ No newline at end of file
+        ApiClient.post_path(self, '/{0}/lifecycle/deactivate'.format(id), None)
+        self.__invalidate_cached(id)
+
+    def __invalidate_cached(self, id):
+        if self.cache is not None:
+            self.cache.invalidate(('app_instance', id))
\ No newline at end of file
@@ -1,5 +1,4 @@
 from okta.framework.ApiClient import ApiClient
-from okta.framework.Utils import Utils
 from okta.models.auth.AuthResult import AuthResult
 
 
@@ -39,7 +38,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/', request, params=params)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def auth_with_factor(self, state_token, factor_id, passcode,
                          relay_state=None, remember_device=None):
@@ -69,7 +68,7 @@ class AuthClient(ApiClient):
 
         response = ApiClient.post_path(self, '/factors/{0}/verify'.format(factor_id),
                                       request, params=params)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     # MFA MANAGEMENT
 
@@ -97,7 +96,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/factors', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def activate_factor(self, state_token, factor_id, passcode, relay_state=None):
         """Activate an MFA factor during the auth flow
@@ -119,7 +118,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/factors/{0}/lifecycle/activate'.format(factor_id), request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def resend_code(self, state_token, factor_id, relay_state=None):
         """Resend an a passcode for an authentication factor
@@ -138,7 +137,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/factors/{0}/lifecycle/resend'.format(factor_id), request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     # CREDENTIAL MANAGEMENT
 
@@ -163,7 +162,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/credentials/change_password', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def reset_password(self, state_token, new_password, relay_state=None):
         """Reset a user's password during an authentication flow
@@ -183,7 +182,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/credentials/reset_password', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def forgot_password(self, username, relay_state=None):
         """Initiate a forgot password flow for a user
@@ -200,7 +199,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/recovery/password', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def forgot_password_answer(self, state_token, security_answer, new_password, relay_state=None):
         """Answer the forgot password during an authentication flow
@@ -223,7 +222,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/recovery/answer', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     # RECOVERY
 
@@ -242,7 +241,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/recovery/token', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def unlock_account(self, username, relay_state=None):
         """Begin unlocking an account
@@ -259,7 +258,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/recovery/unlock', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def unlock_account_answer(self, state_token, security_answer, relay_state=None):
         """Unlock an account during an authentication
@@ -279,7 +278,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/recovery/answer', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     # STATE MANAGEMENT
 
@@ -298,7 +297,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/previous', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def get_status(self, state_token, relay_state=None):
         """Get the status of an in-progress authentication
@@ -315,7 +314,7 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/', request)
-        return Utils.deserialize(response.text, AuthResult)
+        return ApiClient.deserialize(self, response, AuthResult)
 
     def verify_transaction(self, factor_id, transaction_id, user_response):
         """Verify a transaction
@@ -333,4 +332,4 @@ class AuthClient(ApiClient):
         }
 
         response = ApiClient.post_path(self, '/factors/{0}/transactions/{1}/verify'.format(factor_id, transaction_id), request)
-        return Utils.deserialize(response.text, AuthResult)
\ No newline at end of file
+        return ApiClient.deserialize(self, response, AuthResult)
\ No newline at end of file
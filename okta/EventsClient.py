@@ -1,5 +1,5 @@
 from okta.framework.ApiClient import ApiClient
-from okta.framework.Utils import Utils
+from okta.framework.EventFollower import EventFollower
 from okta.models.event.Event import Event
 from okta.framework.PagedResults import PagedResults
 
@@ -9,25 +9,30 @@ class EventsClient(ApiClient):
         kwargs['pathname'] = '/api/v1/events'
         ApiClient.__init__(self, *args, **kwargs)
 
-    def get_events(self, limit=None, start_date=None, filter_string=None):
+    def get_events(self, limit=None, start_date=None, filter_string=None, stream=False):
         """Get a list of Events
 
         :param limit: maximum number of events to return
         :type limit: int or None
         :param filter_string: string to filter events
         :type filter_string: str or None
-        :rtype: list of Event
+        :param stream: whether to read the response as the events are iterated, keeping memory flat
+        :type stream: bool
+        :rtype: list of Event, or generator of Event when streamed
         """
         params = {
             'limit': limit,
             'startDate': start_date,
             'filter': filter_string
         }
-        response = ApiClient.get_path(self, '/', params=params)
+        response = ApiClient.get_path(self, '/', params=params, stream=stream)
 
-        return Utils.deserialize(response.text, Event)
+        if stream:
+            return ApiClient.deserialize_stream(self, response, Event)
+        return ApiClient.deserialize(self, response, Event)
 
-    def get_paged_events(self, limit=None, start_date=None, after=None, filter_string=None, url=None):
+    def get_paged_events(self, limit=None, start_date=None, after=None, filter_string=None, url=None,
+                         stream=False):
         """Get a paged list of Events
 
         :param limit: maximum number of events to return
@@ -38,10 +43,12 @@ class EventsClient(ApiClient):
         :type after: str or None
         :param url: url that returns a list of Event
         :type url: str or None
+        :param stream: whether to leave the page on the connection for PagedResults.iter_result
+        :type stream: bool
         :rtype: PagedResults of Event
         """
         if url:
-            response = ApiClient.get(self, url)
+            response = ApiClient.get(self, url, stream=stream)
 
         else:
             params = {
@@ -50,6 +57,48 @@ class EventsClient(ApiClient):
                 'after': after,
                 'filter': filter_string
             }
-            response = ApiClient.get_path(self, '/', params=params)
+            response = ApiClient.get_path(self, '/', params=params, stream=stream)
 
-        return PagedResults(response, Event)
\ No newline at end of file
+        return PagedResults(response, Event, self.deserialize_options)
+
+    def iter_events(self, limit=None, start_date=None, filter_string=None, after=None, prefetch=0):
+        """Iterate over every Event, fetching pages as they are needed
+
+        :param limit: number of events fetched per page
+        :type limit: int or None
+        :param start_date: earliest publish date of the events
+        :type start_date: str or None
+        :param filter_string: string to filter events
+        :type filter_string: str or None
+        :param after: event id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: generator of Event
+        """
+        return PagedResults.iterate(self.get_paged_events, prefetch,
+                                    limit=limit, start_date=start_date, filter_string=filter_string, after=after)
+
+    def follow(self, start_date=None, filter_string=None, limit=None, min_interval=EventFollower.MIN_INTERVAL,
+               max_interval=EventFollower.MAX_INTERVAL):
+        """Tail the event log, polling for new events until stopped
+
+        Each event is yielded once, including at the boundaries between
+        polls. Polls come every min_interval seconds while events are
+        arriving, and back off to max_interval while none are.
+
+        :param start_date: when the events to follow start, now by default
+        :type start_date: datetime or str or None
+        :param filter_string: string to filter events
+        :type filter_string: str or None
+        :param limit: number of events fetched per page
+        :type limit: int or None
+        :param min_interval: seconds between polls while events are arriving
+        :type min_interval: float
+        :param max_interval: the longest wait between polls, and so how late an event can be yielded
+        :type max_interval: float
+        :return: an iterable of Event that keeps its cursor, and stops once its stop() is called
+        :rtype: EventFollower
+        """
+        return EventFollower(self, start_date=start_date, filter_string=filter_string, limit=limit,
+                             min_interval=min_interval, max_interval=max_interval)
@@ -1,5 +1,4 @@
 from okta.framework.ApiClient import ApiClient
-from okta.framework.Utils import Utils
 from okta.models.factor.OrgAuthFactor import OrgAuthFactor
 
 
@@ -19,7 +18,7 @@ class FactorsAdminClient(ApiClient):
             'filter': filter_string
         }
         response = ApiClient.get_path(self, '/factors', params=params)
-        return Utils.deserialize(response.text, OrgAuthFactor)
+        return ApiClient.deserialize(self, response, OrgAuthFactor)
 
     def activate_org_factor(self, org_factor_id, org_auth_factor=None):
         """Activate OrgAuthFactor
@@ -31,7 +30,7 @@ class FactorsAdminClient(ApiClient):
         :rtype: OrgAuthFactor
         """
         response = ApiClient.post_path(self, '/factors/{0}/lifecycle/activate'.format(org_factor_id), org_auth_factor)
-        return Utils.deserialize(response.text, OrgAuthFactor)
+        return ApiClient.deserialize(self, response, OrgAuthFactor)
 
     def deactivate_org_factor(self, org_factor_id):
         """Deactivate OrgAuthFactor
@@ -41,4 +40,4 @@ class FactorsAdminClient(ApiClient):
         :rtype: OrgAuthFactor
         """
         response = ApiClient.post_path(self, '/factors/{0}/lifecycle/deactivate'.format(org_factor_id))
-        return Utils.deserialize(response.text, OrgAuthFactor)
\ No newline at end of file
+        return ApiClient.deserialize(self, response, OrgAuthFactor)
\ No newline at end of file
@@ -1,5 +1,4 @@
 from okta.framework.ApiClient import ApiClient
-from okta.framework.Utils import Utils
 from okta.models.factor.FactorCatalogEntry import FactorCatalogEntry
 from okta.models.factor.Factor import Factor
 from okta.models.factor.Question import Question
@@ -23,7 +22,7 @@ class FactorsClient(ApiClient):
         """
         response = ApiClient.get_path(
             self, '/{0}/factors/catalog'.format(user_id))
-        return Utils.deserialize(response.text, FactorCatalogEntry)
+        return ApiClient.deserialize(self, response, FactorCatalogEntry)
 
     def get_lifecycle_factors(self, user_id):
         """Get enrolled factors for a user
@@ -33,7 +32,7 @@ class FactorsClient(ApiClient):
         :rtype: list of Factor
         """
         response = ApiClient.get_path(self, '/{0}/factors'.format(user_id))
-        return Utils.deserialize(response.text, Factor)
+        return ApiClient.deserialize(self, response, Factor)
 
     # FACTOR CRUD
 
@@ -46,7 +45,7 @@ class FactorsClient(ApiClient):
         """
         response = ApiClient.get_path(
             self, '/{0}/factors/questions'.format(user_id))
-        return Utils.deserialize(response.text, Question)
+        return ApiClient.deserialize(self, response, Question)
 
     def enroll_factor(self, user_id, factor_enroll_request, update_phone=False, activate=False):
         """Enroll a user into a factor
@@ -67,7 +66,7 @@ class FactorsClient(ApiClient):
         }
         response = ApiClient.post_path(
             self, '/{0}/factors'.format(user_id), factor_enroll_request, params=params)
-        return Utils.deserialize(response.text, Factor)
+        return ApiClient.deserialize(self, response, Factor)
 
     def push_activation_poll(self, url):
         """Poll for push enrollment activation
@@ -77,7 +76,7 @@ class FactorsClient(ApiClient):
         :rtype: ActivationResponse
         """
         response = ApiClient.post(self, url)
-        return Utils.deserialize(response.text, ActivationResponse)
+        return ApiClient.deserialize(self, response, ActivationResponse)
 
     def get_factor(self, user_id, user_factor_id):
         """Get information about an enrolled factor
@@ -90,7 +89,7 @@ class FactorsClient(ApiClient):
         """
         response = ApiClient.get_path(
             self, '/{0}/factors/{1}'.format(user_id, user_factor_id))
-        return Utils.deserialize(response.text, Factor)
+        return ApiClient.deserialize(self, response, Factor)
 
     def update_factor(self, user_id, user_factor_id, factor_enroll_request):
         """Update an enrolled factor
@@ -105,7 +104,7 @@ class FactorsClient(ApiClient):
         """
         response = ApiClient.put_path(
             self, '/{0}/factors/{1}'.format(user_id, user_factor_id), factor_enroll_request)
-        return Utils.deserialize(response.text, Factor)
+        return ApiClient.deserialize(self, response, Factor)
 
     def reset_factor(self, user_id, user_factor_id):
         """Reset an enrolled factor
@@ -137,7 +136,7 @@ class FactorsClient(ApiClient):
         }
         response = ApiClient.post_path(
             self, '/{0}/factors/{1}/lifecycle/activate'.format(user_id, user_factor_id), request)
-        return Utils.deserialize(response.text, Factor)
+        return ApiClient.deserialize(self, response, Factor)
 
     def resend_code(self, user_id, user_factor_id):
         """Resend code for a factor
@@ -150,7 +149,7 @@ class FactorsClient(ApiClient):
         """
         response = ApiClient.post_path(
             self, '/{0}/factors/{1}/resend'.format(user_id, user_factor_id))
-        return Utils.deserialize(response.text, Factor)
+        return ApiClient.deserialize(self, response, Factor)
 
     def verify_factor(self, user_id, user_factor_id, activation_token=None, answer=None, passcode=None):
         """Verify an enrolled factor
@@ -179,7 +178,7 @@ class FactorsClient(ApiClient):
 
         response = ApiClient.post_path(
             self, '/{0}/factors/{1}/verify'.format(user_id, user_factor_id), request)
-        return Utils.deserialize(response.text, FactorVerificationResponse)
+        return ApiClient.deserialize(self, response, FactorVerificationResponse)
 
     def push_verification_poll(self, url):
         """Poll for push verification
@@ -189,7 +188,7 @@ class FactorsClient(ApiClient):
         :rtype: ActivationResponse
         """
         response = ApiClient.get(self, url)
-        return Utils.deserialize(response.text, FactorVerificationResponse)
+        return ApiClient.deserialize(self, response, FactorVerificationResponse)
 
     # FACTOR DEVICE CRUD
 
@@ -204,7 +203,7 @@ class FactorsClient(ApiClient):
         """
         response = ApiClient.post_path(
             self, '/{0}/devices'.format(user_id), factor_enroll_request)
-        return Utils.deserialize(response.text, FactorDevice)
+        return ApiClient.deserialize(self, response, FactorDevice)
 
     def get_factor_device(self, user_id, user_factor_id, device_id):
         """Get a factor device for a user
@@ -219,7 +218,7 @@ class FactorsClient(ApiClient):
         """
         response = ApiClient.get_path(
             self, '/{0}/factors/{1}/device/{2}'.format(user_id, user_factor_id, device_id))
-        return Utils.deserialize(response.text, FactorDevice)
+        return ApiClient.deserialize(self, response, FactorDevice)
 
     def update_factor_device(self, user_id, factor_device_request):
         """Update a factor device for a user
@@ -232,7 +231,7 @@ class FactorsClient(ApiClient):
         """
         response = ApiClient.post_path(
             self, '/{0}/factors'.format(user_id), factor_device_request)
-        return Utils.deserialize(response.text, FactorDevice)
+        return ApiClient.deserialize(self, response, FactorDevice)
 
     # FACTOR DEVICE LIFECYCLE
 
@@ -254,4 +253,4 @@ class FactorsClient(ApiClient):
         }
         response = ApiClient.post_path(self, '/{0}/factors/{1}/devices/{2}/lifecycle/activate'.format(
             user_id, user_factor_id, device_id), request)
-        return Utils.deserialize(response.text, Factor)
+        return ApiClient.deserialize(self, response, Factor)
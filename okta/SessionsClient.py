@@ -1,5 +1,4 @@
 from okta.framework.ApiClient import ApiClient
-from okta.framework.Utils import Utils
 from okta.models.session.Credentials import Credentials
 from okta.models.session.Session import Session
 
@@ -27,7 +26,7 @@ class SessionsClient(ApiClient):
         creds.password = password
         params = {'additionalFields': additional_fields}
         response = ApiClient.post_path(self, '/', creds, params=params)
-        return Utils.deserialize(response.text, Session)
+        return ApiClient.deserialize(self, response, Session)
 
     def create_session_with_cookie_token(self, username, password):
         """Create a session that contains a cookie token
@@ -63,7 +62,7 @@ class SessionsClient(ApiClient):
         data = {'sessionToken': session_token}
         params = {'additionalFields': additional_fields}
         response = ApiClient.post_path(self, '/', data, params=params)
-        return Utils.deserialize(response.text, Session)
+        return ApiClient.deserialize(self, response, Session)
 
     def validate_session(self, id):
         """Validate a session
@@ -72,7 +71,7 @@ class SessionsClient(ApiClient):
         :rtype: Session
         """
         response = ApiClient.get_path(self, '/{0}'.format(id))
-        return Utils.deserialize(response.text, Session)
+        return ApiClient.deserialize(self, response, Session)
 
     def extend_session(self, id):
         """Extend a session's lifespan
@@ -81,7 +80,7 @@ class SessionsClient(ApiClient):
         :rtype: Session
         """
         response = ApiClient.put_path(self, '/{0}'.format(id), None)
-        return Utils.deserialize(response.text, Session)
+        return ApiClient.deserialize(self, response, Session)
 
     def clear_session(self, id):
         """Terminate a session
@@ -1,8 +1,13 @@
+import functools
+
 from okta.framework.ApiClient import ApiClient
-from okta.framework.Utils import Utils
+from okta.framework.BulkExecutor import BulkExecutor
+from okta.framework.ConcurrentPager import ConcurrentPager
+from okta.framework.GroupReconciler import GroupReconciler
 from okta.models.user.User import User
 from okta.models.usergroup.UserGroup import UserGroup
 from okta.framework.PagedResults import PagedResults
+from okta.UsersClient import UsersClient
 
 
 class UserGroupsClient(ApiClient):
@@ -26,7 +31,7 @@ class UserGroupsClient(ApiClient):
             'q': query
         }
         response = ApiClient.get_path(self, '/', params=params)
-        return Utils.deserialize(response.text, UserGroup)
+        return ApiClient.deserialize(self, response, UserGroup)
 
     def get_paged_groups(self, limit=None, after=None, url=None):
         """Get a paged list of UserGroups
@@ -49,7 +54,20 @@ class UserGroupsClient(ApiClient):
             }
             response = ApiClient.get_path(self, '/', params=params)
 
-        return PagedResults(response, UserGroup)
+        return PagedResults(response, UserGroup, self.deserialize_options)
+
+    def iter_groups(self, limit=None, after=None, prefetch=0):
+        """Iterate over every UserGroup, fetching pages as they are needed
+
+        :param limit: number of groups fetched per page
+        :type limit: int or None
+        :param after: group id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: generator of UserGroup
+        """
+        return PagedResults.iterate(self.get_paged_groups, prefetch, limit=limit, after=after)
 
     def get_group(self, gid):
         """Get a single group
@@ -58,18 +76,87 @@ class UserGroupsClient(ApiClient):
         :type gid: str
         :rtype: UserGroup
         """
-        response = ApiClient.get_path(self, '/{0}'.format(gid))
-        return Utils.deserialize(response.text, UserGroup)
+        return ApiClient.get_cached(self, '/{0}'.format(gid), UserGroup, ('group', gid))
 
-    def get_group_users(self, gid):
-        """Get the users of a group
+    def get_group_users(self, gid, stream=False, limit=None):
+        """Get the first page of the users of a group
+
+        Only one page is returned, so use iter_group_users for groups that
+        may have more members than fit on a page.
 
         :param gid: the group id
         :type gid: str
-        :rtype: User
+        :param stream: whether to read the response as the users are iterated, keeping memory flat
+        :type stream: bool
+        :param limit: maximum number of users to return
+        :type limit: int or None
+        :rtype: list of User, or generator of User when streamed
         """
-        response = ApiClient.get_path(self, '/{0}/users'.format(gid))
-        return Utils.deserialize(response.text, User)
+        params = {
+            'limit': limit
+        }
+        response = ApiClient.get_path(self, '/{0}/users'.format(gid), params=params, stream=stream)
+        if stream:
+            return ApiClient.deserialize_stream(self, response, User)
+        return ApiClient.deserialize(self, response, User)
+
+    def get_paged_group_users(self, gid=None, limit=None, after=None, url=None, stream=False):
+        """Get a paged list of the users of a group
+
+        :param gid: the group id
+        :type gid: str or None
+        :param limit: maximum number of users to return
+        :type limit: int or None
+        :param after: user id that listing will resume after
+        :type after: str or None
+        :param url: url that returns a list of User
+        :type url: str or None
+        :param stream: whether to leave the page on the connection for PagedResults.iter_result
+        :type stream: bool
+        :rtype: PagedResults of User
+        """
+        if url:
+            response = ApiClient.get(self, url, stream=stream)
+        else:
+            params = {
+                'limit': limit,
+                'after': after
+            }
+            response = ApiClient.get_path(self, '/{0}/users'.format(gid), params=params, stream=stream)
+        return PagedResults(response, User, self.deserialize_options)
+
+    def iter_group_users(self, gid, limit=None, after=None, prefetch=0):
+        """Iterate over every user of a group, fetching pages as they are needed
+
+        :param gid: the group id
+        :type gid: str
+        :param limit: number of users fetched per page
+        :type limit: int or None
+        :param after: user id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: generator of User
+        """
+        return PagedResults.iterate(functools.partial(self.get_paged_group_users, gid), prefetch,
+                                    limit=limit, after=after)
+
+    def iter_members_of_groups(self, gids, limit=None, workers=ConcurrentPager.DEFAULT_WORKERS):
+        """Iterate over the users of many groups, paging through several groups at once
+
+        Users come a page at a time, in the order the pages arrive, so the
+        members of different groups are interleaved.
+
+        :param gids: the group ids
+        :type gids: iterable of str
+        :param limit: number of users fetched per page
+        :type limit: int or None
+        :param workers: number of groups paged through at once
+        :type workers: int
+        :rtype: generator of (str, User), the group id and one of its users
+        """
+        listings = ((gid, {'gid': gid, 'limit': limit}) for gid in gids)
+        return PagedResults.iterate_many(self.get_paged_group_users, listings, workers)
 
     def update_group(self, group):
         """Update a group
@@ -90,7 +177,11 @@ class UserGroupsClient(ApiClient):
         :rtype: UserGroup
         """
         response = ApiClient.put_path(self, '/{0}'.format(gid), group)
-        return Utils.deserialize(response.text, UserGroup)
+        if self.cache is not None:
+            # Every cached list of a user's groups may hold this group
+            self.cache.invalidate(('group', gid))
+            self.cache.invalidate_where(lambda key: key[0] == 'user_groups')
+        return ApiClient.deserialize(self, response, UserGroup)
 
     def create_group(self, group):
         """Create a group
@@ -100,7 +191,7 @@ class UserGroupsClient(ApiClient):
         :rtype: UserGroup
         """
         response = ApiClient.post_path(self, '/', group)
-        return Utils.deserialize(response.text, UserGroup)
+        return ApiClient.deserialize(self, response, UserGroup)
 
     def delete_group(self, gid):
         """Delete group by target id
@@ -110,7 +201,11 @@ class UserGroupsClient(ApiClient):
         :return: None
         """
         response = ApiClient.delete_path(self, '/{0}'.format(gid))
-        return Utils.deserialize(response.text, UserGroup)
+        if self.cache is not None:
+            # Every cached list of a user's groups may hold this group
+            self.cache.invalidate(('group', gid))
+            self.cache.invalidate_where(lambda key: key[0] == 'user_groups')
+        return ApiClient.deserialize(self, response, UserGroup)
 
     def add_user_to_group(self, group, user):
         """Add a user to a group
@@ -133,7 +228,8 @@ class UserGroupsClient(ApiClient):
         :return: None
         """
         response = ApiClient.put_path(self, '/{0}/users/{1}'.format(gid, uid))
-        return Utils.deserialize(response.text, UserGroup)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, UserGroup)
 
     def remove_user_from_group(self, group, user):
         """Remove a user from a group
@@ -156,4 +252,34 @@ class UserGroupsClient(ApiClient):
         :return: None
         """
         response = ApiClient.delete_path(self, '/{0}/users/{1}'.format(gid, uid))
-        return Utils.deserialize(response.text, UserGroup)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, UserGroup)
+
+    def reconcile_group_members(self, desired, dry_run=False, workers=BulkExecutor.DEFAULT_WORKERS, checkpoint=None,
+                                retry_policy=None, limit=None):
+        """Add and remove group members so that each group has exactly the users it should
+
+        Each group's current members are compared with the desired ones, and
+        only the differences are changed, concurrently and paced by the
+        client's RateLimiter. Groups not given are left alone.
+
+        The checkpoint only resumes an interrupted run, and is removed once a
+        run has tried every change.
+
+        :param desired: the ids of the users each group should have, by group id
+        :type desired: dict of str to iterable of str
+        :param dry_run: whether to only work out and report the changes
+        :type dry_run: bool
+        :param workers: number of groups listed, and of changes made, at once
+        :type workers: int
+        :param checkpoint: path of a file to record changes in, and to resume an interrupted run from
+        :type checkpoint: str or None
+        :param retry_policy: how failed changes are retried, RetryPolicy() by default
+        :type retry_policy: RetryPolicy or None
+        :param limit: number of members fetched per page
+        :type limit: int or None
+        :return: the additions and removals by group, and the outcome of each change made
+        :rtype: ReconcileResult
+        """
+        reconciler = GroupReconciler(self, workers, checkpoint, retry_policy)
+        return reconciler.run(desired, dry_run=dry_run, limit=limit)
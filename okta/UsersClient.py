@@ -1,6 +1,11 @@
+import re
+
 from okta.framework.ApiClient import ApiClient
-from okta.framework.Utils import Utils
+from okta.framework.BulkExecutor import BulkExecutor
+from okta.framework.Cache import Cache
+from okta.framework.ChangeTracker import ChangeTracker
 from okta.framework.PagedResults import PagedResults
+from okta.framework.RetryPolicy import RetryPolicy
 from okta.models.user.ActivationResponse import ActivationResponse
 from okta.models.user.AppLinks import AppLinks
 from okta.models.user.User import User
@@ -11,6 +16,30 @@ from okta.models.usergroup.UserGroup import UserGroup
 
 
 class UsersClient(ApiClient):
+
+    # The lifecycle actions bulk_lifecycle can run, and the methods that run them
+    LIFECYCLE_ACTIONS = {
+        'activate': 'activate_user',
+        'deactivate': 'deactivate_user',
+        'suspend': 'suspend_user',
+        'unsuspend': 'unsuspend_user',
+        'unlock': 'unlock_user',
+        'reset_password': 'reset_password',
+        'expire_password': 'expire_password',
+        'reset_factors': 'reset_factors',
+        'delete': 'delete_user'
+    }
+
+    # Lifecycle actions that do more when repeated: deleting a user deactivates them, and deleting them again
+    # removes them for good
+    UNREPEATABLE_ACTIONS = frozenset(['delete'])
+
+    # The form of Okta's user ids, which tells them apart from logins
+    USER_ID = re.compile(r'^00u[0-9A-Za-z]{17}$')
+
+    # Lifecycle actions that email the user unless run with send_email=False, so a repeat can send a second email
+    EMAILING_ACTIONS = frozenset(['activate', 'reset_password'])
+
     def __init__(self, *args, **kwargs):
         kwargs['pathname'] = '/api/v1/users'
         ApiClient.__init__(self, *args, **kwargs)
@@ -21,7 +50,7 @@ class UsersClient(ApiClient):
 
     # CRUD
 
-    def get_users(self, limit=None, query=None, filter_string=None):
+    def get_users(self, limit=None, query=None, filter_string=None, stream=False):
         """Get a list of Users
 
         :param limit: maximum number of users to return
@@ -30,15 +59,19 @@ class UsersClient(ApiClient):
         :type query: str or None
         :param filter_string: string to filter users
         :type filter_string: str or None
-        :rtype: list of User
+        :param stream: whether to read the response as the users are iterated, keeping memory flat
+        :type stream: bool
+        :rtype: list of User, or generator of User when streamed
         """
         params = {
             'limit': limit,
             'q': query,
             'filter': filter_string
         }
-        response = ApiClient.get_path(self, '/', params=params)
-        return Utils.deserialize(response.text, self.user_class)
+        response = ApiClient.get_path(self, '/', params=params, stream=stream)
+        if stream:
+            return ApiClient.deserialize_stream(self, response, self.user_class)
+        return ApiClient.deserialize(self, response, self.user_class)
 
     def get_user(self, uid):
         """Get a single user
@@ -47,8 +80,17 @@ class UsersClient(ApiClient):
         :type uid: str
         :rtype: User
         """
-        response = ApiClient.get_path(self, '/{0}'.format(uid))
-        return Utils.deserialize(response.text, self.user_class)
+        def aliases(user):
+            # Cached under the id and the login too, as either can be looked up
+            profile = getattr(user, 'profile', None)
+            return [('user', UsersClient.cache_key(key)) for key in (user.id, getattr(profile, 'login', None)) if key]
+
+        key = ('user', UsersClient.cache_key(uid))
+        user = ApiClient.get_cached(self, '/{0}'.format(uid), self.user_class, key, aliases)
+        if self.cache is not None:
+            # So a write naming either one invalidates what is cached under the other
+            self.cache.link(key, *aliases(user))
+        return user
 
     def get_user_applinks(self, uid):
         """Get applinks of a single user
@@ -58,7 +100,7 @@ class UsersClient(ApiClient):
         :rtype: AppLinks
         """
         response = ApiClient.get_path(self, '/{0}/appLinks'.format(uid))
-        return Utils.deserialize(response.text, AppLinks)
+        return ApiClient.deserialize(self, response, AppLinks)
 
     def get_user_groups(self, uid):
         """Get groups of a single user
@@ -67,8 +109,12 @@ class UsersClient(ApiClient):
         :type uid: str
         :rtype: Groups
         """
-        response = ApiClient.get_path(self, '/{0}/groups'.format(uid))
-        return Utils.deserialize(response.text, UserGroup)
+        user_id = UsersClient.__cached_user_id(self.cache, uid)
+        if user_id is None:
+            # Cached only under the id, which a login is tied to once the user is looked up
+            response = ApiClient.get_path(self, '/{0}/groups'.format(uid))
+            return ApiClient.deserialize(self, response, UserGroup)
+        return ApiClient.get_cached(self, '/{0}/groups'.format(uid), UserGroup, ('user_groups', user_id))
 
     def update_user(self, user, partial=True):
         """Update a user
@@ -82,6 +128,11 @@ class UsersClient(ApiClient):
     def update_user_by_id(self, uid, user, partial=True):
         """Update a user, defined by an id
 
+        A partial update of a user fetched by a client created with
+        track_changes=True sends only the fields changed since it was fetched,
+        as found by the ChangeTracker, and makes no request if none were; any
+        other user is sent whole.
+
         :param uid: the target user id
         :type uid: str
         :param user: the data to update the target user
@@ -91,10 +142,16 @@ class UsersClient(ApiClient):
         :rtype: User
         """
         if partial:
-            response = ApiClient.post_path(self, '/{0}'.format(uid), user)
+            changes = ChangeTracker.changes(user)
+            if changes == {}:
+                # An empty body would be rejected, and there is nothing to update
+                return user
+            data = user if changes is None else changes
+            response = ApiClient.post_path(self, '/{0}'.format(uid), data)
         else:
             response = ApiClient.put_path(self, '/{0}'.format(uid), user)
-        return Utils.deserialize(response.text, self.user_class)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, self.user_class)
 
     def create_user(self, user, activate=None):
         """Create a user
@@ -112,19 +169,89 @@ class UsersClient(ApiClient):
                 'activate': activate
             }
             response = ApiClient.post_path(self, '/', user, params=params)
-        return Utils.deserialize(response.text, self.user_class)
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    def bulk_create_users(self, users, activate=None, workers=BulkExecutor.DEFAULT_WORKERS, checkpoint=None):
+        """Create many users concurrently, collecting each one's outcome instead of raising
+
+        Requests are paced by the client's RateLimiter, or by one made for the
+        run if it has none, so the workers stay within the org's rate limits.
+
+        :param users: the users to create, e.g. from UserRecords.from_csv or UserRecords.from_ndjson
+        :type users: iterable of User
+        :param activate: whether to activate the users
+        :type activate: bool
+        :param workers: number of users created at once
+        :type workers: int
+        :param checkpoint: path of a file to record outcomes in, and to resume an interrupted run from
+        :type checkpoint: str or None
+        :return: the created users, and the failures with their OktaErrors, keyed by login
+        :rtype: BulkResult
+        """
+        client = self.paced()
+        executor = BulkExecutor(workers, checkpoint)
+        return executor.run(users, lambda user: client.create_user(user, activate=activate),
+                            key=lambda user: user.profile.login)
+
+    def bulk_lifecycle(self, uids, action, workers=BulkExecutor.DEFAULT_WORKERS, checkpoint=None,
+                       retry_policy=None, **options):
+        """Run a lifecycle action on many users concurrently, collecting each one's outcome instead of raising
+
+        Requests are paced by the client's RateLimiter, or by one made for the
+        run if it has none. Its pool_maxsize should be at least workers, or
+        the extra workers open a new connection per request. Most lifecycle
+        actions are safe to repeat, so a user whose request failed with a
+        server or connection error is retried too, which a single call to the
+        action doesn't do. The UNREPEATABLE_ACTIONS, like 'delete', are never
+        retried after such an error, since the server may already have
+        applied them, and neither are the EMAILING_ACTIONS unless they are
+        run with send_email=False, so users aren't sent the same email twice.
+
+        Outcomes are keyed by the action and user id, like 'deactivate 00u1',
+        so one checkpoint file can be used for runs of different actions.
+
+        :param uids: the target user ids
+        :type uids: iterable of str
+        :param action: one of LIFECYCLE_ACTIONS, e.g. 'deactivate'
+        :type action: str
+        :param workers: number of users handled at once
+        :type workers: int
+        :param checkpoint: path of a file to record outcomes in, and to resume an interrupted run from
+        :type checkpoint: str or None
+        :param retry_policy: how failed users are retried, RetryPolicy() by default; ignored for actions never retried
+        :type retry_policy: RetryPolicy or None
+        :param options: passed on to the action, e.g. send_email=False for 'reset_password'
+        :return: the results and failures keyed like 'deactivate 00u1', with throughput and latency stats
+        :rtype: BulkResult
+        """
+        if action not in UsersClient.LIFECYCLE_ACTIONS:
+            raise ValueError('action must be one of {0}'.format(', '.join(sorted(UsersClient.LIFECYCLE_ACTIONS))))
+        run_action = getattr(self.paced(), UsersClient.LIFECYCLE_ACTIONS[action])
+
+        if action in UsersClient.UNREPEATABLE_ACTIONS or \
+                (action in UsersClient.EMAILING_ACTIONS and options.get('send_email', True)):
+            retry_policy = None
+        else:
+            retry_policy = retry_policy or RetryPolicy()
+        executor = BulkExecutor(workers, checkpoint, retry_policy)
+        return executor.run(uids, lambda uid: run_action(uid, **options), key=lambda uid: action + ' ' + uid)
 
     def delete_user(self, uid):
         """Delete user by target id
 
+        The first delete of a user deactivates them, and a second removes them
+        for good, so a delete that failed with a server or connection error is
+        not retried: the server may have applied it.
+
         :param uid: the target user id
         :type uid: str
         :return: None
         """
-        response = ApiClient.delete_path(self, '/{0}'.format(uid))
-        return Utils.deserialize(response.text, self.user_class)
+        response = ApiClient.delete_path(self, '/{0}'.format(uid), idempotent=False)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, self.user_class)
 
-    def get_paged_users(self, limit=None, filter_string=None, after=None, url=None):
+    def get_paged_users(self, limit=None, filter_string=None, after=None, url=None, stream=False):
         """Get a paged list of Users
 
         :param limit: maximum number of users to return
@@ -135,18 +262,36 @@ class UsersClient(ApiClient):
         :type after: str
         :param url: url that returns a list of User
         :type url: str
+        :param stream: whether to leave the page on the connection for PagedResults.iter_result
+        :type stream: bool
         :rtype: PagedResults of User
         """
         if url:
-            response = ApiClient.get(self, url)
+            response = ApiClient.get(self, url, stream=stream)
         else:
             params = {
                 'limit': limit,
                 'after': after,
                 'filter': filter_string
             }
-            response = ApiClient.get_path(self, '/', params=params)
-        return PagedResults(response, self.user_class)
+            response = ApiClient.get_path(self, '/', params=params, stream=stream)
+        return PagedResults(response, self.user_class, self.deserialize_options)
+
+    def iter_users(self, limit=None, filter_string=None, after=None, prefetch=0):
+        """Iterate over every User, fetching pages as they are needed
+
+        :param limit: number of users fetched per page
+        :type limit: int or None
+        :param filter_string: string to filter users
+        :type filter_string: str or None
+        :param after: user id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: generator of User
+        """
+        return PagedResults.iterate(self.get_paged_users, prefetch,
+                                    limit=limit, filter_string=filter_string, after=after)
 
     # LIFECYCLE
     
@@ -161,7 +306,8 @@ class UsersClient(ApiClient):
             'sendEmail': send_email
         }
         response = ApiClient.post_path(self, '/{0}/lifecycle/activate'.format(uid), params=params)
-        return Utils.deserialize(response.text, ActivationResponse)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, ActivationResponse)
 
     def deactivate_user(self, uid):
         """Deactivate user by target id
@@ -171,7 +317,8 @@ class UsersClient(ApiClient):
         :return: User
         """
         response = ApiClient.post_path(self, '/{0}/lifecycle/deactivate'.format(uid))
-        return Utils.deserialize(response.text, self.user_class)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, self.user_class)
 
     def suspend_user(self, uid):
         """Suspend user by target id
@@ -181,7 +328,8 @@ class UsersClient(ApiClient):
         :return: User
         """
         response = ApiClient.post_path(self, '/{0}/lifecycle/suspend'.format(uid))
-        return Utils.deserialize(response.text, self.user_class)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, self.user_class)
 
     def unsuspend_user(self, uid):
         """Unsuspend user by target id
@@ -191,7 +339,8 @@ class UsersClient(ApiClient):
         :return: User
         """
         response = ApiClient.post_path(self, '/{0}/lifecycle/unsuspend'.format(uid))
-        return Utils.deserialize(response.text, self.user_class)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, self.user_class)
 
     def unlock_user(self, uid):
         """Unlock user by target id
@@ -201,7 +350,8 @@ class UsersClient(ApiClient):
         :return: User
         """
         response = ApiClient.post_path(self, '/{0}/lifecycle/unlock'.format(uid))
-        return Utils.deserialize(response.text, self.user_class)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, self.user_class)
 
     def reset_password(self, uid, send_email=True):
         """Reset user's password by target user id
@@ -216,7 +366,8 @@ class UsersClient(ApiClient):
             'sendEmail': send_email
         }
         response = ApiClient.post_path(self, '/{0}/lifecycle/reset_password'.format(uid), params=params)
-        return Utils.deserialize(response.text, ResetPasswordToken)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, ResetPasswordToken)
 
     def change_password(self, uid, old_password, new_password):
         """Change user's password by target user id
@@ -238,7 +389,8 @@ class UsersClient(ApiClient):
             }
         }
         response = ApiClient.post_path(self, '/{0}/credentials/change_password'.format(uid), data)
-        return Utils.deserialize(response.text, LoginCredentials)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, LoginCredentials)
 
     def change_recovery_question(self, uid, password, question, answer):
         """Changes a user's recovery question & answer by validating the user's current password
@@ -260,7 +412,8 @@ class UsersClient(ApiClient):
             }
         }
         response = ApiClient.post_path(self, '/{0}/credentials/change_recovery_question'.format(uid), data)
-        return Utils.deserialize(response.text, LoginCredentials)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, LoginCredentials)
 
     def expire_password(self, uid, temp_password=False):
         """Expire user's password by target user id
@@ -278,7 +431,8 @@ class UsersClient(ApiClient):
                 'tempPassword': temp_password
             }
             response = ApiClient.post_path(self, '/{0}/lifecycle/expire_password'.format(uid), params=params)
-        return Utils.deserialize(response.text, TempPassword)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, TempPassword)
 
     def reset_factors(self, uid):
         """Reset all user factors by target id
@@ -288,4 +442,51 @@ class UsersClient(ApiClient):
         :return: None
         """
         response = ApiClient.post_path(self, '/{0}/lifecycle/reset_factors'.format(uid))
-        return Utils.deserialize(response.text, self.user_class)
+        UsersClient.invalidate_cached_user(self.cache, uid)
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    # CACHE
+
+    @staticmethod
+    def invalidate_cached_user(cache, uid):
+        """Drop the cached lookups of a user, under its id and its login
+
+        :param cache: the cache, or None
+        :type cache: Cache or None
+        :param uid: the user id or login
+        :type uid: str
+        """
+        if cache is None:
+            return
+
+        keys = [key for kind, key in cache.linked(('user', UsersClient.cache_key(uid)))]
+        if UsersClient.__cached_user_id(cache, uid) is None:
+            # A login that was never looked up, whose groups may be cached under an id it can't be tied to
+            cache.invalidate_where(lambda key: key[0] == 'user_groups')
+        cache.invalidate(*[(kind, key) for kind in ('user', 'user_groups') for key in keys])
+
+    @staticmethod
+    def cache_key(uid):
+        """Get the key a user's lookups are cached under
+
+        Okta ids are case-sensitive, but logins are matched ignoring case, so
+        a login is folded to lower case, and looked up in any case finds the
+        same entry.
+
+        :param uid: the user id or login
+        :type uid: str
+        :rtype: str
+        """
+        return uid if UsersClient.USER_ID.match(uid) else uid.lower()
+
+    @staticmethod
+    def __cached_user_id(cache, uid):
+        # The id itself, or the id a login was linked with when the user was looked up
+        if UsersClient.USER_ID.match(uid):
+            return uid
+        if cache is None:
+            return None
+        for kind, key in cache.linked(('user', UsersClient.cache_key(uid))):
+            if UsersClient.USER_ID.match(key):
+                return key
+        return None
@@ -0,0 +1,262 @@
+import asyncio
+import time
+from okta.framework.BaseApiClient import BaseApiClient
+from okta.framework.JsonCodec import JsonCodec
+from okta.framework.OktaError import OktaError
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class Response(object):
+    """The parts of an HTTP response the clients read, with the body already downloaded"""
+
+    def __init__(self, status_code, text, headers, links, content=None, encoding='utf-8'):
+        self.status_code = status_code
+        self.headers = headers
+        self.links = links
+        self.content = content
+        self.__text = text
+        self.__encoding = encoding
+
+    @property
+    def text(self):
+        # Only decoded when asked for, as the JSON codec reads the bytes
+        if self.__text is None and self.content is not None:
+            self.__text = self.content.decode(self.__encoding)
+        return self.__text
+
+
+class ApiClient(BaseApiClient):
+
+    DEFAULT_LIMIT = 100
+    DEFAULT_LIMIT_PER_HOST = 0
+    DEFAULT_KEEPALIVE_TIMEOUT = 15
+
+    CONNECTION_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError) if aiohttp else (asyncio.TimeoutError,)
+
+    def __init__(self, *args, **kwargs):
+        BaseApiClient.__init__(self, *args, **kwargs)
+
+        # A session handed in is shared with other clients and is left open by close()
+        self.session = kwargs.get('session')
+        self.__owns_session = self.session is None
+        self.__limit = kwargs.get('limit') or ApiClient.DEFAULT_LIMIT
+        self.__limit_per_host = kwargs.get('limit_per_host') or ApiClient.DEFAULT_LIMIT_PER_HOST
+        self.__keepalive_timeout = kwargs.get('keepalive_timeout') or ApiClient.DEFAULT_KEEPALIVE_TIMEOUT
+
+    @staticmethod
+    def create_pooled_session(limit=DEFAULT_LIMIT, limit_per_host=DEFAULT_LIMIT_PER_HOST,
+                              keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT):
+        """Create an aiohttp session backed by a pool of keep-alive connections
+
+        Must be called from inside a running event loop.
+
+        :param limit: maximum number of simultaneous connections
+        :type limit: int
+        :param limit_per_host: maximum number of simultaneous connections to one host, 0 for no limit
+        :type limit_per_host: int
+        :param keepalive_timeout: seconds an idle connection is kept open
+        :type keepalive_timeout: float
+        :rtype: aiohttp.ClientSession
+        """
+        if aiohttp is None:
+            raise ImportError('aiohttp is required for the okta.aio clients: pip install aiohttp')
+
+        connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host,
+                                         keepalive_timeout=keepalive_timeout)
+        # Like the sync client's pooled sessions, it may be shared between orgs and users, so it keeps no cookies
+        return aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+
+    async def close(self):
+        """Close the client's session, unless it was shared in by the caller"""
+        if self.session is not None and self.__owns_session:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get(self, url, params=None):
+        return await self.__request('GET', url, params=params)
+
+    async def put(self, url, data=None, params=None):
+        if data:
+            data = self.json_codec.dumps(data)
+        return await self.__request('PUT', url, data, params)
+
+    async def post(self, url, data=None, params=None):
+        if data:
+            data = self.json_codec.dumps(data)
+        return await self.__request('POST', url, data, params)
+
+    async def delete(self, url, params=None, idempotent=None):
+        return await self.__request('DELETE', url, params=params, idempotent=idempotent)
+
+    @staticmethod
+    async def iterate(get_page, prefetch=0, **params):
+        """Yield every record of a paged listing, fetching each page only once the previous one is used up
+
+        The asyncio counterpart of PagedResults.iterate; with prefetch, the
+        next pages are fetched by a separate task.
+
+        :param get_page: a client's get_paged_* method
+        :type get_page: coroutine function
+        :param prefetch: number of pages fetched ahead, 0 to fetch each page when it is needed
+        :type prefetch: int
+        :param params: the arguments of the first get_page call; the next pages are fetched by url
+        :rtype: async generator
+        """
+        if not prefetch:
+            page = await get_page(**params)
+            while True:
+                for record in page.result:
+                    yield record
+                if page.is_last_page():
+                    return
+                page = await get_page(url=page.next_url)
+
+        pages = asyncio.Queue(maxsize=prefetch)
+
+        async def fetch():
+            try:
+                page = await get_page(**params)
+                while True:
+                    await pages.put((page, None))
+                    if page.is_last_page():
+                        break
+                    page = await get_page(url=page.next_url)
+            except Exception as e:
+                await pages.put((None, e))
+                return
+            await pages.put((None, None))
+
+        fetcher = asyncio.ensure_future(fetch())
+        try:
+            while True:
+                page, error = await pages.get()
+                if error is not None:
+                    raise error
+                if page is None:
+                    return
+                for record in page.result:
+                    yield record
+        finally:
+            fetcher.cancel()
+
+    @staticmethod
+    async def iterate_many(get_page, listings, workers=4):
+        """Yield every record of many paged listings, paging through several at once
+
+        The asyncio counterpart of PagedResults.iterate_many; each of up to
+        ``workers`` tasks pages through one listing at a time.
+
+        :param get_page: called with a listing's params for its first page, and with url= for the next ones
+        :type get_page: coroutine function
+        :param listings: the key and the get_page params of each listing
+        :type listings: iterable of (key, dict)
+        :param workers: number of listings paged through at once
+        :type workers: int
+        :rtype: async generator of (key, record)
+        """
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+
+        listings = iter(listings)
+        pages = asyncio.Queue(maxsize=workers * 2)
+
+        async def fetch():
+            try:
+                for key, params in listings:
+                    page = await get_page(**params)
+                    while True:
+                        await pages.put((key, page.result, None))
+                        if page.is_last_page():
+                            break
+                        page = await get_page(url=page.next_url)
+            except Exception as e:
+                await pages.put((None, None, e))
+                return
+            await pages.put((None, None, None))
+
+        fetchers = [asyncio.ensure_future(fetch()) for _ in range(workers)]
+        running = len(fetchers)
+        try:
+            while running:
+                key, records, error = await pages.get()
+                if error is not None:
+                    raise error
+                if records is None:
+                    running -= 1
+                    continue
+                for record in records:
+                    yield key, record
+        finally:
+            for fetcher in fetchers:
+                fetcher.cancel()
+
+    async def get_path(self, url_path, params=None):
+        return await self.get(self.base_url + url_path, params)
+
+    async def put_path(self, url_path, data=None, params=None):
+        return await self.put(self.base_url + url_path, data, params)
+
+    async def post_path(self, url_path, data=None, params=None):
+        return await self.post(self.base_url + url_path, data, params)
+
+    async def delete_path(self, url_path, params=None, idempotent=None):
+        return await self.delete(self.base_url + url_path, params, idempotent)
+
+    async def _send(self, method, url, data=None):
+        if self.session is None:
+            self.session = ApiClient.create_pooled_session(self.__limit, self.__limit_per_host,
+                                                           self.__keepalive_timeout)
+
+        async with self.session.request(method, url, data=data, headers=self.headers) as resp:
+            content = await resp.read()
+            links = dict((rel, {'url': str(link.get('url'))})
+                         for rel, link in resp.links.items())
+            return Response(resp.status, None, resp.headers, links, content, resp.get_encoding())
+
+    async def __request(self, method, url, data=None, params=None, idempotent=None):
+        url = url + self.query_string(params)
+
+        started = time.time()
+        attempts = 0
+        delay = None
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(url)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            attempts += 1
+            try:
+                resp = await self._send(method, url, data)
+            except ApiClient.CONNECTION_ERRORS as e:
+                delay = self.retry_policy.next_delay(method, attempts, time.time() - started, delay, error=e,
+                                                     idempotent=idempotent)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            if resp is None:
+                raise ValueError("A response wasn't received")
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(url, resp.headers)
+
+            if 200 <= resp.status_code < 300:
+                return resp
+
+            delay = self.retry_policy.next_delay(method, attempts, time.time() - started, delay, response=resp,
+                                                 idempotent=idempotent)
+            if delay is None:
+                raise OktaError(self.json_codec.loads(JsonCodec.body(resp)), resp.status_code)
+            await asyncio.sleep(delay)
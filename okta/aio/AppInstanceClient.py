@@ -0,0 +1,139 @@
+from okta.aio.ApiClient import ApiClient
+from okta.framework.PagedResults import PagedResults
+from okta.models.app.AppInstance import AppInstance
+
+
+class AppInstanceClient(ApiClient):
+    def __init__(self, *args, **kwargs):
+        kwargs['pathname'] = '/api/v1/apps'
+        ApiClient.__init__(self, *args, **kwargs)
+
+    # CRUD
+
+    async def get_app_instances(self, limit=None, filter_string=None):
+        """Get a list of AppInstances
+
+        :param limit: maximum number of apps to return
+        :type limit: int or None
+        :param filter_string: string to filter users
+        :type filter_string: str or None
+        :rtype: list of AppInstance
+        """
+        params = {
+            'limit': limit,
+            'filter': filter_string
+        }
+        response = await ApiClient.get_path(self, '/', params=params)
+        return ApiClient.deserialize(self, response, AppInstance)
+
+    async def get_paged_app_instances(self, limit=None, filter_string=None, after=None, url=None):
+        """Get a paged list of AppInstances
+
+        :param limit: maximum number of apps to return
+        :type limit: int or None
+        :param filter_string: string to filter apps
+        :type filter_string: str or None
+        :param after: app id that filtering will resume after
+        :type after: str
+        :param url: url that returns a list of AppInstance
+        :type url: str
+        :rtype: PagedResults of AppInstance
+        """
+        if url:
+            response = await ApiClient.get(self, url)
+
+        else:
+            params = {
+                'limit': limit,
+                'after': after,
+                'filter': filter_string
+            }
+            response = await ApiClient.get_path(self, '/', params=params)
+
+        return PagedResults(response, AppInstance, self.deserialize_options)
+
+    def iter_app_instances(self, limit=None, filter_string=None, after=None, prefetch=0):
+        """Iterate over every AppInstance, fetching pages as they are needed
+
+        :param limit: number of apps fetched per page
+        :type limit: int or None
+        :param filter_string: string to filter apps
+        :type filter_string: str or None
+        :param after: app id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: async generator of AppInstance
+        """
+        return ApiClient.iterate(self.get_paged_app_instances, prefetch,
+                                 limit=limit, filter_string=filter_string, after=after)
+
+    async def create_app_instance(self, app_instance):
+        """Create a app instance
+
+        :param app_instance: the data to create a user
+        :type app_instance: AppInstance
+        :rtype: AppInstance
+        """
+        response = await ApiClient.post_path(self, '/', app_instance)
+        return ApiClient.deserialize(self, response, AppInstance)
+
+    async def get_app_instance(self, id):
+        """Get a single app
+
+        :param id: the app id
+        :type id: str
+        :rtype: AppInstance
+        """
+        response = await ApiClient.get_path(self, '/{0}'.format(id))
+        return ApiClient.deserialize(self, response, AppInstance)
+
+    async def update_app_instance(self, app_instance):
+        """Update an app
+
+        :param app_instance: the app to update
+        :type app_instance: AppInstance
+        :rtype: AppInstance
+        """
+        return await self.update_app_instance_by_id(app_instance.id, app_instance)
+
+    async def update_app_instance_by_id(self, id, app_instance):
+        """Update an app, defined by an id
+
+        :param id: the target app id
+        :type id: str
+        :param app_instance: the data to update the target app
+        :type app_instance: AppInstance
+        :rtype: AppInstance
+        """
+        response = await ApiClient.put_path(self, '/{0}'.format(id), app_instance)
+        return ApiClient.deserialize(self, response, AppInstance)
+
+    async def delete_app_instance(self, id):
+        """Delete app by target id
+
+        :param id: the target app id
+        :type id: str
+        :return: None
+        """
+        await ApiClient.delete_path(self, '/{0}'.format(id))
+
+    # LIFECYCLE
+
+    async def activate_app_instance(self, id):
+        """Activate app by target id
+
+        :param id: the target app id
+        :type id: str
+        :return: None
+        """
+        await ApiClient.post_path(self, '/{0}/lifecycle/activate'.format(id), None)
+
+    async def deactivate_app_instance(self, id):
+        """Deactivate app by target id
+
+        :param id: the target app id
+        :type id: str
+        :return: None
+        """
+        await ApiClient.post_path(self, '/{0}/lifecycle/deactivate'.format(id), None)
\ No newline at end of file
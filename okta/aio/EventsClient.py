@@ -0,0 +1,106 @@
+import asyncio
+
+from okta.aio.ApiClient import ApiClient
+from okta.framework.EventFollower import EventFollower
+from okta.models.event.Event import Event
+from okta.framework.PagedResults import PagedResults
+
+
+class EventsClient(ApiClient):
+    def __init__(self, *args, **kwargs):
+        kwargs['pathname'] = '/api/v1/events'
+        ApiClient.__init__(self, *args, **kwargs)
+
+    async def get_events(self, limit=None, start_date=None, filter_string=None):
+        """Get a list of Events
+
+        :param limit: maximum number of events to return
+        :type limit: int or None
+        :param filter_string: string to filter events
+        :type filter_string: str or None
+        :rtype: list of Event
+        """
+        params = {
+            'limit': limit,
+            'startDate': start_date,
+            'filter': filter_string
+        }
+        response = await ApiClient.get_path(self, '/', params=params)
+
+        return ApiClient.deserialize(self, response, Event)
+
+    async def get_paged_events(self, limit=None, start_date=None, after=None, filter_string=None, url=None):
+        """Get a paged list of Events
+
+        :param limit: maximum number of events to return
+        :type limit: int or None
+        :param filter_string: string to filter events
+        :type filter_string: str or None
+        :param after: event id that filtering will resume after
+        :type after: str or None
+        :param url: url that returns a list of Event
+        :type url: str or None
+        :rtype: PagedResults of Event
+        """
+        if url:
+            response = await ApiClient.get(self, url)
+
+        else:
+            params = {
+                'limit': limit,
+                'startDate': start_date,
+                'after': after,
+                'filter': filter_string
+            }
+            response = await ApiClient.get_path(self, '/', params=params)
+
+        return PagedResults(response, Event, self.deserialize_options)
+
+    def iter_events(self, limit=None, start_date=None, filter_string=None, after=None, prefetch=0):
+        """Iterate over every Event, fetching pages as they are needed
+
+        :param limit: number of events fetched per page
+        :type limit: int or None
+        :param start_date: earliest publish date of the events
+        :type start_date: str or None
+        :param filter_string: string to filter events
+        :type filter_string: str or None
+        :param after: event id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: async generator of Event
+        """
+        return ApiClient.iterate(self.get_paged_events, prefetch,
+                                 limit=limit, start_date=start_date, filter_string=filter_string, after=after)
+
+    async def follow(self, start_date=None, filter_string=None, limit=None, min_interval=EventFollower.MIN_INTERVAL,
+                     max_interval=EventFollower.MAX_INTERVAL):
+        """Tail the event log, polling for new events until the caller stops iterating
+
+        Each event is yielded once, including at the boundaries between
+        polls. Polls come every min_interval seconds while events are
+        arriving, and back off to max_interval while none are.
+
+        :param start_date: when the events to follow start, now by default
+        :type start_date: datetime or str or None
+        :param filter_string: string to filter events
+        :type filter_string: str or None
+        :param limit: number of events fetched per page
+        :type limit: int or None
+        :param min_interval: seconds between polls while events are arriving
+        :type min_interval: float
+        :param max_interval: the longest wait between polls, and so how late an event can be yielded
+        :type max_interval: float
+        :rtype: async generator of Event
+        """
+        follower = EventFollower(self, start_date=start_date, filter_string=filter_string, limit=limit,
+                                 min_interval=min_interval, max_interval=max_interval)
+        while True:
+            found = 0
+            async for event in self.iter_events(limit=limit, filter_string=follower.poll_filter()):
+                if follower.accept(event):
+                    found += 1
+                    yield event
+            follower.polled(found)
+            await asyncio.sleep(follower.interval)
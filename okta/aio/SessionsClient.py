@@ -0,0 +1,91 @@
+from okta.aio.ApiClient import ApiClient
+from okta.models.session.Credentials import Credentials
+from okta.models.session.Session import Session
+
+
+class SessionsClient(ApiClient):
+    def __init__(self, *args, **kwargs):
+        kwargs['pathname'] = '/api/v1/sessions'
+        ApiClient.__init__(self, *args, **kwargs)
+
+    # CRUD
+
+    async def create_session(self, username, password, additional_fields=None):
+        """Create a session
+
+        :param username: the user's username
+        :type username: str
+        :param password: the user's password
+        :type password: str
+        :param additional_fields: additional fields that will be included in the response
+        :type additional_fields: str
+        :rtype: Session
+        """
+        creds = Credentials()
+        creds.username = username
+        creds.password = password
+        params = {'additionalFields': additional_fields}
+        response = await ApiClient.post_path(self, '/', creds, params=params)
+        return ApiClient.deserialize(self, response, Session)
+
+    async def create_session_with_cookie_token(self, username, password):
+        """Create a session that contains a cookie token
+
+        :param username: the user's username
+        :type username: str
+        :param password: the user's password
+        :type password: str
+        :rtype: Session
+        """
+        return await self.create_session(username, password, 'cookieToken')
+
+    async def create_session_with_cookie_token_url(self, username, password):
+        """Create a session that contains a cookie token url
+
+        :param username: the user's username
+        :type username: str
+        :param password: the user's password
+        :type password: str
+        :rtype: Session
+        """
+        return await self.create_session(username, password, 'cookieTokenUrl')
+
+    async def create_session_by_session_token(self, session_token, additional_fields=None):
+        """Create a session using a session token
+
+        :param session_token: a token that can be exchanged for a session
+        :type session_token: str
+        :param additional_fields: additional fields that will be included in the response
+        :type additional_fields: str
+        :rtype: Session
+        """
+        data = {'sessionToken': session_token}
+        params = {'additionalFields': additional_fields}
+        response = await ApiClient.post_path(self, '/', data, params=params)
+        return ApiClient.deserialize(self, response, Session)
+
+    async def validate_session(self, id):
+        """Validate a session
+
+        :param id: the target session id
+        :rtype: Session
+        """
+        response = await ApiClient.get_path(self, '/{0}'.format(id))
+        return ApiClient.deserialize(self, response, Session)
+
+    async def extend_session(self, id):
+        """Extend a session's lifespan
+
+        :param id: the target session id
+        :rtype: Session
+        """
+        response = await ApiClient.put_path(self, '/{0}'.format(id), None)
+        return ApiClient.deserialize(self, response, Session)
+
+    async def clear_session(self, id):
+        """Terminate a session
+
+        :param id: the target session id
+        :rtype: Session
+        """
+        await ApiClient.delete_path(self, '/{0}'.format(id))
\ No newline at end of file
@@ -0,0 +1,234 @@
+import functools
+
+from okta.aio.ApiClient import ApiClient
+from okta.models.user.User import User
+from okta.models.usergroup.UserGroup import UserGroup
+from okta.framework.PagedResults import PagedResults
+
+
+class UserGroupsClient(ApiClient):
+    def __init__(self, *args, **kwargs):
+        kwargs['pathname'] = '/api/v1/groups'
+        ApiClient.__init__(self, *args, **kwargs)
+
+    # CRUD
+
+    async def get_groups(self, limit=None, query=None):
+        """Get a list of UserGroups
+
+        :param limit: maximum number of groups to return
+        :type limit: int or None
+        :param query: string to search group names
+        :type query: str or None
+        :rtype: list of UserGroup
+        """
+        params = {
+            'limit': limit,
+            'q': query
+        }
+        response = await ApiClient.get_path(self, '/', params=params)
+        return ApiClient.deserialize(self, response, UserGroup)
+
+    async def get_paged_groups(self, limit=None, after=None, url=None):
+        """Get a paged list of UserGroups
+
+        :param limit: maximum number of groups to return
+        :type limit: int or None
+        :param after: group id that filtering will resume after
+        :type after: str
+        :param url: url that returns a list of UserGroup
+        :type url: str
+        :rtype: PagedResults of UserGroup
+        """
+        if url:
+            response = await ApiClient.get(self, url)
+
+        else:
+            params = {
+                'limit': limit,
+                'after': after
+            }
+            response = await ApiClient.get_path(self, '/', params=params)
+
+        return PagedResults(response, UserGroup, self.deserialize_options)
+
+    def iter_groups(self, limit=None, after=None, prefetch=0):
+        """Iterate over every UserGroup, fetching pages as they are needed
+
+        :param limit: number of groups fetched per page
+        :type limit: int or None
+        :param after: group id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: async generator of UserGroup
+        """
+        return ApiClient.iterate(self.get_paged_groups, prefetch, limit=limit, after=after)
+
+    async def get_group(self, gid):
+        """Get a single group
+
+        :param gid: the group id
+        :type gid: str
+        :rtype: UserGroup
+        """
+        response = await ApiClient.get_path(self, '/{0}'.format(gid))
+        return ApiClient.deserialize(self, response, UserGroup)
+
+    async def get_group_users(self, gid, limit=None):
+        """Get the first page of the users of a group
+
+        Only one page is returned, so use iter_group_users for groups that
+        may have more members than fit on a page.
+
+        :param gid: the group id
+        :type gid: str
+        :param limit: maximum number of users to return
+        :type limit: int or None
+        :rtype: list of User
+        """
+        params = {
+            'limit': limit
+        }
+        response = await ApiClient.get_path(self, '/{0}/users'.format(gid), params=params)
+        return ApiClient.deserialize(self, response, User)
+
+    async def get_paged_group_users(self, gid=None, limit=None, after=None, url=None):
+        """Get a paged list of the users of a group
+
+        :param gid: the group id
+        :type gid: str or None
+        :param limit: maximum number of users to return
+        :type limit: int or None
+        :param after: user id that listing will resume after
+        :type after: str or None
+        :param url: url that returns a list of User
+        :type url: str or None
+        :rtype: PagedResults of User
+        """
+        if url:
+            response = await ApiClient.get(self, url)
+        else:
+            params = {
+                'limit': limit,
+                'after': after
+            }
+            response = await ApiClient.get_path(self, '/{0}/users'.format(gid), params=params)
+        return PagedResults(response, User, self.deserialize_options)
+
+    def iter_group_users(self, gid, limit=None, after=None, prefetch=0):
+        """Iterate over every user of a group, fetching pages as they are needed
+
+        :param gid: the group id
+        :type gid: str
+        :param limit: number of users fetched per page
+        :type limit: int or None
+        :param after: user id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: async generator of User
+        """
+        return ApiClient.iterate(functools.partial(self.get_paged_group_users, gid), prefetch,
+                                 limit=limit, after=after)
+
+    def iter_members_of_groups(self, gids, limit=None, workers=4):
+        """Iterate over the users of many groups, paging through several groups at once
+
+        :param gids: the group ids
+        :type gids: iterable of str
+        :param limit: number of users fetched per page
+        :type limit: int or None
+        :param workers: number of groups paged through at once
+        :type workers: int
+        :rtype: async generator of (str, User), the group id and one of its users
+        """
+        listings = ((gid, {'gid': gid, 'limit': limit}) for gid in gids)
+        return ApiClient.iterate_many(self.get_paged_group_users, listings, workers)
+
+    async def update_group(self, group):
+        """Update a group
+
+        :param group: the group to update
+        :type group: UserGroup
+        :rtype: UserGroup
+        """
+        return await self.update_group_by_id(group.id, group)
+
+    async def update_group_by_id(self, gid, group):
+        """Update a group, defined by an id
+
+        :param gid: the target group id
+        :type gid: str
+        :param group: the data to update the target group
+        :type group: UserGroup
+        :rtype: UserGroup
+        """
+        response = await ApiClient.put_path(self, '/{0}'.format(gid), group)
+        return ApiClient.deserialize(self, response, UserGroup)
+
+    async def create_group(self, group):
+        """Create a group
+
+        :param group: the data to create a group
+        :type group: UserGroup
+        :rtype: UserGroup
+        """
+        response = await ApiClient.post_path(self, '/', group)
+        return ApiClient.deserialize(self, response, UserGroup)
+
+    async def delete_group(self, gid):
+        """Delete group by target id
+
+        :param gid: the target group id
+        :type gid: str
+        :return: None
+        """
+        response = await ApiClient.delete_path(self, '/{0}'.format(gid))
+        return ApiClient.deserialize(self, response, UserGroup)
+
+    async def add_user_to_group(self, group, user):
+        """Add a user to a group
+
+        :param group: the target group
+        :type group: UserGroup
+        :param user: the target user
+        :type user: User
+        :return: None
+        """
+        return await self.add_user_to_group_by_id(group.id, user.id)
+
+    async def add_user_to_group_by_id(self, gid, uid):
+        """Add a user to a group
+
+        :param gid: the target group id
+        :type gid: str
+        :param uid: the target user id
+        :type uid: str
+        :return: None
+        """
+        response = await ApiClient.put_path(self, '/{0}/users/{1}'.format(gid, uid))
+        return ApiClient.deserialize(self, response, UserGroup)
+
+    async def remove_user_from_group(self, group, user):
+        """Remove a user from a group
+
+        :param group: the target group
+        :type group: UserGroup
+        :param user: the target user
+        :type user: User
+        :return: None
+        """
+        return await self.remove_user_from_group_by_id(group.id, user.id)
+
+    async def remove_user_from_group_by_id(self, gid, uid):
+        """Remove a user from a group
+
+        :param gid: the target group id
+        :type gid: str
+        :param uid: the target user id
+        :type uid: str
+        :return: None
+        """
+        response = await ApiClient.delete_path(self, '/{0}/users/{1}'.format(gid, uid))
+        return ApiClient.deserialize(self, response, UserGroup)
@@ -0,0 +1,321 @@
+from okta.aio.ApiClient import ApiClient
+from okta.framework.ChangeTracker import ChangeTracker
+from okta.framework.PagedResults import PagedResults
+from okta.models.user.ActivationResponse import ActivationResponse
+from okta.models.user.AppLinks import AppLinks
+from okta.models.user.User import User
+from okta.models.user.TempPassword import TempPassword
+from okta.models.user.ResetPasswordToken import ResetPasswordToken
+from okta.models.user.LoginCredentials import LoginCredentials
+from okta.models.usergroup.UserGroup import UserGroup
+
+
+class UsersClient(ApiClient):
+    def __init__(self, *args, **kwargs):
+        kwargs['pathname'] = '/api/v1/users'
+        ApiClient.__init__(self, *args, **kwargs)
+        
+        self.user_class = User
+        if "user_class" in kwargs and kwargs["user_class"]:
+            self.user_class = kwargs["user_class"]
+
+    # CRUD
+
+    async def get_users(self, limit=None, query=None, filter_string=None):
+        """Get a list of Users
+
+        :param limit: maximum number of users to return
+        :type limit: int or None
+        :param query: string to search users' first names, last names, and emails
+        :type query: str or None
+        :param filter_string: string to filter users
+        :type filter_string: str or None
+        :rtype: list of User
+        """
+        params = {
+            'limit': limit,
+            'q': query,
+            'filter': filter_string
+        }
+        response = await ApiClient.get_path(self, '/', params=params)
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    async def get_user(self, uid):
+        """Get a single user
+
+        :param uid: the user id or login
+        :type uid: str
+        :rtype: User
+        """
+        response = await ApiClient.get_path(self, '/{0}'.format(uid))
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    async def get_user_applinks(self, uid):
+        """Get applinks of a single user
+
+        :param uid: the user id or login
+        :type uid: str
+        :rtype: AppLinks
+        """
+        response = await ApiClient.get_path(self, '/{0}/appLinks'.format(uid))
+        return ApiClient.deserialize(self, response, AppLinks)
+
+    async def get_user_groups(self, uid):
+        """Get groups of a single user
+
+        :param uid: the user id or login
+        :type uid: str
+        :rtype: Groups
+        """
+        response = await ApiClient.get_path(self, '/{0}/groups'.format(uid))
+        return ApiClient.deserialize(self, response, UserGroup)
+
+    async def update_user(self, user, partial=True):
+        """Update a user
+
+        :param user: the user to update
+        :type user: User
+        :rtype: User
+        """
+        return await self.update_user_by_id(user.id, user, partial)
+
+    async def update_user_by_id(self, uid, user, partial=True):
+        """Update a user, defined by an id
+
+        A partial update of a user fetched by a client created with
+        track_changes=True sends only the fields changed since it was fetched,
+        as found by the ChangeTracker, and makes no request if none were; any
+        other user is sent whole.
+
+        :param uid: the target user id
+        :type uid: str
+        :param user: the data to update the target user
+        :type user: User
+        :param partial: whether to do a partial (true) or full (false) update
+        :type partial: bool
+        :rtype: User
+        """
+        if partial:
+            changes = ChangeTracker.changes(user)
+            if changes == {}:
+                # An empty body would be rejected, and there is nothing to update
+                return user
+            data = user if changes is None else changes
+            response = await ApiClient.post_path(self, '/{0}'.format(uid), data)
+        else:
+            response = await ApiClient.put_path(self, '/{0}'.format(uid), user)
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    async def create_user(self, user, activate=None):
+        """Create a user
+
+        :param user: the data to create a user
+        :type user: User
+        :param activate: whether to activate the user
+        :type activate: bool
+        :rtype: User
+        """
+        if activate is None:
+            response = await ApiClient.post_path(self, '/', user)
+        else:
+            params = {
+                'activate': activate
+            }
+            response = await ApiClient.post_path(self, '/', user, params=params)
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    async def delete_user(self, uid):
+        """Delete user by target id
+
+        The first delete of a user deactivates them, and a second removes them
+        for good, so a delete that failed with a server or connection error is
+        not retried: the server may have applied it.
+
+        :param uid: the target user id
+        :type uid: str
+        :return: None
+        """
+        response = await ApiClient.delete_path(self, '/{0}'.format(uid), idempotent=False)
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    async def get_paged_users(self, limit=None, filter_string=None, after=None, url=None):
+        """Get a paged list of Users
+
+        :param limit: maximum number of users to return
+        :type limit: int or None
+        :param filter_string: string to filter users
+        :type filter_string: str or None
+        :param after: user id that filtering will resume after
+        :type after: str
+        :param url: url that returns a list of User
+        :type url: str
+        :rtype: PagedResults of User
+        """
+        if url:
+            response = await ApiClient.get(self, url)
+        else:
+            params = {
+                'limit': limit,
+                'after': after,
+                'filter': filter_string
+            }
+            response = await ApiClient.get_path(self, '/', params=params)
+        return PagedResults(response, self.user_class, self.deserialize_options)
+
+    def iter_users(self, limit=None, filter_string=None, after=None, prefetch=0):
+        """Iterate over every User, fetching pages as they are needed
+
+        :param limit: number of users fetched per page
+        :type limit: int or None
+        :param filter_string: string to filter users
+        :type filter_string: str or None
+        :param after: user id that listing will resume after
+        :type after: str or None
+        :param prefetch: number of pages fetched ahead while the current one is used
+        :type prefetch: int
+        :rtype: async generator of User
+        """
+        return ApiClient.iterate(self.get_paged_users, prefetch,
+                                 limit=limit, filter_string=filter_string, after=after)
+
+    # LIFECYCLE
+    
+    async def activate_user(self, uid, send_email=True):
+        """Activate user by target id
+
+        :param uid: the target user id
+        :type uid: str
+        :return: User
+        """
+        params = {
+            'sendEmail': send_email
+        }
+        response = await ApiClient.post_path(self, '/{0}/lifecycle/activate'.format(uid), params=params)
+        return ApiClient.deserialize(self, response, ActivationResponse)
+
+    async def deactivate_user(self, uid):
+        """Deactivate user by target id
+
+        :param uid: the target user id
+        :type uid: str
+        :return: User
+        """
+        response = await ApiClient.post_path(self, '/{0}/lifecycle/deactivate'.format(uid))
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    async def suspend_user(self, uid):
+        """Suspend user by target id
+
+        :param uid: the target user id
+        :type uid: str
+        :return: User
+        """
+        response = await ApiClient.post_path(self, '/{0}/lifecycle/suspend'.format(uid))
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    async def unsuspend_user(self, uid):
+        """Unsuspend user by target id
+
+        :param uid: the target user id
+        :type uid: str
+        :return: User
+        """
+        response = await ApiClient.post_path(self, '/{0}/lifecycle/unsuspend'.format(uid))
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    async def unlock_user(self, uid):
+        """Unlock user by target id
+
+        :param uid: the target user id
+        :type uid: str
+        :return: User
+        """
+        response = await ApiClient.post_path(self, '/{0}/lifecycle/unlock'.format(uid))
+        return ApiClient.deserialize(self, response, self.user_class)
+
+    async def reset_password(self, uid, send_email=True):
+        """Reset user's password by target user id
+
+        :param uid: the target user id
+        :type uid: str
+        :param send_email: whether a password reset email should be sent
+        :type send_email: bool
+        :return: None or ResetPasswordToken
+        """
+        params = {
+            'sendEmail': send_email
+        }
+        response = await ApiClient.post_path(self, '/{0}/lifecycle/reset_password'.format(uid), params=params)
+        return ApiClient.deserialize(self, response, ResetPasswordToken)
+
+    async def change_password(self, uid, old_password, new_password):
+        """Change user's password by target user id
+
+        :param uid: the target user id
+        :type uid: str
+        :param old_password: the user's old password
+        :type old_password: str
+        :param new_password: the desired new password
+        :type new_password: str
+        :return: None or LoginCredentials
+        """
+        data = {
+            'oldPassword': {
+                'value': old_password
+            },
+            'newPassword': {
+                'value': new_password
+            }
+        }
+        response = await ApiClient.post_path(self, '/{0}/credentials/change_password'.format(uid), data)
+        return ApiClient.deserialize(self, response, LoginCredentials)
+
+    async def change_recovery_question(self, uid, password, question, answer):
+        """Changes a user's recovery question & answer by validating the user's current password
+
+        :param uid: the target user id
+        :type uid: str
+        :param password: the user's current password
+        :type password: str
+        :param question: the new recovery question
+        :type question: str
+        :param answer: the answer to the new recovery question
+        :type answer: str
+        """
+        data = {
+            'password': { 'value': password },
+            'recovery_question': {
+                'question': question,
+                'answer': answer
+            }
+        }
+        response = await ApiClient.post_path(self, '/{0}/credentials/change_recovery_question'.format(uid), data)
+        return ApiClient.deserialize(self, response, LoginCredentials)
+
+    async def expire_password(self, uid, temp_password=False):
+        """Expire user's password by target user id
+
+        :param uid: the target user id
+        :type uid: str
+        :param temp_password: whether a temporary password should be set
+        :type temp_password: bool
+        :return: None or TempPassword
+        """
+        if not temp_password:
+            response = await ApiClient.post_path(self, '/{0}/lifecycle/expire_password'.format(uid))
+        else:
+            params = {
+                'tempPassword': temp_password
+            }
+            response = await ApiClient.post_path(self, '/{0}/lifecycle/expire_password'.format(uid), params=params)
+        return ApiClient.deserialize(self, response, TempPassword)
+
+    async def reset_factors(self, uid):
+        """Reset all user factors by target id
+
+        :param uid: the target user id
+        :type uid: str
+        :return: None
+        """
+        response = await ApiClient.post_path(self, '/{0}/lifecycle/reset_factors'.format(uid))
+        return ApiClient.deserialize(self, response, self.user_class)
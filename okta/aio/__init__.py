@@ -0,0 +1,16 @@
+"""
+    okta.aio
+    ~~~~~~~~
+    asyncio versions of the Okta clients, built on aiohttp.
+
+    :copyright: (c) 2015 by Okta.
+    :license: Apache 2, see LICENSE.txt for more details.
+"""
+from .AppInstanceClient import AppInstanceClient
+from .AuthClient import AuthClient
+from .EventsClient import EventsClient
+from .FactorsAdminClient import FactorsAdminClient
+from .FactorsClient import FactorsClient
+from .SessionsClient import SessionsClient
+from .UserGroupsClient import UserGroupsClient
+from .UsersClient import UsersClient
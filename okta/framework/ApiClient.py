@@ -1,85 +1,186 @@
+import copy
 import requests
-import json
+import threading
 import time
-from okta.framework.Serializer import Serializer
+from requests.adapters import HTTPAdapter
+from okta.framework.BaseApiClient import BaseApiClient
+from okta.framework.Cache import Cache
+from okta.framework.JsonCodec import JsonCodec
+from okta.framework.JsonStream import JsonStream
 from okta.framework.OktaError import OktaError
+from okta.framework.RateLimiter import RateLimiter
+from okta.framework.Utils import Utils
 import six
+from six.moves import http_cookiejar
 
 
-class ApiClient(object):
+class ApiClient(BaseApiClient):
+
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+
+    # Sessions shared between clients built with the same pool settings,
+    # so every client pointed at an org reuses the same keep-alive connections
+    __shared_sessions = {}
+    __shared_sessions_lock = threading.Lock()
 
     def __init__(self, *args, **kwargs):
-        if 'pathname' not in kwargs:
-            raise ValueError('A pathname must be provided to create an ApiClient')
+        BaseApiClient.__init__(self, *args, **kwargs)
 
-        if 'base_url' in kwargs and kwargs['base_url']:
-            self.base_url = kwargs['base_url'] + kwargs['pathname']
-        elif len(args) > 0 and args[0]:
-            self.base_url = args[0] + kwargs['pathname']
+        if 'session' in kwargs and kwargs['session']:
+            self.session = kwargs['session']
         else:
-            raise ValueError('A base_url must be provided to create an ApiClient')
+            self.session = ApiClient.get_shared_session(
+                pool_connections=kwargs.get('pool_connections') or ApiClient.DEFAULT_POOL_CONNECTIONS,
+                pool_maxsize=kwargs.get('pool_maxsize') or ApiClient.DEFAULT_POOL_MAXSIZE,
+                pool_block=kwargs.get('pool_block', False))
 
-        if 'api_token' in kwargs and kwargs['api_token']:
-            self.api_token = kwargs['api_token']
-        elif len(args) > 1 and args[1]:
-            self.api_token = args[1]
-        else:
-            raise ValueError('An api_token must be provied to create an ApiClient')
-
-        self.api_version = 1
-        self.max_attempts = 4
-
-        self.headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-            'Authorization': 'SSWS ' + self.api_token
-        }
-
-        if 'headers' in kwargs:
-            self.headers.update(kwargs['headers'])
-
-    def get(self, url, params=None, attempts=0):
-        params_str = self.__dict_to_query_params(params)
-        resp = requests.get(url + params_str, headers=self.headers)
-        attempts += 1
-        if self.__check_response(resp, attempts):
-            return resp
-        else:
-            return self.get(url, params, attempts)
+        # An optional Cache for lookups, which may be shared with other clients
+        self.cache = kwargs.get('cache')
 
-    def put(self, url, data=None, params=None, attempts=0):
-        if data:
-            data = json.dumps(data, cls=Serializer)
-        params_str = self.__dict_to_query_params(params)
-        resp = requests.put(url + params_str, data=data, headers=self.headers)
-        attempts += 1
-        if self.__check_response(resp, attempts):
-            return resp
-        else:
-            return self.put(url, data, params, attempts)
+    def default_headers(self, **kwargs):
+        headers = BaseApiClient.default_headers(self, **kwargs)
+        if kwargs.get('keep_alive') is False:
+            headers['Connection'] = 'close'
+        return headers
+
+    @staticmethod
+    def create_pooled_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                              pool_block=False):
+        """Create a session backed by a pool of keep-alive connections
+
+        The session is shared by every client built with the same pool
+        settings, whatever org and token they use, so it keeps no cookies:
+        the API is authorized by the token alone.
+
+        :param pool_connections: number of per-host connection pools to cache
+        :type pool_connections: int
+        :param pool_maxsize: maximum number of connections kept open per host
+        :type pool_maxsize: int
+        :param pool_block: whether to wait for a free connection instead of opening an extra one
+        :type pool_block: bool
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                              pool_block=pool_block, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.cookies.set_policy(http_cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        return session
 
-    def post(self, url, data=None, params=None, attempts=0):
+    @staticmethod
+    def get_shared_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                           pool_block=False):
+        """Get the process-wide session for the given pool settings, creating it on first use
+
+        :param pool_connections: number of per-host connection pools to cache
+        :type pool_connections: int
+        :param pool_maxsize: maximum number of connections kept open per host
+        :type pool_maxsize: int
+        :param pool_block: whether to wait for a free connection instead of opening an extra one
+        :type pool_block: bool
+        :rtype: requests.Session
+        """
+        key = (pool_connections, pool_maxsize, pool_block)
+        with ApiClient.__shared_sessions_lock:
+            session = ApiClient.__shared_sessions.get(key)
+            if session is None:
+                session = ApiClient.create_pooled_session(pool_connections, pool_maxsize, pool_block)
+                ApiClient.__shared_sessions[key] = session
+            return session
+
+    def paced(self):
+        """Get a client whose requests are paced by a RateLimiter, for a run of many concurrent requests
+
+        That is this client if it has a RateLimiter. Otherwise it is a copy of
+        it, sharing its session, cache and settings, with a RateLimiter of its
+        own, so this client is left as it was.
+
+        :rtype: the client's class
+        """
+        if self.rate_limiter is not None:
+            return self
+        client = copy.copy(self)
+        client.rate_limiter = RateLimiter()
+        return client
+
+    def get(self, url, params=None, stream=False, headers=None):
+        return self.__request('GET', url, params=params, stream=stream, headers=headers)
+
+    def put(self, url, data=None, params=None):
         if data:
-            data = json.dumps(data, cls=Serializer, separators=(',', ':'))
-        params_str = self.__dict_to_query_params(params)
-        resp = requests.post(url + params_str, data=data, headers=self.headers)
-        attempts += 1
-        if self.__check_response(resp, attempts):
-            return resp
-        else:
-            return self.post(url, data, params, attempts)
-
-    def delete(self, url, params=None, attempts=0):
-        params_str = self.__dict_to_query_params(params)
-        resp = requests.delete(url + params_str, headers=self.headers)
-        attempts += 1
-        if self.__check_response(resp, attempts):
-            return resp
-        else:
-            return self.delete(url, params, attempts)
+            data = self.json_codec.dumps(data)
+        return self.__request('PUT', url, data, params)
 
-    def get_path(self, url_path, params=None):
-        return self.get(self.base_url + url_path, params)
+    def post(self, url, data=None, params=None):
+        if data:
+            data = self.json_codec.dumps(data)
+        return self.__request('POST', url, data, params)
+
+    def delete(self, url, params=None, idempotent=None):
+        return self.__request('DELETE', url, params=params, idempotent=idempotent)
+
+    def deserialize_stream(self, response, to_class):
+        """Decode a response body holding a JSON array into model objects, one at a time
+
+        The body is read from the connection as the objects are asked for
+        when the request was made with stream=True. The response is closed
+        once the array has been read, or the generator is abandoned.
+
+        :param response: the response to decode
+        :param to_class: the model class to decode into
+        :rtype: generator of to_class
+        """
+        try:
+            for obj in Utils.deserialize_stream(JsonStream.chunks(response), to_class, **self.deserialize_options):
+                yield obj
+        finally:
+            response.close()
+
+    def get_path(self, url_path, params=None, stream=False, headers=None):
+        return self.get(self.base_url + url_path, params, stream, headers)
+
+    def get_cached(self, url_path, to_class, key, aliases=None):
+        """GET and decode a resource, reading through the client's cache
+
+        A fresh cached value is returned without a request. An expired one
+        that was served with an ETag is revalidated with If-None-Match, and
+        if the server answers 304 Not Modified the cached model is returned
+        as is, without transferring or decoding the body again. Without a
+        cache, this is a plain GET.
+
+        :param url_path: the path of the resource
+        :type url_path: str
+        :param to_class: the model class to decode into
+        :param key: the cache key, e.g. ('group', gid)
+        :type key: tuple
+        :param aliases: called with the decoded value, returns more keys to cache it under
+        :type aliases: function or None
+        :rtype: to_class or list of to_class
+        """
+        cache = self.cache
+        if cache is None:
+            return self.deserialize(self.get_path(url_path), to_class)
+
+        value = cache.get(key)
+        if value is not Cache.MISSING:
+            return value
+
+        stale, etag = cache.get_stale(key)
+        headers = {'If-None-Match': etag} if etag is not None and stale is not Cache.MISSING else None
+        response = self.get_path(url_path, headers=headers)
+        if response.status_code == 304:
+            cache.renew(key)
+            return stale
+
+        value = self.deserialize(response, to_class)
+        etag = response.headers.get('ETag') if response.headers is not None else None
+        etag = etag if isinstance(etag, six.string_types) else None
+        keys = set([key] + (list(aliases(value)) if aliases is not None else []))
+        for cache_key in keys:
+            cache.set(cache_key, value, etag=etag)
+        return value
 
     def put_path(self, url_path, data=None, params=None):
         return self.put(self.base_url + url_path, data, params)
@@ -87,30 +188,54 @@ class ApiClient(object):
     def post_path(self, url_path, data=None, params=None):
         return self.post(self.base_url + url_path, data, params)
 
-    def delete_path(self, url_path, params=None):
-        return self.delete(self.base_url + url_path, params)
-
-    def __check_response(self, resp, attempts=1):
-        if resp is None:
-            raise ValueError("A response wasn't received")
-
-        if 200 <= resp.status_code < 300:
-            return True
-
-        # If we made it this far, we need to handle an exception
-        if attempts >= self.max_attempts or resp.status_code != 429:
-            raise OktaError(json.loads(resp.text), resp.status_code)
-
-        # Assume we're going to retry with exponential backoff
-        time.sleep(2 ** (attempts - 1))
-
-        return False
-
-    @staticmethod
-    def __dict_to_query_params(d):
-        if d is None or len(d) == 0:
-            return ''
-
-        param_list = [param + '=' + (str(value).lower() if type(value) == bool else str(value))
-                      for param, value in six.iteritems(d) if value is not None]
-        return '?' + "&".join(param_list)
+    def delete_path(self, url_path, params=None, idempotent=None):
+        return self.delete(self.base_url + url_path, params, idempotent)
+
+    def __request(self, method, url, data=None, params=None, stream=False, headers=None, idempotent=None):
+        url = url + self.query_string(params)
+        # A conditional request is answered with 304 when the resource hasn't changed
+        conditional = bool(headers) and 'If-None-Match' in headers
+        headers = dict(self.headers, **headers) if headers else self.headers
+        send = getattr(self.session, method.lower())
+        kwargs = {'data': data} if method in ('PUT', 'POST') else {}
+        if stream:
+            # The body is left on the connection for deserialize_stream to read
+            kwargs['stream'] = True
+
+        started = time.time()
+        attempts = 0
+        delay = None
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(url)
+                if wait > 0:
+                    time.sleep(wait)
+
+            attempts += 1
+            try:
+                resp = send(url, headers=headers, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                delay = self.retry_policy.next_delay(method, attempts, time.time() - started, delay, error=e,
+                                                     idempotent=idempotent)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+
+            if resp is None:
+                raise ValueError("A response wasn't received")
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(url, resp.headers)
+
+            if 200 <= resp.status_code < 300 or (conditional and resp.status_code == 304):
+                return resp
+
+            delay = self.retry_policy.next_delay(method, attempts, time.time() - started, delay, response=resp,
+                                                 idempotent=idempotent)
+            if delay is None:
+                raise OktaError(self.json_codec.loads(JsonCodec.body(resp)), resp.status_code)
+            if stream:
+                # Hand the connection back to the pool, as the body won't be read
+                resp.close()
+            time.sleep(delay)
@@ -0,0 +1,108 @@
+from okta.framework.Deserializer import Deserializer
+from okta.framework.JsonCodec import JsonCodec
+from okta.framework.RetryPolicy import RetryPolicy
+from okta.framework.Utils import Utils
+import six
+
+
+class BaseApiClient(object):
+    """The options and url building shared by the ApiClient and its asyncio counterpart in okta.aio
+
+    Subclasses add the session requests are sent with, and the request
+    methods, which are coroutines in okta.aio.
+    """
+
+    def __init__(self, *args, **kwargs):
+        if 'pathname' not in kwargs:
+            raise ValueError('A pathname must be provided to create an ApiClient')
+
+        if 'base_url' in kwargs and kwargs['base_url']:
+            self.base_url = kwargs['base_url'] + kwargs['pathname']
+        elif len(args) > 0 and args[0]:
+            self.base_url = args[0] + kwargs['pathname']
+        else:
+            raise ValueError('A base_url must be provided to create an ApiClient')
+
+        if 'api_token' in kwargs and kwargs['api_token']:
+            self.api_token = kwargs['api_token']
+        elif len(args) > 1 and args[1]:
+            self.api_token = args[1]
+        else:
+            raise ValueError('An api_token must be provied to create an ApiClient')
+
+        self.api_version = 1
+
+        self.headers = self.default_headers(**kwargs)
+
+        if 'headers' in kwargs:
+            self.headers.update(kwargs['headers'])
+
+        # An optional RateLimiter, which may be shared with other clients
+        self.rate_limiter = kwargs.get('rate_limiter')
+
+        self.retry_policy = kwargs.get('retry_policy') or RetryPolicy()
+
+        # Applied whenever a response is decoded into models, see Utils.deserialize
+        timestamps = kwargs.get('timestamps') or 'parse'
+        if timestamps not in Deserializer.TIMESTAMP_MODES:
+            raise ValueError('timestamps must be one of {0}'.format(', '.join(Deserializer.TIMESTAMP_MODES)))
+
+        # Encodes request bodies and decodes responses, see JsonCodec
+        self.json_codec = kwargs.get('json_codec') or JsonCodec.default()
+
+        self.deserialize_options = {
+            'timestamps': timestamps,
+            'lazy': bool(kwargs.get('lazy')),
+            'codec': self.json_codec,
+            # Whether decoded models keep their JSON, so partial updates send only their changes
+            'track': bool(kwargs.get('track_changes'))
+        }
+
+    @property
+    def max_attempts(self):
+        """The retry policy's maximum number of times a request is sent, kept for code that set it on the client
+
+        Setting it changes the client's RetryPolicy, and so every client sharing it.
+        """
+        return self.retry_policy.max_attempts
+
+    @max_attempts.setter
+    def max_attempts(self, max_attempts):
+        self.retry_policy.max_attempts = max_attempts
+
+    def default_headers(self, **kwargs):
+        """Get the headers sent with every request, before those given with the headers option
+
+        :param kwargs: the options the client was created with
+        :rtype: dict
+        """
+        return {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'Authorization': 'SSWS ' + self.api_token
+        }
+
+    def deserialize(self, response, to_class):
+        """Decode a response body into model objects, using the client's decoding options
+
+        :param response: the response to decode
+        :param to_class: the model class to decode into
+        :rtype: to_class or list of to_class
+        """
+        return Utils.deserialize(JsonCodec.body(response), to_class, **self.deserialize_options)
+
+    @staticmethod
+    def query_string(d):
+        """Build the query string of a url, leaving out parameters that are None
+
+        :param d: the query parameters
+        :type d: dict or None
+        :return: the query string, with its leading '?', or '' if there are no parameters
+        :rtype: str
+        """
+        if d is None or len(d) == 0:
+            return ''
+
+        param_list = [param + '=' + (str(value).lower() if type(value) == bool else str(value))
+                      for param, value in six.iteritems(d) if value is not None]
+        return '?' + "&".join(param_list)
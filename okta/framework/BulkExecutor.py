@@ -0,0 +1,249 @@
+import io
+import json
+import os
+import threading
+import time
+
+import requests
+from six.moves import queue
+
+from okta.framework.OktaError import OktaError
+from okta.framework.RetryPolicy import RetryPolicy
+
+
+class BulkExecutor(object):
+    """Runs one API operation over many records on a pool of worker threads
+
+    Each record's outcome is collected in a BulkResult instead of being
+    raised, so one bad record doesn't stop the rest. Records are read from
+    the iterable as the workers need them, so they can come from a file of
+    any size.
+
+    With a checkpoint file, every outcome is appended to it as one JSON
+    line as soon as it is known. A later run given the same file skips the
+    records that already succeeded, so an interrupted run can be resumed.
+
+    The workers share the client's pooled session, retry policy and rate
+    limiter, which is what keeps them within the org's rate limits. For
+    operations that are safe to repeat, a retry_policy also retries a
+    record whose request failed with a server or connection error, which
+    the client's own policy only does for idempotent HTTP methods.
+    """
+
+    DEFAULT_WORKERS = 8
+
+    def __init__(self, workers=DEFAULT_WORKERS, checkpoint=None, retry_policy=None):
+        """
+        :param workers: number of records in flight at once
+        :type workers: int
+        :param checkpoint: path of the file outcomes are recorded in and resumed from
+        :type checkpoint: str or None
+        :param retry_policy: retries records that failed with a server or connection error, if given
+        :type retry_policy: RetryPolicy or None
+        """
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.retry_policy = retry_policy
+
+    def run(self, records, operation, key):
+        """Apply an operation to every record
+
+        :param records: the records
+        :type records: iterable
+        :param operation: called with each record, returns the record's result
+        :type operation: function
+        :param key: called with each record, returns the unique str the checkpoint knows it by
+        :type key: function
+        :rtype: BulkResult
+        """
+        completed = self.completed_keys()
+        result = BulkResult()
+        result.started = time.time()
+        tasks = queue.Queue(maxsize=self.workers * 2)
+        lock = threading.Lock()
+        checkpoint = io.open(self.checkpoint, 'ab') if self.checkpoint else None
+
+        def work():
+            while True:
+                task = tasks.get()
+                if task is None:
+                    return
+                outcome = self.__apply(operation, *task)
+                with lock:
+                    result.add(outcome)
+                    if checkpoint is not None:
+                        checkpoint.write(json.dumps(outcome.checkpoint_entry()).encode('utf-8') + b'\n')
+                        checkpoint.flush()
+
+        threads = [threading.Thread(target=work, name='okta-bulk-{0}'.format(n)) for n in range(self.workers)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            for index, record in enumerate(records):
+                record_key = key(record)
+                if record_key in completed:
+                    with lock:
+                        result.skipped.append(record_key)
+                    continue
+                tasks.put((index, record_key, record))
+        finally:
+            for _ in threads:
+                tasks.put(None)
+            for thread in threads:
+                thread.join()
+            if checkpoint is not None:
+                checkpoint.close()
+
+        result.finished = time.time()
+        result.succeeded.sort(key=lambda outcome: outcome.index)
+        result.failed.sort(key=lambda outcome: outcome.index)
+        return result
+
+    def __apply(self, operation, index, record_key, record):
+        started = time.time()
+        attempts = 0
+        delay = None
+        while True:
+            attempts += 1
+            try:
+                value = operation(record)
+            except Exception as e:
+                if self.retry_policy is not None and self.__retryable(e):
+                    delay = self.retry_policy.next_delay('POST', attempts, time.time() - started, delay,
+                                                         error=e, idempotent=True)
+                    if delay is not None:
+                        time.sleep(delay)
+                        continue
+                return BulkRecordResult(index, record_key, record, error=e, attempts=attempts,
+                                        elapsed=time.time() - started)
+            return BulkRecordResult(index, record_key, record, value=value, attempts=attempts,
+                                    elapsed=time.time() - started)
+
+    @staticmethod
+    def __retryable(error):
+        if isinstance(error, OktaError):
+            return error.status_code in RetryPolicy.RETRY_STATUS_CODES
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def completed_keys(self):
+        """Get the keys of the records the checkpoint file says succeeded
+
+        :rtype: set of str
+        """
+        completed = set()
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return completed
+
+        with io.open(self.checkpoint, 'r', encoding='utf-8') as lines:
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash
+                    continue
+                if entry.get('ok'):
+                    completed.add(entry['key'])
+        return completed
+
+
+class BulkResult(object):
+    """The outcomes of a bulk run, in the order the records were given"""
+
+    def __init__(self):
+        # BulkRecordResults of the records that succeeded
+        self.succeeded = []
+
+        # BulkRecordResults of the records that failed
+        self.failed = []
+
+        # Keys of the records skipped as already done by an earlier run
+        self.skipped = []
+
+        # When the run started and finished, as epoch seconds
+        self.started = None
+        self.finished = None
+
+    def add(self, outcome):
+        (self.succeeded if outcome.ok else self.failed).append(outcome)
+
+    def stats(self):
+        """Get the throughput and per-record latency of the run
+
+        :return: counts, elapsed seconds, records per second, and latency percentiles in seconds
+        :rtype: dict
+        """
+        outcomes = self.succeeded + self.failed
+        latencies = sorted(outcome.elapsed for outcome in outcomes)
+        elapsed = (self.finished or time.time()) - self.started if self.started else 0
+
+        def percentile(fraction):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] if latencies else None
+
+        return {
+            'processed': len(outcomes),
+            'succeeded': len(self.succeeded),
+            'failed': len(self.failed),
+            'skipped': len(self.skipped),
+            'retried': sum(1 for outcome in outcomes if outcome.attempts > 1),
+            'elapsed': elapsed,
+            'per_second': len(outcomes) / elapsed if elapsed else None,
+            'latency_p50': percentile(0.5),
+            'latency_p95': percentile(0.95),
+            'latency_max': latencies[-1] if latencies else None
+        }
+
+    def report(self):
+        """Get a summary of the run that can be logged or written out as JSON
+
+        :return: the stats, and the key, status code and error of every failure
+        :rtype: dict
+        """
+        return {
+            'stats': self.stats(),
+            'failures': [outcome.checkpoint_entry() for outcome in self.failed]
+        }
+
+    @property
+    def values(self):
+        """The results of the records that succeeded"""
+        return [outcome.value for outcome in self.succeeded]
+
+
+class BulkRecordResult(object):
+    """The outcome of one record of a bulk run"""
+
+    def __init__(self, index, key, record, value=None, error=None, attempts=1, elapsed=0):
+        # Position of the record in the input
+        self.index = index
+        self.key = key
+        self.record = record
+
+        # What the operation returned, if it succeeded
+        self.value = value
+
+        # What it raised, if it failed; usually an OktaError
+        self.error = error
+
+        # How many times the operation was tried, and how long that took in all
+        self.attempts = attempts
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def error_causes(self):
+        """The error causes Okta gave for a failure, if any"""
+        return getattr(self.error, 'error_causes', None)
+
+    def checkpoint_entry(self):
+        if self.ok:
+            return {'key': self.key, 'ok': True, 'id': getattr(self.value, 'id', None)}
+        return {'key': self.key, 'ok': False, 'error': str(self.error),
+                'status_code': getattr(self.error, 'status_code', None),
+                'error_causes': self.error_causes}
@@ -0,0 +1,212 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class Cache(object):
+    """A thread-safe, size-bounded LRU cache whose entries expire after a time to live
+
+    Clients given one read through it for lookups and drop the entries
+    their own writes make stale. One cache can be shared by every client
+    talking to an org (and by every thread), so writes made through one
+    client invalidate lookups cached by another.
+
+    Cached models are shared by everyone reading them, so treat them as
+    read-only, or copy them before changing them.
+
+    An entry can carry the ETag it was served with. Expired entries with an
+    ETag are kept (until evicted) so clients can revalidate them with a
+    conditional request instead of fetching and decoding them again.
+
+    Keys that name the same thing, like a user's id and login, can be
+    linked, so a client invalidating one can find the others.
+    """
+
+    # Returned by get when a key isn't cached, as None can be a cached value
+    MISSING = object()
+
+    def __init__(self, max_size=10000, ttl=300):
+        """
+        :param max_size: number of entries kept before the least recently used ones are evicted
+        :type max_size: int
+        :param ttl: seconds an entry is served before it has to be fetched again
+        :type ttl: float
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+        # Each linked key mapped to the keys it is linked with, least recently used first
+        self.__links = OrderedDict()
+
+    def get(self, key):
+        """Get a cached value, counting the lookup as a hit or a miss
+
+        :param key: the key
+        :type key: tuple
+        :return: the value, or Cache.MISSING
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None and entry[2] is None:
+                    # Expired, and can't be revalidated
+                    del self.__entries[key]
+                self.misses += 1
+                return Cache.MISSING
+            # Re-inserted as the most recently used
+            del self.__entries[key]
+            self.__entries[key] = entry
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, key):
+        """Get a value and its ETag, even if it has expired, so it can be revalidated
+
+        :param key: the key
+        :type key: tuple
+        :return: the value and its ETag, or (Cache.MISSING, None)
+        :rtype: tuple
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return Cache.MISSING, None
+            return entry[1], entry[2]
+
+    def peek(self, key):
+        """Get a cached value without counting the lookup or refreshing its place
+
+        :param key: the key
+        :type key: tuple
+        :return: the value, or Cache.MISSING
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                return Cache.MISSING
+            return entry[1]
+
+    def set(self, key, value, ttl=None, etag=None):
+        """Cache a value, evicting the least recently used entries if the cache is full
+
+        :param key: the key
+        :type key: tuple
+        :param value: the value
+        :param ttl: seconds the entry lives, instead of the cache's ttl
+        :type ttl: float or None
+        :param etag: the ETag the value was served with
+        :type etag: str or None
+        """
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        with self.__lock:
+            self.__entries.pop(key, None)
+            self.__entries[key] = (expires, value, etag)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def renew(self, key, ttl=None):
+        """Restart the time to live of an entry the server has confirmed is unchanged
+
+        :param key: the key
+        :type key: tuple
+        :param ttl: seconds the entry lives, instead of the cache's ttl
+        :type ttl: float or None
+        """
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if entry is not None:
+                self.__entries[key] = (expires, entry[1], entry[2])
+                self.revalidations += 1
+
+    def invalidate(self, *keys):
+        """Drop cached entries
+
+        :param keys: the keys of the entries
+        """
+        with self.__lock:
+            for key in keys:
+                self.__entries.pop(key, None)
+
+    def invalidate_where(self, predicate):
+        """Drop every cached entry whose key matches
+
+        :param predicate: called with each key, returns whether to drop it
+        :type predicate: function
+        """
+        with self.__lock:
+            for key in [key for key in self.__entries if predicate(key)]:
+                del self.__entries[key]
+
+    def link(self, *keys):
+        """Record that keys name the same thing, joining any keys they were already linked with
+
+        Links outlive the entries cached under their keys, and the least
+        recently used are dropped once twice max_size keys are linked.
+
+        :param keys: the keys
+        """
+        with self.__lock:
+            linked = set(keys)
+            for key in keys:
+                linked.update(self.__links.pop(key, ()))
+            linked = frozenset(linked)
+            for key in linked:
+                self.__links.pop(key, None)
+                self.__links[key] = linked
+            while len(self.__links) > 2 * self.max_size:
+                # Dropped with every key it is linked with, as they were last used together
+                for key in self.__links.popitem(last=False)[1]:
+                    self.__links.pop(key, None)
+
+    def linked(self, key):
+        """Get the keys linked with a key, counting as a use of them
+
+        :param key: the key
+        :type key: tuple
+        :return: the linked keys, including the key itself
+        :rtype: frozenset of tuple
+        """
+        with self.__lock:
+            linked = self.__links.get(key)
+            if linked is None:
+                return frozenset([key])
+            for linked_key in linked:
+                # Re-inserted as the most recently used
+                self.__links[linked_key] = self.__links.pop(linked_key)
+            return linked
+
+    def clear(self):
+        """Drop every cached entry, and every link"""
+        with self.__lock:
+            self.__entries.clear()
+            self.__links.clear()
+
+    def stats(self):
+        """Get the cache's size and hit/miss counters
+
+        :rtype: dict
+        """
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.__entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'revalidations': self.revalidations,
+                'hit_rate': float(self.hits) / lookups if lookups else None
+            }
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__entries)
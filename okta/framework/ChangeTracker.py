@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import six
+
+from okta.framework.Deserializer import Deserializer
+from okta.framework.Utils import Utils
+
+
+class ChangeTracker(object):
+    """Finds the attributes of a decoded model that were changed after it was decoded
+
+    A client created with ``track_changes=True`` has the Deserializer keep
+    the parsed JSON each model object was decoded from in its ``_original``
+    attribute, which the Serializer never sends. Comparing an object with it
+    gives the fields a partial update has to send, rather than the whole
+    object with every unchanged attribute and read-only timestamp. The JSON
+    stays alive as long as the object does, which for a large directory
+    held in memory can nearly double its size, so tracking is opt-in.
+
+    Models decoded without tracking, models built in code and slot-based
+    models have nothing to compare with, so they aren't tracked.
+    """
+
+    @staticmethod
+    def is_tracked(obj):
+        """Whether an object was decoded, so its changes can be found
+
+        :param obj: a model object
+        :rtype: bool
+        """
+        return '_original' in getattr(obj, '__dict__', ())
+
+    @staticmethod
+    def changes(obj):
+        """Get the fields of a decoded model that changed since it was decoded
+
+        Nested models are compared field by field, so a changed profile
+        attribute gives just that attribute. A nested model that was replaced
+        by one built in code is given whole, and an attribute set to None is
+        given as None, so a partial update clears it. Lists and dicts are
+        decoded as copies of the JSON, so changes made to them in place are
+        found too, and given whole.
+
+        :param obj: a model object
+        :return: the changed fields by their JSON names, or None if the object isn't tracked
+        :rtype: dict or None
+        """
+        if not ChangeTracker.is_tracked(obj):
+            return None
+
+        values = obj.__dict__
+        original = values['_original']
+        lazy = values.get('_lazy') or {}
+        alt_names = getattr(type(obj), 'alt_names', {})
+        changed = {}
+
+        for key, attr_type in six.iteritems(ChangeTracker.__types(obj)):
+            attr = alt_names.get(key, key)
+            if attr in lazy and attr not in values:
+                # Never read or assigned, so never changed
+                continue
+
+            value = getattr(obj, attr, None)
+            raw = original.get(key)
+            if ChangeTracker.is_tracked(value):
+                if value.__dict__['_original'] is raw:
+                    nested = ChangeTracker.changes(value)
+                    if nested:
+                        changed[key] = nested
+                    continue
+            elif ChangeTracker.__equal(value, raw, attr_type):
+                continue
+            changed[key] = value
+
+        return changed
+
+    @staticmethod
+    def is_dirty(obj):
+        """Whether a decoded model has been changed since it was decoded
+
+        :param obj: a model object
+        :rtype: bool
+        """
+        return bool(ChangeTracker.changes(obj))
+
+    @staticmethod
+    def __types(obj):
+        types = getattr(obj, 'types', None)
+        if types is not None:
+            return types
+        # Models without types are decoded as strings
+        return dict((k, str) for k in obj.__dict__ if not k.startswith('_'))
+
+    @staticmethod
+    def __equal(value, raw, attr_type):
+        if value is None:
+            # Empty values are never decoded, so they read as None
+            return not raw
+        if attr_type == datetime and isinstance(value, datetime) and isinstance(raw, six.string_types):
+            return value == Deserializer.parse_timestamp(raw)
+        if hasattr(value, '__dict__') or hasattr(value, '__slots__'):
+            # A model that wasn't decoded from this JSON; only an empty one matches empty JSON
+            return not raw and not Utils.remove_nulls(Utils.model_attributes(value))
+        return value == raw
@@ -0,0 +1,98 @@
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+
+class ConcurrentPager(object):
+    """Pages through many listings at once on a pool of worker threads, yielding records as they arrive
+
+    Each listing (e.g. the members of one group) is paged through by one
+    worker, following its next links; listings are spread over the
+    workers, so one large listing doesn't hold up the small ones. Records
+    are handed to the caller a page at a time, as soon as the page is
+    decoded, tagged with the key of their listing. Up to ``2 * workers``
+    pages wait for the caller, after which the workers wait too.
+
+    If a listing fails, its error is raised to the caller and the other
+    workers stop. Call :meth:`close` when stopping early, so they stop too.
+    """
+
+    # How often a waiting worker checks whether it was closed
+    POLL_INTERVAL = 0.1
+
+    DEFAULT_WORKERS = 4
+
+    __END = object()
+
+    def __init__(self, get_page, listings, workers=DEFAULT_WORKERS):
+        """
+        :param get_page: called with a listing's params for its first page, and with url= for the next ones
+        :type get_page: function
+        :param listings: the key and the get_page params of each listing
+        :type listings: iterable of (key, dict)
+        :param workers: number of listings paged through at once
+        :type workers: int
+        """
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+
+        self.__get_page = get_page
+        self.__listings = iter(listings)
+        self.__listings_lock = threading.Lock()
+        self.__pages = queue.Queue(maxsize=workers * 2)
+        self.__closed = threading.Event()
+        self.__workers = [threading.Thread(target=self.__fetch, name='okta-pager-{0}'.format(n))
+                          for n in range(workers)]
+        for worker in self.__workers:
+            worker.daemon = True
+            worker.start()
+
+    def __iter__(self):
+        running = len(self.__workers)
+        try:
+            while running:
+                key, records, error = self.__pages.get()
+                if error is not None:
+                    six.reraise(*error)
+                if records is ConcurrentPager.__END:
+                    running -= 1
+                    continue
+                for record in records:
+                    yield key, record
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop paging; pages already being fetched are thrown away"""
+        self.__closed.set()
+
+    def __next_listing(self):
+        with self.__listings_lock:
+            return next(self.__listings, None)
+
+    def __fetch(self):
+        try:
+            listing = self.__next_listing()
+            while listing is not None and not self.__closed.is_set():
+                key, params = listing
+                page = self.__get_page(**params)
+                while True:
+                    if not self.__put((key, page.result, None)) or page.is_last_page():
+                        break
+                    page = self.__get_page(url=page.next_url)
+                listing = self.__next_listing()
+        except Exception:
+            self.__put((None, None, sys.exc_info()))
+            return
+        self.__put((None, ConcurrentPager.__END, None))
+
+    def __put(self, item):
+        while not self.__closed.is_set():
+            try:
+                self.__pages.put(item, timeout=ConcurrentPager.POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
@@ -1 +1,295 @@
+import copy
+import re
+import types
+import dateutil.parser
+import dateutil.tz
+from datetime import datetime
+import six
+
 __author__ = 'lboyette'
+
+_PRIMITIVES = (str, int, dict, bool)
+
+# The timestamp format Okta emits, e.g. 2020-01-01T00:00:00.000Z
+_OKTA_TIMESTAMP = re.compile(r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?Z\Z')
+_UTC = dateutil.tz.tzutc()
+
+
+class Deserializer(object):
+    """Decodes parsed JSON into model objects
+
+    The first time a model class is decoded, its ``types``, ``dict_types``
+    and ``alt_names`` tables are compiled into a field map that says, for
+    each JSON key, which attribute it lands in and how its value is
+    converted. The decode function built around that map is cached per
+    class, so the reflection happens once per class rather than once per
+    object.
+
+    Model classes that change their tables after their first instance has
+    been created (rather than at class level) must call :meth:`clear`
+    afterwards.
+
+    Timestamps are decoded according to one of the TIMESTAMP_MODES:
+
+    * ``parse`` turns them into datetimes up front
+    * ``lazy`` keeps the string and parses it the first time the attribute
+      is read; objects are then instances of a subclass of the model class
+    * ``raw`` leaves them as the strings Okta sent
+
+    With ``track``, every object with a ``__dict__`` keeps the JSON it was
+    decoded from in its ``_original`` attribute, so the ChangeTracker can
+    tell which of its attributes were changed afterwards. That keeps the
+    JSON alive for as long as the object, so it is off by default.
+
+    Lazy decoding keeps the JSON of nested models (and timestamps, unless
+    they are left raw) on the object and only decodes a field the first
+    time its attribute is read, which saves most of the work for listings
+    where a few attributes of each record are used.
+    """
+
+    TIMESTAMP_MODES = ('parse', 'lazy', 'raw')
+
+    __decoders = {}
+
+    @staticmethod
+    def decode(data, to_class, timestamps='parse', lazy=False, track=False):
+        """Decode a parsed JSON object, or list of objects, into to_class
+
+        :param data: the parsed JSON
+        :type data: dict or list
+        :param to_class: the model class to decode into
+        :param timestamps: how timestamps are decoded, one of TIMESTAMP_MODES
+        :type timestamps: str
+        :param lazy: whether nested models and timestamps are decoded on first read
+        :type lazy: bool
+        :param track: whether objects keep the JSON they were decoded from, for the ChangeTracker
+        :type track: bool
+        :rtype: to_class or list of to_class
+        """
+        return Deserializer.decoder_for(to_class, timestamps, lazy, track)(data)
+
+    @staticmethod
+    def decoder_for(to_class, timestamps='parse', lazy=False, track=False):
+        """Get the cached decode function of a model class, compiling it on first use
+
+        :param to_class: the model class to decode into
+        :param timestamps: how timestamps are decoded, one of TIMESTAMP_MODES
+        :type timestamps: str
+        :param lazy: whether nested models and timestamps are decoded on first read
+        :type lazy: bool
+        :param track: whether objects keep the JSON they were decoded from, for the ChangeTracker
+        :type track: bool
+        :rtype: function
+        """
+        key = (to_class, timestamps, lazy, track)
+        decoder = Deserializer.__decoders.get(key)
+        if decoder is None:
+            if timestamps not in Deserializer.TIMESTAMP_MODES:
+                raise ValueError('timestamps must be one of {0}'.format(', '.join(Deserializer.TIMESTAMP_MODES)))
+            decoder = Deserializer.__compile(to_class, timestamps, lazy, track)
+            Deserializer.__decoders[key] = decoder
+        return decoder
+
+    @staticmethod
+    def parse_timestamp(value):
+        """Parse an Okta timestamp, falling back to dateutil for anything in another format
+
+        :param value: the timestamp, e.g. 2020-01-01T00:00:00.000Z
+        :type value: str
+        :rtype: datetime
+        """
+        match = _OKTA_TIMESTAMP.match(value)
+        if match is None:
+            return dateutil.parser.parse(value)
+
+        year, month, day, hour, minute, second, fraction = match.groups()
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                        int(fraction.ljust(6, '0')) if fraction else 0, _UTC)
+
+    @staticmethod
+    def materialize(obj):
+        """Decode every attribute of a lazily decoded object that hasn't been read yet
+
+        :param obj: a model object
+        """
+        values = obj.__dict__
+        lazy = values.get('_lazy')
+        if not lazy:
+            return
+        for attr in list(lazy):
+            if attr in values:
+                # Assigned before it was ever read
+                lazy.pop(attr, None)
+            else:
+                getattr(obj, attr)
+
+    @staticmethod
+    def clear():
+        """Forget every compiled decoder, so changed model tables are picked up"""
+        Deserializer.__decoders.clear()
+
+    @staticmethod
+    def __compile(to_class, timestamps, lazy, track):
+        # Some models (like the ExtendedUser example) fill in their tables from __init__,
+        # so let one instance be built before reading them
+        sample = to_class()
+
+        has_dict = hasattr(sample, '__dict__')
+        tracked = track and has_dict
+        if not has_dict:
+            # Slot-based models have nowhere to keep undecoded values, so they are always decoded eagerly
+            lazy = False
+            timestamps = 'parse' if timestamps == 'lazy' else timestamps
+
+        fields = Deserializer.__field_map(to_class, timestamps, lazy, track)
+        lazy_attrs = [(attr, convert) for attr, convert, skip_empty, lazy in six.itervalues(fields) if lazy]
+        new_class = Deserializer.__lazy_class(to_class, lazy_attrs) if lazy_attrs else to_class
+
+        def decode_object(data):
+            obj = new_class()
+            if tracked:
+                obj._original = data
+            for key, val in data.items():
+                field = fields.get(key)
+                if field is None:
+                    continue
+
+                attr, convert, skip_empty, lazy = field
+                if not val and skip_empty:
+                    continue
+                if lazy:
+                    # Left for the class's _LazyAttribute to decode when it is first read
+                    values = obj.__dict__
+                    values.setdefault('_lazy', {})[attr] = val
+                    values.pop(attr, None)
+                    continue
+                if convert is not None:
+                    val = convert(val)
+                elif tracked and isinstance(val, (dict, list)):
+                    # Copied, so changes made to it in place show against _original
+                    val = copy.deepcopy(val)
+                setattr(obj, attr, val)
+            return obj
+
+        def decode(data):
+            if isinstance(data, list):
+                return [decode(item) for item in data]
+            if not data:
+                return to_class()
+            return decode_object(data)
+
+        return decode
+
+    @staticmethod
+    def __field_map(to_class, timestamps, lazy, track):
+        """Map each JSON key to (attribute name, value converter, whether empty values are skipped, whether lazy)"""
+        alt_names = getattr(to_class, 'alt_names', {})
+        fields = {}
+
+        if hasattr(to_class, 'types'):
+            for key, attr_type in six.iteritems(to_class.types):
+                if attr_type == datetime:
+                    convert = None if timestamps == 'raw' else Deserializer.parse_timestamp
+                    deferred = timestamps == 'lazy' or (lazy and timestamps == 'parse')
+                elif attr_type in _PRIMITIVES:
+                    convert = None
+                    deferred = False
+                else:
+                    convert = Deserializer.__model_converter(attr_type, timestamps, lazy, track)
+                    deferred = lazy
+                fields[key] = (alt_names.get(key, key), convert, True, deferred)
+
+        # Otherwise, assume all the properties are strings
+        else:
+            for key in to_class.__dict__:
+                fields[key] = (alt_names.get(key, key), None, False, False)
+
+        # Some models have dicts as values
+        for key, attr_type in six.iteritems(getattr(to_class, 'dict_types', {})):
+            fields[key] = (alt_names.get(key, key), Deserializer.__model_map_converter(attr_type, timestamps, lazy, track),
+                           False, lazy)
+
+        return fields
+
+    @staticmethod
+    def __lazy_class(to_class, lazy_attrs):
+        """Subclass to_class with a _LazyAttribute for each attribute that is decoded on first read"""
+        namespace = dict((attr, _LazyAttribute(attr, convert)) for attr, convert in lazy_attrs)
+        namespace['__module__'] = to_class.__module__
+
+        def __reduce_ex__(self, protocol):
+            # The subclass is made at runtime, so pickle can't find it by name; the object is
+            # decoded whole and pickled as the model class instead
+            Deserializer.materialize(self)
+            state = dict(self.__dict__)
+            state.pop('_lazy', None)
+            return _restore, (to_class, state)
+
+        namespace['__reduce_ex__'] = __reduce_ex__
+
+        # The models are classic classes on Python 2, and descriptors only work on new-style ones
+        bases = (to_class,) if issubclass(to_class, object) else (to_class, object)
+        return type(to_class.__name__, bases, namespace)
+
+    @staticmethod
+    def __model_converter(attr_type, timestamps, lazy, track):
+        # Nested decoders are looked up when first needed, since models can refer to each other
+        decoders = Deserializer.__decoders
+        key = (attr_type, timestamps, lazy, track)
+
+        def convert(val):
+            decode = decoders.get(key) or Deserializer.decoder_for(attr_type, timestamps, lazy, track)
+            return decode(val)
+        return convert
+
+    @staticmethod
+    def __model_map_converter(attr_type, timestamps, lazy, track):
+        convert_value = Deserializer.__model_converter(attr_type, timestamps, lazy, track)
+
+        def convert(val):
+            return dict((k, convert_value(v)) for k, v in six.iteritems(val))
+        return convert
+
+
+def _restore(cls, state):
+    """Rebuild a pickled lazily decoded object as an instance of its model class"""
+    if isinstance(cls, type):
+        obj = cls.__new__(cls)
+    else:
+        # A classic class, on Python 2
+        obj = types.InstanceType(cls)
+    obj.__dict__.update(state)
+    return obj
+
+
+class _LazyAttribute(object):
+    """Decodes an attribute's raw JSON value the first time it is read
+
+    Being a non-data descriptor, it is only consulted while the instance
+    has no value of its own; the decoded value is stored on the instance,
+    so later reads never reach it again.
+    """
+
+    MISSING = object()
+
+    def __init__(self, attr, convert):
+        self.attr = attr
+        self.convert = convert
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+
+        values = obj.__dict__
+        raw = (values.get('_lazy') or {}).get(self.attr, _LazyAttribute.MISSING)
+        if raw is _LazyAttribute.MISSING:
+            # Another thread may have decoded it since this read began
+            if self.attr in values:
+                return values[self.attr]
+            raise AttributeError(self.attr)
+
+        # Stored before the raw value is dropped, so a concurrent read finds one or the other
+        val = self.convert(raw) if self.convert is not None else raw
+        values[self.attr] = val
+        values['_lazy'].pop(self.attr, None)
+        return val
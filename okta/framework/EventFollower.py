@@ -0,0 +1,175 @@
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+
+import dateutil.tz
+import six
+
+from okta.framework.Deserializer import Deserializer
+from okta.framework.Serializer import Serializer
+
+
+class EventFollower(object):
+    """Tails the event log, yielding each new event once, as soon after it is published as the polling allows
+
+    The follower keeps a cursor of the latest published timestamp it has
+    seen, and each poll lists the events published after it, following
+    next links until the listing is used up. Events published at the same
+    moment can straddle two polls, and Okta's listings are eventually
+    consistent, so each poll reaches back ``overlap`` seconds before the
+    cursor; the events within that window are recognised by their ids and
+    not yielded again.
+
+    Polls that find events are followed by another after ``min_interval``
+    seconds; each poll that finds none waits ``backoff`` times longer, and
+    at least ``IDLE_INTERVAL``, up to ``max_interval``, which bounds how
+    late an event can be yielded.
+
+    It runs until :meth:`stop` is called, from another thread or between
+    events. To resume where it stopped, start the next one from its
+    ``published`` cursor.
+    """
+
+    MIN_INTERVAL = 1
+    MAX_INTERVAL = 30
+    BACKOFF = 2
+
+    # The shortest wait after a poll that finds no events, so a min_interval of 0 still backs off
+    IDLE_INTERVAL = 0.5
+
+    # How far before the cursor each poll reaches back, in seconds
+    OVERLAP = 5
+
+    def __init__(self, client, start_date=None, filter_string=None, limit=None, min_interval=MIN_INTERVAL,
+                 max_interval=MAX_INTERVAL, backoff=BACKOFF, overlap=OVERLAP):
+        """
+        :param client: the client events are listed with
+        :type client: EventsClient
+        :param start_date: when the events to follow start, now by default; naive datetimes are taken as UTC
+        :type start_date: datetime or str or None
+        :param filter_string: a filter every poll is limited to, e.g. 'target.id eq "00u1"'
+        :type filter_string: str or None
+        :param limit: events fetched per page
+        :type limit: int or None
+        :param min_interval: seconds between polls while events are arriving
+        :type min_interval: float
+        :param max_interval: the longest wait between polls while none are
+        :type max_interval: float
+        :param backoff: how much longer each poll that finds no events waits
+        :type backoff: float
+        :param overlap: seconds each poll reaches back before the cursor
+        :type overlap: float
+        """
+        if min_interval < 0 or max_interval < min_interval:
+            raise ValueError('intervals must satisfy 0 <= min_interval <= max_interval')
+        if backoff < 1:
+            raise ValueError('backoff must be at least 1')
+        if isinstance(start_date, six.string_types):
+            start_date = Deserializer.parse_timestamp(start_date)
+        elif start_date is not None and start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=dateutil.tz.tzutc())
+
+        self.client = client
+        self.filter_string = filter_string
+        self.limit = limit
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.overlap = overlap
+
+        # The latest published timestamp seen, and the id of the last event yielded
+        self.published = start_date or datetime.now(dateutil.tz.tzutc())
+        self.last_event_id = None
+
+        # How long the follower waits before its next poll
+        self.interval = min_interval
+
+        self.polls = 0
+        self.yielded = 0
+
+        # Ids of the events yielded within the overlap, oldest first
+        self.__recent = deque()
+        self.__recent_ids = set()
+        self.__stopped = threading.Event()
+
+    def __iter__(self):
+        while not self.__stopped.is_set():
+            for event in self.poll():
+                yield event
+                if self.__stopped.is_set():
+                    return
+            self.__stopped.wait(self.interval)
+
+    def poll(self):
+        """Yield the events published since the last poll, and work out how long to wait before the next one
+
+        :rtype: generator of Event
+        """
+        found = 0
+        for event in self.client.iter_events(limit=self.limit, filter_string=self.poll_filter()):
+            if self.accept(event):
+                found += 1
+                yield event
+        self.polled(found)
+
+    def poll_filter(self):
+        """Get the filter of the next poll, the events published since the cursor less the overlap
+
+        :rtype: str
+        """
+        since = self.published - timedelta(seconds=self.overlap)
+        published = 'published gt "{0}"'.format(Serializer.format_filter_timestamp(since))
+        if self.filter_string:
+            return '({0}) and {1}'.format(self.filter_string, published)
+        return published
+
+    def accept(self, event):
+        """Move the cursor past an event, and tell whether it is new
+
+        :param event: an event listed by a poll
+        :type event: Event
+        :return: False if the event was already yielded
+        :rtype: bool
+        """
+        event_id = getattr(event, 'eventId', None) or getattr(event, 'id', None)
+        if event_id in self.__recent_ids:
+            return False
+
+        published = getattr(event, 'published', None)
+        if isinstance(published, six.string_types):
+            # Decoded with timestamps='raw'
+            published = Deserializer.parse_timestamp(published)
+        if published is None:
+            published = self.published
+        elif published > self.published:
+            self.published = published
+            self.__forget_before(published - timedelta(seconds=self.overlap))
+
+        if event_id is not None:
+            self.__recent.append((published, event_id))
+            self.__recent_ids.add(event_id)
+        self.last_event_id = event_id
+        self.yielded += 1
+        return True
+
+    def polled(self, found):
+        """Set the wait before the next poll from how many new events the last one found
+
+        :param found: the number of new events
+        :type found: int
+        """
+        self.polls += 1
+        if found:
+            self.interval = self.min_interval
+        else:
+            waited = max(self.interval * self.backoff, EventFollower.IDLE_INTERVAL)
+            self.interval = min(self.max_interval, max(self.min_interval, waited))
+
+    def stop(self):
+        """Stop following; a wait between polls is cut short"""
+        self.__stopped.set()
+
+    def __forget_before(self, moment):
+        # Events older than the overlap can't be listed again
+        while self.__recent and self.__recent[0][0] < moment:
+            self.__recent_ids.discard(self.__recent.popleft()[1])
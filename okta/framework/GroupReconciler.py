@@ -0,0 +1,184 @@
+import os
+import time
+
+import six
+
+from okta.framework.BulkExecutor import BulkExecutor
+from okta.framework.RetryPolicy import RetryPolicy
+
+
+class GroupReconciler(object):
+    """Brings the members of groups in line with the members they should have, making only the changes needed
+
+    The current members of every group given are listed concurrently, and
+    compared with the desired ones as sets: users desired but missing are
+    added, and users present but not desired are removed. Groups that
+    aren't given are left alone, and a group given an empty set has every
+    member removed.
+
+    The members are listed, and the changes made by a pool of workers,
+    paced by the client's RateLimiter, or by one made for the run if it has
+    none. Adding and removing a member are safe to repeat, so a change that
+    failed with a server or connection error is retried. With ``dry_run``
+    the changes are worked out and reported but not made.
+
+    The checkpoint only resumes a run that was interrupted: it is removed
+    once every change has been tried, since the next run plans from the
+    membership as it is then, and may need the same changes again.
+    """
+
+    ADD = 'add'
+    REMOVE = 'remove'
+
+    def __init__(self, groups_client, workers=BulkExecutor.DEFAULT_WORKERS, checkpoint=None, retry_policy=None):
+        """
+        :param groups_client: the client members are listed and changed with
+        :type groups_client: UserGroupsClient
+        :param workers: number of groups listed, and of changes made, at once
+        :type workers: int
+        :param checkpoint: path of a file to record changes in, and to resume an interrupted run from
+        :type checkpoint: str or None
+        :param retry_policy: how failed changes are retried, RetryPolicy() by default
+        :type retry_policy: RetryPolicy or None
+        """
+        self.client = groups_client
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    def plan(self, desired, limit=None):
+        """Work out the changes that would bring the groups in line, without making them
+
+        :param desired: the ids of the users each group should have, by group id
+        :type desired: dict of str to iterable of str
+        :param limit: number of members fetched per page
+        :type limit: int or None
+        :rtype: ReconcileResult
+        """
+        return self.__plan(self.client.paced(), desired, limit)
+
+    def run(self, desired, dry_run=False, limit=None):
+        """Bring the groups in line, adding and removing only the members that differ
+
+        :param desired: the ids of the users each group should have, by group id
+        :type desired: dict of str to iterable of str
+        :param dry_run: whether to only work out and report the changes
+        :type dry_run: bool
+        :param limit: number of members fetched per page
+        :type limit: int or None
+        :rtype: ReconcileResult
+        """
+        # The listing and the changes share one pace
+        client = self.client.paced()
+        result = self.__plan(client, desired, limit)
+        result.dry_run = dry_run
+        if not dry_run and (result.additions or result.removals):
+            result.applied = self.__apply(client, result.changes())
+        result.finished = time.time()
+        return result
+
+    def apply(self, changes):
+        """Make changes, collecting each one's outcome instead of raising
+
+        :param changes: the action, group id and user id of each change
+        :type changes: iterable of (str, str, str)
+        :return: the outcomes keyed like 'add 00g1 00u1'
+        :rtype: BulkResult
+        """
+        return self.__apply(self.client.paced(), changes)
+
+    def __plan(self, client, desired, limit):
+        result = ReconcileResult()
+        result.started = time.time()
+        desired = dict((gid, set(uids)) for gid, uids in six.iteritems(desired))
+        current = dict((gid, set()) for gid in desired)
+
+        workers = min(self.workers, len(desired)) or 1
+        for gid, user in client.iter_members_of_groups(list(desired), limit=limit, workers=workers):
+            current[gid].add(user.id)
+
+        for gid in desired:
+            additions = desired[gid] - current[gid]
+            removals = current[gid] - desired[gid]
+            if additions:
+                result.additions[gid] = sorted(additions)
+            if removals:
+                result.removals[gid] = sorted(removals)
+            result.groups += 1
+            result.members += len(current[gid])
+        return result
+
+    def __apply(self, client, changes):
+        def change(record):
+            action, gid, uid = record
+            if action == GroupReconciler.ADD:
+                return client.add_user_to_group_by_id(gid, uid)
+            return client.remove_user_from_group_by_id(gid, uid)
+
+        executor = BulkExecutor(self.workers, self.checkpoint, self.retry_policy)
+        applied = executor.run(changes, change, key=lambda record: ' '.join(record))
+        if self.checkpoint and os.path.exists(self.checkpoint):
+            # Every change was tried, so there is nothing left to resume
+            os.remove(self.checkpoint)
+        return applied
+
+
+class ReconcileResult(object):
+    """The changes a GroupReconciler run worked out, and how making them went"""
+
+    def __init__(self):
+        # Ids of the users to add, and to remove, by group id; groups without changes are left out
+        self.additions = {}
+        self.removals = {}
+
+        # Number of groups compared, and of the members they had
+        self.groups = 0
+        self.members = 0
+
+        # Whether the changes were only worked out
+        self.dry_run = False
+
+        # BulkResult of the changes made, None if none were
+        self.applied = None
+
+        # When the run started and finished, as epoch seconds
+        self.started = None
+        self.finished = None
+
+    def changes(self):
+        """Get every change, removals after additions
+
+        :return: the action, group id and user id of each change
+        :rtype: list of (str, str, str)
+        """
+        changes = []
+        for action, members in ((GroupReconciler.ADD, self.additions), (GroupReconciler.REMOVE, self.removals)):
+            for gid in sorted(members):
+                changes.extend((action, gid, uid) for uid in members[gid])
+        return changes
+
+    @property
+    def failed(self):
+        """BulkRecordResults of the changes that failed"""
+        return self.applied.failed if self.applied is not None else []
+
+    def summary(self):
+        """Get the number of groups, additions and removals, and of the changes that were made
+
+        :rtype: dict
+        """
+        to_add = sum(len(uids) for uids in six.itervalues(self.additions))
+        to_remove = sum(len(uids) for uids in six.itervalues(self.removals))
+        made = [outcome.record for outcome in self.applied.succeeded] if self.applied is not None else []
+        return {
+            'groups': self.groups,
+            'groups_changed': len(set(self.additions) | set(self.removals)),
+            'members': self.members,
+            'to_add': to_add,
+            'to_remove': to_remove,
+            'added': sum(1 for action, gid, uid in made if action == GroupReconciler.ADD),
+            'removed': sum(1 for action, gid, uid in made if action == GroupReconciler.REMOVE),
+            'failed': len(self.failed),
+            'dry_run': self.dry_run,
+            'elapsed': (self.finished or time.time()) - self.started if self.started else 0
+        }
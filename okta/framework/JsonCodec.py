@@ -0,0 +1,134 @@
+import json
+import threading
+
+import six
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+class JsonCodec(object):
+    """Encodes request bodies and decodes response bodies with a pluggable JSON library
+
+    The BACKENDS are tried in order, so orjson is used when it is installed,
+    then ujson, then the standard library's json. Bodies are decoded
+    straight from the bytes received, which spares decoding them into a
+    string first. Request bodies are first turned into plain JSON types in
+    one pass by the Serializer's compiled encoders, so they are converted
+    with the same rules whichever backend is used, and the backend then
+    writes them straight to UTF-8 bytes without calling back into Python.
+    """
+
+    BACKENDS = ('orjson', 'ujson', 'json')
+
+    __default = None
+    __default_lock = threading.Lock()
+
+    def __init__(self, backend=None):
+        """
+        :param backend: one of BACKENDS, or None for the fastest one installed
+        :type backend: str or None
+        """
+        if backend is None:
+            backend = JsonCodec.available_backends()[0]
+        if backend not in JsonCodec.BACKENDS:
+            raise ValueError('backend must be one of {0}'.format(', '.join(JsonCodec.BACKENDS)))
+        if backend not in JsonCodec.available_backends():
+            raise ImportError('{0} is not installed: pip install {0}'.format(backend))
+
+        self.backend = backend
+        self.__loads, self.__dumps = getattr(self, '_JsonCodec__' + backend)()
+
+    @staticmethod
+    def available_backends():
+        """Get the BACKENDS that are installed, fastest first
+
+        :rtype: list of str
+        """
+        installed = {'orjson': orjson is not None, 'ujson': ujson is not None, 'json': True}
+        return [backend for backend in JsonCodec.BACKENDS if installed[backend]]
+
+    @staticmethod
+    def default():
+        """Get the codec clients use unless they are given one
+
+        :rtype: JsonCodec
+        """
+        with JsonCodec.__default_lock:
+            if JsonCodec.__default is None:
+                JsonCodec.__default = JsonCodec()
+            return JsonCodec.__default
+
+    @staticmethod
+    def set_default(codec):
+        """Change the codec clients created from now on use unless they are given one
+
+        :param codec: the codec, a backend name, or None to go back to the fastest one installed
+        :type codec: JsonCodec or str or None
+        """
+        if codec is not None and not isinstance(codec, JsonCodec):
+            codec = JsonCodec(codec)
+        with JsonCodec.__default_lock:
+            JsonCodec.__default = codec
+
+    @staticmethod
+    def body(response):
+        """Get the raw bytes of a response's body, or its text when the bytes aren't available
+
+        :param response: the response
+        :rtype: bytes or str
+        """
+        content = getattr(response, 'content', None)
+        if isinstance(content, six.binary_type):
+            return content
+        return response.text
+
+    def loads(self, data):
+        """Decode a JSON document
+
+        :param data: the document
+        :type data: bytes or str
+        :rtype: dict or list
+        """
+        return self.__loads(data)
+
+    def dumps(self, obj):
+        """Encode an object, and any models inside it, as a compact JSON document
+
+        :param obj: the object to encode
+        :rtype: bytes
+        """
+        from okta.framework.Serializer import Serializer
+        return self.__dumps(Serializer.to_wire(obj))
+
+    @staticmethod
+    def __orjson():
+        options = orjson.OPT_NON_STR_KEYS
+
+        def dumps(obj):
+            return orjson.dumps(obj, option=options)
+        return orjson.loads, dumps
+
+    @staticmethod
+    def __ujson():
+        def dumps(obj):
+            return ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+        return ujson.loads, dumps
+
+    @staticmethod
+    def __json():
+        def loads(data):
+            if isinstance(data, six.binary_type):
+                data = data.decode('utf-8')
+            return json.loads(data)
+
+        def dumps(obj):
+            return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+        return loads, dumps
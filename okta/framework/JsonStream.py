@@ -0,0 +1,100 @@
+import codecs
+import json
+import re
+
+import requests
+import six
+
+
+class JsonStream(object):
+    """Decodes the items of a JSON array one at a time, as its bytes arrive
+
+    Only the items that haven't been handed out yet, plus one chunk, are
+    held in memory, rather than the whole body, its text and the decoded
+    list at once. Items are decoded with the standard library's
+    incremental decoder, as the faster JsonCodec backends can only decode
+    complete documents.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    _WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+    @staticmethod
+    def chunks(response, chunk_size=CHUNK_SIZE):
+        """Get the body of a response as a sequence of byte chunks
+
+        Responses requested with stream=True are read from the connection as
+        they are iterated; anything else yields the body it already holds.
+
+        :param response: the response
+        :param chunk_size: bytes read from the connection at a time
+        :type chunk_size: int
+        :rtype: iterable of bytes
+        """
+        if isinstance(response, requests.Response):
+            return response.iter_content(chunk_size)
+
+        body = response.content if isinstance(getattr(response, 'content', None), six.binary_type) else response.text
+        if isinstance(body, six.text_type):
+            body = body.encode('utf-8')
+        return [body] if body else []
+
+    @staticmethod
+    def iter_array(chunks):
+        """Yield the decoded items of a JSON array read from byte chunks
+
+        :param chunks: the UTF-8 encoded document
+        :type chunks: iterable of bytes
+        :rtype: generator
+        """
+        decoder = json.JSONDecoder()
+        text = codecs.getincrementaldecoder('utf-8')()
+        whitespace = JsonStream._WHITESPACE
+        buf = u''
+        pos = 0
+        opened = False
+
+        for chunk, final in JsonStream.__with_final(chunks):
+            buf = buf[pos:] + text.decode(chunk, final)
+            pos = 0
+            while True:
+                pos = whitespace.match(buf, pos).end()
+                if pos == len(buf):
+                    break
+
+                char = buf[pos]
+                if not opened:
+                    if char != '[':
+                        raise ValueError('Expected a JSON array, got {0!r}'.format(buf[pos:pos + 20]))
+                    opened = True
+                    pos += 1
+                    continue
+                if char == ']':
+                    return
+                if char == ',':
+                    pos += 1
+                    continue
+
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except ValueError:
+                    if final:
+                        raise
+                    # The item continues in the next chunk
+                    break
+                if end == len(buf) and not final and not isinstance(item, (dict, list)):
+                    # A number may continue in the next chunk
+                    break
+                pos = end
+                yield item
+
+        if opened or buf[pos:].strip():
+            raise ValueError('The JSON array ended early')
+
+    @staticmethod
+    def __with_final(chunks):
+        for chunk in chunks:
+            if chunk:
+                yield chunk, False
+        yield b'', True
@@ -0,0 +1,206 @@
+import bisect
+import threading
+from array import array
+
+import six
+
+from okta.framework.BulkExecutor import BulkExecutor
+
+
+class MembershipGraph(object):
+    """Group memberships held in memory, answering which users are in a group and which groups a user is in
+
+    Each user and group id is stored once and stands for a small integer.
+    Each group's members are kept as a sorted array of those integers, and
+    the reverse index, from each user to their groups, is built from them
+    the first time it is needed after a change. A membership costs a few
+    bytes each way, rather than an id string or a User object.
+
+    :meth:`crawl` builds a graph by listing groups and fetching their
+    members concurrently, so answering questions about thousands of groups
+    takes one pass over them instead of a call per question.
+    """
+
+    def __init__(self):
+        self.__user_ids = []
+        self.__user_numbers = {}
+        self.__group_ids = []
+        self.__group_numbers = {}
+        self.__members = {}
+        self.__groups_of = None
+        self.__lock = threading.Lock()
+
+        # BulkRecordResults of the groups whose members couldn't be fetched by crawl
+        self.failed = []
+
+    @staticmethod
+    def crawl(groups_client, groups=None, workers=BulkExecutor.DEFAULT_WORKERS, retry_policy=None):
+        """Build a graph from the members of every group, or of some groups
+
+        Members are fetched by a pool of workers, paced by the client's
+        RateLimiter, or by one made for the crawl if it has none. Groups whose
+        members couldn't be fetched are left out, and listed in ``failed``.
+
+        :param groups_client: the client groups and members are listed with
+        :type groups_client: UserGroupsClient
+        :param groups: the groups or group ids, every group by default
+        :type groups: iterable of UserGroup or str, or None
+        :param workers: number of groups fetched at once
+        :type workers: int
+        :param retry_policy: retries groups that failed with a server or connection error, if given
+        :type retry_policy: RetryPolicy or None
+        :rtype: MembershipGraph
+        """
+        groups_client = groups_client.paced()
+        if groups is None:
+            groups = groups_client.iter_groups()
+
+        graph = MembershipGraph()
+
+        def fetch_members(gid):
+            members = [user.id for user in groups_client.iter_group_users(gid)]
+            graph.add_group(gid, members)
+            return len(members)
+
+        def listed():
+            for group in groups:
+                gid = getattr(group, 'id', group)
+                # Numbered as listed, so the graph's order doesn't depend on which worker finished first
+                with graph.__lock:
+                    MembershipGraph.__number(gid, graph.__group_ids, graph.__group_numbers)
+                yield gid
+
+        result = BulkExecutor(workers, retry_policy=retry_policy).run(listed(), fetch_members, key=lambda gid: gid)
+        graph.failed = result.failed
+        return graph
+
+    def add_group(self, gid, member_ids):
+        """Add a group and its members, replacing what the graph held for the group
+
+        :param gid: the group id
+        :type gid: str
+        :param member_ids: the ids of its members
+        :type member_ids: iterable of str
+        """
+        with self.__lock:
+            group = self.__number(gid, self.__group_ids, self.__group_numbers)
+            users = sorted(set(self.__number(uid, self.__user_ids, self.__user_numbers) for uid in member_ids))
+            self.__members[group] = array('i', users)
+            self.__groups_of = None
+
+    def members_of(self, gid):
+        """Get the ids of a group's members
+
+        :param gid: the group id
+        :type gid: str
+        :rtype: list of str
+        """
+        return self.__user_list(self.__members.get(self.__group_numbers.get(gid), ()))
+
+    def groups_of(self, uid):
+        """Get the ids of the groups a user is in
+
+        :param uid: the user id
+        :type uid: str
+        :rtype: list of str
+        """
+        groups = self.__reverse_index().get(self.__user_numbers.get(uid), ())
+        return [self.__group_ids[group] for group in groups]
+
+    def is_member(self, uid, gid):
+        """Whether a user is in a group
+
+        :param uid: the user id
+        :type uid: str
+        :param gid: the group id
+        :type gid: str
+        :rtype: bool
+        """
+        user = self.__user_numbers.get(uid)
+        members = self.__members.get(self.__group_numbers.get(gid))
+        if user is None or members is None:
+            return False
+        position = bisect.bisect_left(members, user)
+        return position < len(members) and members[position] == user
+
+    def intersection(self, *gids):
+        """Get the ids of the users in every one of some groups
+
+        :param gids: the group ids
+        :rtype: list of str
+        """
+        member_lists = sorted((self.__members.get(self.__group_numbers.get(gid), ()) for gid in gids), key=len)
+        if not member_lists:
+            return []
+        users = set(member_lists[0])
+        for members in member_lists[1:]:
+            users.intersection_update(members)
+        return self.__user_list(sorted(users))
+
+    def union(self, *gids):
+        """Get the ids of the users in any of some groups
+
+        :param gids: the group ids
+        :rtype: list of str
+        """
+        users = set()
+        for gid in gids:
+            users.update(self.__members.get(self.__group_numbers.get(gid), ()))
+        return self.__user_list(sorted(users))
+
+    def common_groups(self, *uids):
+        """Get the ids of the groups every one of some users is in
+
+        :param uids: the user ids
+        :rtype: list of str
+        """
+        reverse = self.__reverse_index()
+        group_lists = [reverse.get(self.__user_numbers.get(uid), ()) for uid in uids]
+        if not group_lists:
+            return []
+        groups = set(group_lists[0])
+        for group_list in group_lists[1:]:
+            groups.intersection_update(group_list)
+        return [self.__group_ids[group] for group in sorted(groups)]
+
+    @property
+    def group_ids(self):
+        """The ids of the groups in the graph, in the order they were added"""
+        return [self.__group_ids[group] for group in sorted(self.__members)]
+
+    def stats(self):
+        """Get the number of groups, users and memberships in the graph
+
+        :rtype: dict
+        """
+        return {
+            'groups': len(self.__members),
+            'users': len(self.__user_ids),
+            'memberships': sum(len(members) for members in six.itervalues(self.__members)),
+            'failed': len(self.failed)
+        }
+
+    def __reverse_index(self):
+        reverse = self.__groups_of
+        if reverse is None:
+            with self.__lock:
+                lists = {}
+                for group in sorted(self.__members):
+                    for user in self.__members[group]:
+                        groups = lists.get(user)
+                        if groups is None:
+                            lists[user] = groups = array('i')
+                        groups.append(group)
+                self.__groups_of = reverse = lists
+        return reverse
+
+    def __user_list(self, users):
+        return [self.__user_ids[user] for user in users]
+
+    @staticmethod
+    def __number(value, values, numbers):
+        number = numbers.get(value)
+        if number is None:
+            number = numbers[value] = len(values)
+            values.append(value)
+        return number
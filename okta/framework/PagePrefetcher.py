@@ -0,0 +1,84 @@
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+
+class PagePrefetcher(object):
+    """Fetches the pages of a listing on a background thread, ahead of the caller
+
+    Okta pages are chained by their next links, so each page can only be
+    requested once the previous one has arrived. The worker follows that
+    chain on its own, keeping up to ``depth`` fetched pages waiting, so the
+    next request is already on the wire while the caller is still working
+    through the records of the current page. Unless ``decode`` is False,
+    the worker also decodes each page's result.
+
+    Iterate over it to get the pages in order. Call :meth:`close` when
+    stopping before the last page, so the worker stops too.
+    """
+
+    # How often a worker waiting on a full queue checks whether it was closed
+    POLL_INTERVAL = 0.1
+
+    __END = object()
+
+    def __init__(self, get_page, depth=1, decode=True, **params):
+        """
+        :param get_page: a client's get_paged_* method
+        :type get_page: function
+        :param depth: number of pages fetched ahead of the one being used
+        :type depth: int
+        :param decode: whether the worker decodes each page's result, instead of leaving the page as fetched
+        :type decode: bool
+        :param params: the arguments of the first get_page call; the next pages are fetched by url
+        """
+        if depth < 1:
+            raise ValueError('depth must be at least 1')
+
+        self.__get_page = get_page
+        self.__params = params
+        self.__decode = decode
+        self.__pages = queue.Queue(maxsize=depth)
+        self.__closed = threading.Event()
+        self.__worker = threading.Thread(target=self.__fetch, name='okta-page-prefetcher')
+        self.__worker.daemon = True
+        self.__worker.start()
+
+    def __iter__(self):
+        while True:
+            page, error = self.__pages.get()
+            if error is not None:
+                six.reraise(*error)
+            if page is PagePrefetcher.__END:
+                return
+            yield page
+
+    def close(self):
+        """Stop fetching pages; pages already being fetched are thrown away"""
+        self.__closed.set()
+
+    def __fetch(self):
+        try:
+            page = self.__get_page(**self.__params)
+            while True:
+                if self.__decode:
+                    # Decoded here rather than by the caller, as soon as the page arrives
+                    page.result
+                if not self.__put((page, None)) or page.is_last_page():
+                    break
+                page = self.__get_page(url=page.next_url)
+        except Exception:
+            self.__put((None, sys.exc_info()))
+            return
+        self.__put((PagePrefetcher.__END, None))
+
+    def __put(self, item):
+        while not self.__closed.is_set():
+            try:
+                self.__pages.put(item, timeout=PagePrefetcher.POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
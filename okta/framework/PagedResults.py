@@ -1,11 +1,17 @@
+from okta.framework.ConcurrentPager import ConcurrentPager
+from okta.framework.JsonCodec import JsonCodec
+from okta.framework.JsonStream import JsonStream
+from okta.framework.PagePrefetcher import PagePrefetcher
 from okta.framework.Utils import Utils
 
 
 class PagedResults(object):
 
-    def __init__(self, response, target_class):
+    def __init__(self, response, target_class, deserialize_options=None):
         self.response = response
         self.__target_class = target_class
+        self.__deserialize_options = deserialize_options or {}
+        self.__result = None
 
     def is_last_page(self):
         return not ("next" in self.response.links)
@@ -22,4 +28,100 @@ class PagedResults(object):
 
     @property
     def result(self):
-        return Utils.deserialize(self.response.text, self.__target_class)
\ No newline at end of file
+        # Decoded on first access only
+        if self.__result is None:
+            self.__result = Utils.deserialize(JsonCodec.body(self.response), self.__target_class,
+                                              **self.__deserialize_options)
+        return self.__result
+
+    def iter_result(self):
+        """Yield the page's records one at a time
+
+        When the page was requested with stream=True and its result hasn't
+        been read, the records are decoded as the body is read from the
+        connection, so the whole page is never held in memory at once.
+
+        :rtype: generator
+        """
+        if self.__result is not None:
+            for record in self.__result:
+                yield record
+            return
+
+        try:
+            for record in Utils.deserialize_stream(JsonStream.chunks(self.response), self.__target_class,
+                                                   **self.__deserialize_options):
+                yield record
+        finally:
+            self.response.close()
+
+    def iter_json(self):
+        """Yield the page's records as parsed JSON, without decoding them into models
+
+        The records are parsed as the body is read, like iter_result does
+        for a page requested with stream=True.
+
+        :rtype: generator of dict
+        """
+        try:
+            for record in JsonStream.iter_array(JsonStream.chunks(self.response)):
+                yield record
+        finally:
+            self.response.close()
+
+    @staticmethod
+    def iterate(get_page, prefetch=0, **params):
+        """Yield every record of a paged listing, fetching each page only once the previous one is used up
+
+        Nothing is fetched until the first record is asked for, and stopping
+        early leaves the remaining pages unfetched. With prefetch, the next
+        pages are fetched on a background thread while the records of the
+        current one are being used, see PagePrefetcher.
+
+        :param get_page: a client's get_paged_* method
+        :type get_page: function
+        :param prefetch: number of pages fetched ahead, 0 to fetch each page when it is needed
+        :type prefetch: int
+        :param params: the arguments of the first get_page call; the next pages are fetched by url
+        :rtype: generator
+        """
+        if prefetch:
+            prefetcher = PagePrefetcher(get_page, prefetch, **params)
+            try:
+                for page in prefetcher:
+                    for record in page.result:
+                        yield record
+            finally:
+                prefetcher.close()
+            return
+
+        page = get_page(**params)
+        while True:
+            for record in page.result:
+                yield record
+            if page.is_last_page():
+                return
+            page = get_page(url=page.next_url)
+
+    @staticmethod
+    def iterate_many(get_page, listings, workers=ConcurrentPager.DEFAULT_WORKERS):
+        """Yield every record of many paged listings, paging through several at once
+
+        Records come tagged with the key of their listing, a page at a time
+        in the order the pages arrive, see ConcurrentPager. Nothing is
+        fetched until the first record is asked for.
+
+        :param get_page: called with a listing's params for its first page, and with url= for the next ones
+        :type get_page: function
+        :param listings: the key and the get_page params of each listing
+        :type listings: iterable of (key, dict)
+        :param workers: number of listings paged through at once
+        :type workers: int
+        :rtype: generator of (key, record)
+        """
+        pager = ConcurrentPager(get_page, listings, workers)
+        try:
+            for key, record in pager:
+                yield key, record
+        finally:
+            pager.close()
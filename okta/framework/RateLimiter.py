@@ -0,0 +1,158 @@
+import threading
+import time
+from email.utils import parsedate_tz, mktime_tz
+
+import six
+from six.moves.urllib.parse import urlparse
+
+
+class RateLimiter(object):
+    """Paces requests so an org's rate limits are approached but not tripped
+
+    Okta reports the budget of the endpoint a request hit in the
+    X-Rate-Limit-Limit, X-Rate-Limit-Remaining and X-Rate-Limit-Reset
+    headers of every response. The limiter tracks those budgets per
+    endpoint bucket and, before each request, tells the caller how long to
+    wait: nothing while plenty of the window's budget is left, evenly spaced
+    requests once it runs low, and until the window resets once it is spent.
+
+    One limiter can be shared by every client (and thread) talking to an org.
+    """
+
+    # Okta rate limit windows are one minute long
+    WINDOW = 60
+
+    def __init__(self, headroom=1, pace_below=0.2):
+        """
+        :param headroom: requests per window left unused, for other consumers of the org
+        :type headroom: int
+        :param pace_below: fraction of the window's budget below which requests are spaced out
+        :type pace_below: float
+        """
+        self.headroom = headroom
+        self.pace_below = pace_below
+        self.__buckets = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def bucket_for(url):
+        """Get the rate limit bucket a url counts against
+
+        Collection endpoints (/api/v1/users) and the endpoints beneath them
+        (/api/v1/users/{id}/...) are limited separately by Okta.
+
+        :param url: the request url
+        :type url: str
+        :rtype: str
+        """
+        parts = [part for part in urlparse(url).path.split('/') if part]
+        bucket = '/' + '/'.join(parts[:3])
+        if len(parts) > 3:
+            bucket += '/*'
+        return bucket
+
+    def reserve(self, url):
+        """Take one request from the url's budget
+
+        :param url: the request url
+        :type url: str
+        :return: seconds to wait before sending the request
+        :rtype: float
+        """
+        key = self.bucket_for(url)
+        with self.__lock:
+            bucket = self.__buckets.get(key)
+            if bucket is None:
+                return 0
+
+            now = time.time()
+            if now >= bucket.reset:
+                bucket.roll_over(now)
+
+            available = bucket.remaining - self.headroom
+            start = max(now, bucket.next_at)
+            if available <= 0:
+                # The window is spent, so the request goes out once it resets
+                start = max(start, bucket.reset)
+                bucket.roll_over(start)
+                available = bucket.remaining - self.headroom
+
+            bucket.remaining -= 1
+            if available < bucket.limit * self.pace_below:
+                # Spread what is left of the budget over what is left of the window
+                bucket.next_at = start + (bucket.reset - start) / max(available, 1)
+            else:
+                bucket.next_at = start
+
+            return start - now
+
+    def update(self, url, headers):
+        """Record the budget reported by a response
+
+        :param url: the request url
+        :type url: str
+        :param headers: the response headers
+        :type headers: dict
+        """
+        if headers is None:
+            return
+
+        try:
+            limit = int(headers.get('X-Rate-Limit-Limit'))
+            remaining = int(headers.get('X-Rate-Limit-Remaining'))
+            reset = int(headers.get('X-Rate-Limit-Reset'))
+        except (TypeError, ValueError):
+            return
+
+        now = time.time()
+        # Reset is an epoch on the server's clock, so correct for skew when the server says what time it is
+        server_date = self.__parse_date(headers.get('Date'))
+        if server_date is not None:
+            reset += now - server_date
+
+        key = self.bucket_for(url)
+        with self.__lock:
+            bucket = self.__buckets.get(key)
+            if bucket is None:
+                self.__buckets[key] = _Bucket(limit, remaining, reset, now)
+            elif abs(bucket.reset - reset) < 1:
+                # Same window: requests still in flight aren't counted by the server yet
+                bucket.limit = limit
+                bucket.remaining = min(bucket.remaining, remaining)
+            elif reset > bucket.reset or now >= bucket.reset:
+                bucket.limit = limit
+                bucket.remaining = remaining
+                bucket.reset = reset
+
+    def remaining(self, url):
+        """Get the requests left in the url's current window, or None if its budget isn't known yet
+
+        :param url: the request url
+        :type url: str
+        :rtype: int or None
+        """
+        with self.__lock:
+            bucket = self.__buckets.get(self.bucket_for(url))
+            return bucket.remaining if bucket is not None else None
+
+    @staticmethod
+    def __parse_date(value):
+        if not isinstance(value, six.string_types):
+            return None
+        parsed = parsedate_tz(value)
+        return mktime_tz(parsed) if parsed else None
+
+
+class _Bucket(object):
+
+    def __init__(self, limit, remaining, reset, now):
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+        self.next_at = now
+
+    def roll_over(self, now):
+        # Assume the budget is refilled; the next response will say for sure
+        while self.reset <= now:
+            self.reset += RateLimiter.WINDOW
+        self.remaining = self.limit
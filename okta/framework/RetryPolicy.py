@@ -0,0 +1,117 @@
+import random
+import time
+from email.utils import parsedate_tz, mktime_tz
+
+import six
+
+
+class RetryPolicy(object):
+    """Decides whether a failed request is retried, and after how long
+
+    Rate limited (429) requests are always retried, after exactly the wait
+    the server asked for: Retry-After when present, otherwise the
+    X-Rate-Limit-Reset epoch. Server errors and connection errors are only
+    retried for idempotent methods, after a decorrelated jitter backoff.
+    """
+
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+    RETRY_STATUS_CODES = frozenset([500, 502, 503, 504])
+
+    def __init__(self, max_attempts=4, deadline=None, base_delay=0.5, max_delay=30):
+        """
+        :param max_attempts: maximum number of times a request is sent
+        :type max_attempts: int
+        :param deadline: seconds after the first attempt beyond which no retry is started
+        :type deadline: float or None
+        :param base_delay: smallest backoff between attempts, in seconds
+        :type base_delay: float
+        :param max_delay: largest backoff between attempts, in seconds
+        :type max_delay: float
+        """
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def next_delay(self, method, attempts, elapsed, previous_delay=None, response=None, error=None, idempotent=None):
+        """Get how long to wait before the next attempt, or None to give up
+
+        :param method: the HTTP method of the request
+        :type method: str
+        :param attempts: number of attempts made so far
+        :type attempts: int
+        :param elapsed: seconds since the first attempt was sent
+        :type elapsed: float
+        :param previous_delay: the delay returned for the previous attempt
+        :type previous_delay: float or None
+        :param response: the failed response, if one was received
+        :param error: the connection error raised instead of a response
+        :type error: Exception or None
+        :param idempotent: whether repeating the request is safe, if known better than by its method
+        :type idempotent: bool or None
+        :rtype: float or None
+        """
+        if attempts >= self.max_attempts:
+            return None
+
+        if response is not None and response.status_code == 429:
+            delay = self.server_delay(response)
+            if delay is None:
+                delay = self.backoff(previous_delay)
+
+        elif (method.upper() in self.IDEMPOTENT_METHODS if idempotent is None else idempotent) and \
+                (error is not None or (response is not None and response.status_code in self.RETRY_STATUS_CODES)):
+            delay = self.backoff(previous_delay)
+
+        else:
+            return None
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+    def backoff(self, previous_delay=None):
+        """Get a decorrelated jitter delay following the previous one
+
+        :param previous_delay: the previous delay, if any
+        :type previous_delay: float or None
+        :rtype: float
+        """
+        previous_delay = previous_delay or self.base_delay
+        return min(self.max_delay, random.uniform(self.base_delay, previous_delay * 3))
+
+    @staticmethod
+    def server_delay(response):
+        """Get the wait a rate limited response asks for, or None if it doesn't say
+
+        :param response: the rate limited response
+        :rtype: float or None
+        """
+        headers = response.headers
+        if headers is None:
+            return None
+
+        now = time.time()
+        retry_after = headers.get('Retry-After')
+        if isinstance(retry_after, six.string_types):
+            if retry_after.strip().isdigit():
+                return float(retry_after)
+            retry_at = RetryPolicy.__parse_date(retry_after)
+            if retry_at is not None:
+                return max(0.0, retry_at - now)
+
+        try:
+            reset = int(headers.get('X-Rate-Limit-Reset'))
+        except (TypeError, ValueError):
+            return None
+
+        # Reset is an epoch on the server's clock, so measure from the server's idea of now when given
+        server_now = RetryPolicy.__parse_date(headers.get('Date'))
+        return max(0.0, reset - (server_now if server_now is not None else now))
+
+    @staticmethod
+    def __parse_date(value):
+        if not isinstance(value, six.string_types):
+            return None
+        parsed = parsedate_tz(value)
+        return mktime_tz(parsed) if parsed else None
@@ -1,15 +1,138 @@
 from json import dumps, JSONEncoder
 from datetime import datetime
-from okta.framework.Utils import Utils
+
+import six
+
+from okta.framework.Deserializer import Deserializer
+
+# Values sent as they are
+_PLAIN = (six.text_type, six.binary_type, bool, float) + six.integer_types
 
 
 class Serializer(JSONEncoder):
+    """Encodes model objects into the plain dicts sent to the API
+
+    The first time a model class is encoded, the reverse of its
+    ``alt_names`` table (e.g. ``links`` back to ``_links``) is compiled into
+    an encode function that is cached per class. It builds the wire dict
+    in one pass over the object's attributes, leaving out nulls and
+    underscore-prefixed attributes, formatting datetimes, and encoding
+    nested models, lists and dicts as it goes, so no intermediate dicts are
+    copied and no JSON library has to call back for each nested model.
+
+    Nulls are left out of models only; a null inside a plain dict is sent,
+    so a partial update can clear an attribute.
+    """
+
+    __encoders = {}
+
     def default(self, obj): # pylint: disable=method-hidden
+        return Serializer.convert(obj)
+
+    @staticmethod
+    def convert(obj):
+        """Convert a value JSON has no type for, a datetime or a model, into one it has
+
+        :param obj: the value
+        :rtype: str or dict
+        """
         if isinstance(obj, datetime):
-            return obj.strftime('dt(%Y-%m-%dT%H:%M:%SZ)')
-        elif isinstance(obj, object):
-        	no_nulls = Utils.remove_nulls(obj.__dict__)
-        	formatted = Utils.replace_alt_names(obj, no_nulls)
-        	return formatted
-        else:
-            return JSONEncoder.default(self, obj)
\ No newline at end of file
+            return Serializer.format_timestamp(obj)
+        return Serializer.encoder_for(type(obj))(obj)
+
+    @staticmethod
+    def to_wire(obj):
+        """Encode a value, and any models, datetimes, lists and dicts inside it, into plain JSON types
+
+        :param obj: the value, e.g. a model, a list of models or a dict of changes
+        :rtype: dict or list or str or int or float or bool or None
+        """
+        if obj is None or isinstance(obj, _PLAIN):
+            return obj
+        if isinstance(obj, dict):
+            return dict((key, Serializer.to_wire(value)) for key, value in six.iteritems(obj))
+        if isinstance(obj, (list, tuple)):
+            return [Serializer.to_wire(item) for item in obj]
+        return Serializer.convert(obj)
+
+    @staticmethod
+    def format_timestamp(value):
+        """Format a datetime the way the API expects it in a request body
+
+        :param value: the datetime
+        :type value: datetime
+        :rtype: str
+        """
+        return value.strftime('dt(%Y-%m-%dT%H:%M:%SZ)')
+
+    @staticmethod
+    def format_filter_timestamp(value):
+        """Format a datetime the way Okta's filters expect it, e.g. 2020-01-01T00:00:00.000Z
+
+        :param value: the datetime, in UTC
+        :type value: datetime
+        :rtype: str
+        """
+        return value.strftime('%Y-%m-%dT%H:%M:%S.') + '{0:03d}Z'.format(value.microsecond // 1000)
+
+    @staticmethod
+    def encoder_for(cls):
+        """Get the cached encode function of a model class, compiling it on first use
+
+        :param cls: the model class
+        :rtype: function
+        """
+        encoder = Serializer.__encoders.get(cls)
+        if encoder is None:
+            encoder = Serializer.__compile(cls)
+            Serializer.__encoders[cls] = encoder
+        return encoder
+
+    @staticmethod
+    def clear():
+        """Forget every compiled encoder, so changed model tables are picked up"""
+        Serializer.__encoders.clear()
+
+    @staticmethod
+    def __compile(cls):
+        wire_names = dict((attr, key) for key, attr in six.iteritems(getattr(cls, 'alt_names', {})))
+        to_wire = Serializer.to_wire
+        plain = _PLAIN
+        slots = getattr(cls, 'attribute_names', None)
+
+        def encode_value(value):
+            if isinstance(value, plain):
+                return value
+            if isinstance(value, datetime):
+                return Serializer.format_timestamp(value)
+            return to_wire(value)
+
+        if not getattr(cls, '__dictoffset__', 1):
+            # Instances have no __dict__, so only slot-based models can be encoded
+            if slots is None:
+                def unsupported(obj):
+                    raise TypeError('Object of type {0} is not JSON serializable'.format(type(obj).__name__))
+                return unsupported
+
+            names = [(attr, wire_names.get(attr, attr)) for attr in slots()]
+
+            def encode_slots(obj):
+                built = {}
+                for attr, key in names:
+                    value = getattr(obj, attr, None)
+                    if value is not None:
+                        built[key] = encode_value(value)
+                return built
+            return encode_slots
+
+        def encode_object(obj):
+            values = obj.__dict__
+            if '_lazy' in values:
+                Deserializer.materialize(obj)
+            built = {}
+            for attr, value in six.iteritems(values):
+                if value is None or attr[0] == '_':
+                    continue
+                built[wire_names.get(attr, attr)] = value if type(value) in plain else encode_value(value)
+            return built
+        return encode_object
@@ -0,0 +1,248 @@
+import csv
+import functools
+import io
+from datetime import datetime
+
+import six
+
+from okta.framework.Deserializer import Deserializer
+from okta.framework.PagePrefetcher import PagePrefetcher
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+class UserExporter(object):
+    """Exports a user directory into columnar batches, and from them into CSV, Parquet or Arrow files
+
+    Users are read page by page as parsed JSON and flattened straight into
+    columns, without being decoded into User objects, so the whole export
+    holds one batch of rows at a time. Each file is written as its batches
+    are built.
+
+    By default the columns are the user's status and timestamp attributes
+    and every profile attribute of the client's user class, including those
+    of an extended profile, named like ``profile.login``. Timestamps are
+    kept as the strings Okta sent in CSV files, and are UTC timestamps in
+    Parquet and Arrow files.
+
+    Parquet and Arrow files need pyarrow: pip install okta-sdk-python[arrow]
+    """
+
+    BATCH_SIZE = 10000
+
+    # The User attributes exported with the profile attributes
+    USER_COLUMNS = ('id', 'status', 'created', 'activated', 'statusChanged', 'lastLogin', 'lastUpdated',
+                    'passwordChanged', 'transitioningToStatus')
+
+    def __init__(self, client, columns=None, profile_attributes=None, batch_size=BATCH_SIZE,
+                 limit=None, filter_string=None, prefetch=0):
+        """
+        :param client: the client users are listed with
+        :type client: UsersClient
+        :param columns: the columns to export, instead of the default ones
+        :type columns: list of str or None
+        :param profile_attributes: more profile attributes to export, e.g. custom ones the user class doesn't know
+        :type profile_attributes: list of str or None
+        :param batch_size: rows per batch
+        :type batch_size: int
+        :param limit: users fetched per page
+        :type limit: int or None
+        :param filter_string: string to filter users
+        :type filter_string: str or None
+        :param prefetch: number of pages fetched ahead while the current one is exported
+        :type prefetch: int
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+        self.client = client
+        self.batch_size = batch_size
+        self.limit = limit
+        self.filter_string = filter_string
+        self.prefetch = prefetch
+
+        self.__types = UserExporter.__column_types(client.user_class)
+        if columns is None:
+            columns = list(self.__types)
+        self.columns = list(columns) + ['profile.' + attr for attr in profile_attributes or ()
+                                        if 'profile.' + attr not in columns]
+
+        # Rows exported by the last run
+        self.exported = 0
+
+    def records(self):
+        """Yield every user as the parsed JSON Okta sent
+
+        :rtype: generator of dict
+        """
+        # Pages fetched ahead are read whole, so they don't hold a connection open each
+        get_page = functools.partial(self.client.get_paged_users, stream=not self.prefetch)
+        params = {'limit': self.limit, 'filter_string': self.filter_string}
+
+        if self.prefetch:
+            # Left undecoded, as the records are read with iter_json
+            prefetcher = PagePrefetcher(get_page, self.prefetch, decode=False, **params)
+            try:
+                for page in prefetcher:
+                    for record in page.iter_json():
+                        yield record
+            finally:
+                prefetcher.close()
+            return
+
+        page = get_page(**params)
+        while True:
+            for record in page.iter_json():
+                yield record
+            if page.is_last_page():
+                return
+            page = get_page(url=page.next_url)
+
+    def batches(self):
+        """Yield the users as batches of columns, each at most batch_size rows long
+
+        :return: a list of values per column, None where a user has no value
+        :rtype: generator of dict
+        """
+        getters = [(column, UserExporter.__getter(column)) for column in self.columns]
+        batch = dict((column, []) for column in self.columns)
+        size = 0
+        self.exported = 0
+
+        for record in self.records():
+            for column, get in getters:
+                batch[column].append(get(record))
+            size += 1
+            if size == self.batch_size:
+                self.exported += size
+                yield batch
+                batch = dict((column, []) for column in self.columns)
+                size = 0
+
+        if size:
+            self.exported += size
+            yield batch
+
+    def to_csv(self, target):
+        """Write the users to a CSV file with a header of column names
+
+        :param target: the path of the file, or an open text file
+        :type target: str or file
+        :return: the number of users written
+        :rtype: int
+        """
+        handle = target if hasattr(target, 'write') else UserExporter.__open_text(target)
+        try:
+            writer = csv.writer(handle)
+            writer.writerow(self.columns)
+            for batch in self.batches():
+                writer.writerows(six.moves.zip(*[batch[column] for column in self.columns]))
+        finally:
+            if handle is not target:
+                handle.close()
+        return self.exported
+
+    def record_batches(self):
+        """Yield the users as Arrow record batches
+
+        :rtype: generator of pyarrow.RecordBatch
+        """
+        schema = self.schema()
+        for batch in self.batches():
+            arrays = [UserExporter.__to_array(batch[field.name], field.type) for field in schema]
+            yield pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def schema(self):
+        """Get the Arrow schema of the exported columns
+
+        :rtype: pyarrow.Schema
+        """
+        UserExporter.__require_pyarrow()
+        arrow_types = {
+            datetime: pyarrow.timestamp('ms', tz='UTC'),
+            bool: pyarrow.bool_(),
+            int: pyarrow.int64(),
+            float: pyarrow.float64()
+        }
+        return pyarrow.schema([(column, arrow_types.get(self.__types.get(column), pyarrow.string()))
+                               for column in self.columns])
+
+    def to_parquet(self, path, **options):
+        """Write the users to a Parquet file
+
+        :param path: the path of the file
+        :type path: str
+        :param options: passed on to pyarrow.parquet.ParquetWriter, e.g. compression='zstd'
+        :return: the number of users written
+        :rtype: int
+        """
+        UserExporter.__require_pyarrow()
+        with pyarrow.parquet.ParquetWriter(path, self.schema(), **options) as writer:
+            for batch in self.record_batches():
+                writer.write_batch(batch)
+        return self.exported
+
+    def to_arrow(self, path):
+        """Write the users to an Arrow IPC file, which pandas and polars can memory-map
+
+        :param path: the path of the file
+        :type path: str
+        :return: the number of users written
+        :rtype: int
+        """
+        UserExporter.__require_pyarrow()
+        with pyarrow.OSFile(path, 'wb') as sink:
+            with pyarrow.ipc.new_file(sink, self.schema()) as writer:
+                for batch in self.record_batches():
+                    writer.write_batch(batch)
+        return self.exported
+
+    @staticmethod
+    def __column_types(user_class):
+        # Some user classes (like the ExtendedUser example) fill in their tables from __init__
+        sample = user_class()
+        types = {}
+        for attr in UserExporter.USER_COLUMNS:
+            if attr in sample.types:
+                types[attr] = sample.types[attr]
+        profile_types = getattr(sample.profile, 'types', {})
+        for attr, attr_type in six.iteritems(profile_types):
+            types['profile.' + attr] = attr_type
+        return types
+
+    @staticmethod
+    def __getter(column):
+        path = column.split('.')
+        if len(path) == 1:
+            return lambda record: record.get(column)
+
+        def get(record):
+            value = record
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            return value
+        return get
+
+    @staticmethod
+    def __to_array(values, arrow_type):
+        if pyarrow.types.is_timestamp(arrow_type):
+            values = [Deserializer.parse_timestamp(value) if value else None for value in values]
+        elif pyarrow.types.is_string(arrow_type):
+            values = [value if value is None or isinstance(value, six.string_types) else str(value)
+                      for value in values]
+        return pyarrow.array(values, type=arrow_type)
+
+    @staticmethod
+    def __open_text(path):
+        if six.PY2:
+            return open(path, 'wb')
+        return io.open(path, 'w', encoding='utf-8', newline='')
+
+    @staticmethod
+    def __require_pyarrow():
+        if pyarrow is None:
+            raise ImportError('Parquet and Arrow exports need pyarrow: pip install okta-sdk-python[arrow]')
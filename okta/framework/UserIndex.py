@@ -0,0 +1,175 @@
+import bisect
+
+import six
+from six.moves import collections_abc
+
+
+class UserIndex(collections_abc.MutableMapping):
+    """A local directory of users, keyed by id, with indexes over profile attributes
+
+    Each indexed profile attribute has a hash index from value to user ids,
+    kept up to date as users are added, replaced and removed, so finding a
+    user by login, email or employee number takes one lookup rather than
+    a scan of the list. Prefix queries use a sorted copy of an index's
+    values that is built on first use after a change.
+
+    Any profile attribute of the user class can be indexed, including those
+    of an extended profile class. Values are matched ignoring case unless
+    told otherwise, as Okta does for logins and emails, and each value of a
+    list attribute is indexed.
+
+    It is a mutable mapping of user id to User, so it can be filled from a
+    listing (``index.load(usersClient.iter_users())``) or be the store of a
+    UserSync, which keeps it up to date incrementally. It is not safe to
+    change from several threads at once.
+    """
+
+    DEFAULT_ATTRIBUTES = ('login', 'email', 'employeeNumber', 'managerId')
+
+    def __init__(self, attributes=DEFAULT_ATTRIBUTES, ignore_case=True, users=None):
+        """
+        :param attributes: the profile attributes to index
+        :type attributes: list of str
+        :param ignore_case: whether string values are matched ignoring case
+        :type ignore_case: bool
+        :param users: users to load
+        :type users: iterable of User or None
+        """
+        self.attributes = tuple(attributes)
+        self.ignore_case = ignore_case
+        self.__users = {}
+        self.__indexes = dict((attr, {}) for attr in self.attributes)
+        self.__entries = {}
+        self.__sorted = {}
+        if users is not None:
+            self.load(users)
+
+    def load(self, users):
+        """Add users, replacing the ones already in the index with the same id
+
+        :param users: the users
+        :type users: iterable of User
+        :return: the number of users loaded
+        :rtype: int
+        """
+        count = 0
+        for user in users:
+            self[user.id] = user
+            count += 1
+        return count
+
+    def find(self, attribute, value):
+        """Get the users whose profile attribute has a value
+
+        :param attribute: an indexed profile attribute, e.g. 'managerId'
+        :type attribute: str
+        :param value: the value
+        :rtype: list of User
+        """
+        uids = self.__index(attribute).get(self.__key(value), ())
+        return [self.__users[uid] for uid in uids]
+
+    def find_one(self, attribute, value):
+        """Get a user whose profile attribute has a value, like a login or an employee number
+
+        :param attribute: an indexed profile attribute, e.g. 'login'
+        :type attribute: str
+        :param value: the value
+        :rtype: User or None
+        """
+        uids = self.__index(attribute).get(self.__key(value))
+        return self.__users[next(iter(uids))] if uids else None
+
+    def find_prefix(self, attribute, prefix):
+        """Yield the users whose profile attribute starts with a prefix, in order of the attribute
+
+        :param attribute: an indexed profile attribute, e.g. 'email'
+        :type attribute: str
+        :param prefix: the prefix
+        :type prefix: str
+        :rtype: generator of User
+        """
+        index = self.__index(attribute)
+        values = self.__sorted.get(attribute)
+        if values is None:
+            values = sorted(value for value in index if isinstance(value, six.string_types))
+            self.__sorted[attribute] = values
+
+        prefix = self.__key(prefix)
+        for position in six.moves.range(bisect.bisect_left(values, prefix), len(values)):
+            value = values[position]
+            if not value.startswith(prefix):
+                return
+            for uid in sorted(index[value]):
+                yield self.__users[uid]
+
+    def values_of(self, attribute):
+        """Get the distinct values of an indexed attribute, with how many users have each
+
+        :param attribute: an indexed profile attribute, e.g. 'managerId'
+        :type attribute: str
+        :rtype: dict
+        """
+        return dict((value, len(uids)) for value, uids in six.iteritems(self.__index(attribute)))
+
+    def __getitem__(self, uid):
+        return self.__users[uid]
+
+    def __setitem__(self, uid, user):
+        if uid in self.__users:
+            self.__unindex(uid)
+        self.__users[uid] = user
+        profile = getattr(user, 'profile', None)
+        entries = []
+        for attr in self.attributes:
+            index = self.__indexes[attr]
+            for key in self.__keys(getattr(profile, attr, None)):
+                uids = index.get(key)
+                if uids is None:
+                    index[key] = uids = set()
+                    self.__sorted.pop(attr, None)
+                uids.add(uid)
+                entries.append((attr, key))
+        # What was indexed, so it can be unindexed even if the user is changed in place
+        self.__entries[uid] = entries
+
+    def __delitem__(self, uid):
+        del self.__users[uid]
+        self.__unindex(uid)
+
+    def __iter__(self):
+        return iter(self.__users)
+
+    def __len__(self):
+        return len(self.__users)
+
+    def __contains__(self, uid):
+        return uid in self.__users
+
+    def __unindex(self, uid):
+        for attr, key in self.__entries.pop(uid, ()):
+            index = self.__indexes[attr]
+            uids = index[key]
+            uids.discard(uid)
+            if not uids:
+                del index[key]
+                self.__sorted.pop(attr, None)
+
+    def __index(self, attribute):
+        index = self.__indexes.get(attribute)
+        if index is None:
+            raise KeyError('{0} is not indexed, the indexed attributes are {1}'.format(
+                attribute, ', '.join(self.attributes)))
+        return index
+
+    def __keys(self, value):
+        if value is None:
+            return ()
+        if isinstance(value, (list, tuple, set)):
+            return set(self.__key(item) for item in value if item is not None)
+        return (self.__key(value),)
+
+    def __key(self, value):
+        if self.ignore_case and isinstance(value, six.string_types):
+            return value.lower()
+        return value
@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+
+import six
+
+from okta.framework.Utils import Utils
+from okta.models.user.Password import Password
+from okta.models.user.User import User
+
+
+class UserRecords(object):
+    """Reads users to provision from CSV and NDJSON files
+
+    A row names profile attributes (login, email, firstName, ...), plus an
+    optional password. An NDJSON line is either such a row or a whole user
+    object, with its profile and credentials, as the API returns it. Files
+    are read a record at a time, so they can be of any size.
+    """
+
+    @staticmethod
+    def from_row(row, user_class=User):
+        """Build a user from a flat row of profile attributes
+
+        Empty values are left out, and a password column becomes the user's password credential.
+
+        :param row: profile attribute names and values
+        :type row: dict
+        :param user_class: the user model class to build
+        :rtype: User
+        """
+        values = dict((k, v) for k, v in six.iteritems(row) if k and v is not None and v != '')
+        password = values.pop('password', None)
+        user = user_class(**values)
+        if password:
+            user.credentials = user.credentials or user_class.types['credentials']()
+            user.credentials.password = Password()
+            user.credentials.password.value = password
+        return user
+
+    @staticmethod
+    def from_csv(source, user_class=User):
+        """Yield a user for each row of a CSV file whose header names profile attributes
+
+        :param source: the path of the file, or the open file
+        :type source: str or file
+        :param user_class: the user model class to build
+        :rtype: generator of User
+        """
+        with UserRecords.__open(source) as lines:
+            for row in csv.DictReader(lines):
+                yield UserRecords.from_row(row, user_class)
+
+    @staticmethod
+    def from_ndjson(source, user_class=User):
+        """Yield a user for each line of a newline delimited JSON file
+
+        :param source: the path of the file, or the open file
+        :type source: str or file
+        :param user_class: the user model class to build
+        :rtype: generator of User
+        """
+        with UserRecords.__open(source) as lines:
+            for line in lines:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if 'profile' in data:
+                    yield Utils.deserialize(data, user_class)
+                else:
+                    yield UserRecords.from_row(data, user_class)
+
+    @staticmethod
+    def __open(source):
+        if hasattr(source, 'read'):
+            return _Unclosed(source)
+        if six.PY2:
+            return open(source, 'rb')
+        return io.open(source, 'r', encoding='utf-8', newline='')
+
+
+class _Unclosed(object):
+    """Lets a file handed in by the caller be used in a with block without closing it"""
+
+    def __init__(self, source):
+        self.source = source
+
+    def __enter__(self):
+        return self.source
+
+    def __exit__(self, *exc_info):
+        return False
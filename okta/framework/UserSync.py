@@ -0,0 +1,182 @@
+import io
+import json
+import os
+import time
+from datetime import timedelta
+
+import six
+
+from okta.framework.Deserializer import Deserializer
+from okta.framework.Serializer import Serializer
+
+
+class UserSync(object):
+    """Keeps a local copy of a user directory up to date by fetching only the users changed since the last run
+
+    The first run lists every user. Each run records the latest lastUpdated
+    it saw as its high-water mark, and the next run lists only the users
+    with ``lastUpdated gt`` that mark, merging them into the store and
+    reporting which were created, updated and deprovisioned.
+
+    Okta's listings are eventually consistent, so each run reaches back
+    ``overlap`` seconds before the mark. Users fetched again without having
+    changed are recognised by their lastUpdated and left out of the report.
+    Users deleted outright no longer appear in any listing, so they stay in
+    the store until a full run (``full=True``) finds them missing.
+
+    The store is any mutable mapping of user id to User, e.g. a dict, or
+    ``shelve.open(path)`` to keep the users between runs. With a state
+    file, the high-water mark is kept in it between runs; it is only
+    written once a run has finished, so a failed run is fetched again.
+    """
+
+    # How far before the high-water mark each run reaches back, in seconds
+    OVERLAP = 60
+
+    def __init__(self, client, store=None, state_file=None, filter_string=None, limit=None, prefetch=0,
+                 overlap=OVERLAP):
+        """
+        :param client: the client users are listed with
+        :type client: UsersClient
+        :param store: user id to User mapping the changes are merged into, a new dict by default
+        :type store: dict-like or None
+        :param state_file: path of the JSON file the high-water mark is kept in between runs
+        :type state_file: str or None
+        :param filter_string: a filter every run is limited to, e.g. 'profile.department eq "Sales"'
+        :type filter_string: str or None
+        :param limit: users fetched per page
+        :type limit: int or None
+        :param prefetch: number of pages fetched ahead while the current one is merged
+        :type prefetch: int
+        :param overlap: seconds each run reaches back before the high-water mark
+        :type overlap: float
+        """
+        self.client = client
+        self.store = store if store is not None else {}
+        self.state_file = state_file
+        self.filter_string = filter_string
+        self.limit = limit
+        self.prefetch = prefetch
+        self.overlap = overlap
+        self.high_water_mark = self.__load_state()
+
+    def run(self, full=False):
+        """Fetch the users changed since the last run and merge them into the store
+
+        :param full: whether to list every user, and drop the stored ones that are gone, even if there is a mark
+        :type full: bool
+        :rtype: SyncResult
+        """
+        result = SyncResult()
+        result.started = time.time()
+        full = full or self.high_water_mark is None
+        result.full = full
+        mark = self.high_water_mark
+        seen = set()
+
+        for user in self.client.iter_users(limit=self.limit, filter_string=self.__filter(full),
+                                           prefetch=self.prefetch):
+            updated = UserSync.__last_updated(user)
+            if updated is not None and (mark is None or updated > mark):
+                mark = updated
+            seen.add(user.id)
+
+            stored = self.store.get(user.id)
+            if stored is not None and UserSync.__last_updated(stored) == updated and updated is not None:
+                # Fetched again by the overlap, unchanged
+                continue
+
+            self.store[user.id] = user
+            if getattr(user, 'status', None) == 'DEPROVISIONED':
+                result.deprovisioned.append(user)
+            elif stored is None:
+                result.created.append(user)
+            else:
+                result.updated.append(user)
+
+        if full:
+            for uid in [uid for uid in self.store if uid not in seen]:
+                result.removed.append(self.store[uid])
+                del self.store[uid]
+
+        self.high_water_mark = mark
+        result.high_water_mark = mark
+        self.__save_state()
+        result.finished = time.time()
+        return result
+
+    def __filter(self, full):
+        if full:
+            return self.filter_string
+        since = self.high_water_mark - timedelta(seconds=self.overlap)
+        changed = 'lastUpdated gt "{0}"'.format(Serializer.format_filter_timestamp(since))
+        if self.filter_string:
+            return '({0}) and {1}'.format(self.filter_string, changed)
+        return changed
+
+    @staticmethod
+    def __last_updated(user):
+        value = getattr(user, 'lastUpdated', None)
+        if isinstance(value, six.string_types):
+            # Decoded with timestamps='raw'
+            return Deserializer.parse_timestamp(value)
+        return value
+
+    def __load_state(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return None
+        with io.open(self.state_file, 'r', encoding='utf-8') as state:
+            mark = json.load(state).get('high_water_mark')
+        return Deserializer.parse_timestamp(mark) if mark else None
+
+    def __save_state(self):
+        if not self.state_file or self.high_water_mark is None:
+            return
+        state = {'high_water_mark': Serializer.format_filter_timestamp(self.high_water_mark)}
+        partial = self.state_file + '.tmp'
+        with io.open(partial, 'w', encoding='utf-8') as out:
+            out.write(six.text_type(json.dumps(state)))
+        # Swapped in whole, so a crash never leaves a half written mark
+        getattr(os, 'replace', os.rename)(partial, self.state_file)
+
+
+class SyncResult(object):
+    """The changes a UserSync run merged into its store"""
+
+    def __init__(self):
+        # Users that weren't in the store
+        self.created = []
+
+        # Users in the store that changed
+        self.updated = []
+
+        # Users that changed to DEPROVISIONED
+        self.deprovisioned = []
+
+        # Users a full run dropped from the store as no longer listed
+        self.removed = []
+
+        # Whether every user was listed, rather than the changed ones
+        self.full = False
+
+        # The latest lastUpdated seen, which the next run starts from
+        self.high_water_mark = None
+
+        # When the run started and finished, as epoch seconds
+        self.started = None
+        self.finished = None
+
+    def summary(self):
+        """Get the number of users of each kind of change
+
+        :rtype: dict
+        """
+        return {
+            'created': len(self.created),
+            'updated': len(self.updated),
+            'deprovisioned': len(self.deprovisioned),
+            'removed': len(self.removed),
+            'full': self.full,
+            'high_water_mark': Serializer.format_filter_timestamp(self.high_water_mark) if self.high_water_mark else None,
+            'elapsed': (self.finished or time.time()) - self.started if self.started else 0
+        }
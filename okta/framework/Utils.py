@@ -1,80 +1,41 @@
-import json
-import dateutil.parser
-from datetime import datetime
-import types
 import six
-import inspect
+from okta.framework.Deserializer import Deserializer
+from okta.framework.JsonCodec import JsonCodec
+from okta.framework.JsonStream import JsonStream
 
 
 class Utils(object):
     @staticmethod
-    def deserialize(from_data, to_class):
-
-        def custom_setattr(o, a, v):
-            if hasattr(o, 'alt_names') and a in o.alt_names:
-                a = o.alt_names[a]
-
-            setattr(o, a, v)
-
+    def deserialize(from_data, to_class, timestamps='parse', lazy=False, codec=None, track=False):
         json_dump = {}
         if from_data is None or len(from_data) == 0:
             json_dump = {}
-        elif isinstance(from_data, six.text_type) or isinstance(from_data, six.string_types):
-            json_dump = json.loads(from_data)
+        elif isinstance(from_data, (six.text_type, six.binary_type)) or isinstance(from_data, six.string_types):
+            json_dump = (codec or JsonCodec.default()).loads(from_data)
         else:
             json_dump = from_data
 
-        list_type = types.ListType if six.PY2 else list
-        if isinstance(json_dump, list_type):
-            obj_list = list()
-            for obj in json_dump:
-                obj_list.append(Utils.deserialize(obj, to_class))
-
-            return obj_list
-
-        else:
-            obj = to_class()
-
-            # Loop through each type of object in types
-            if hasattr(to_class, 'types'):
-                for attr, attr_type in six.iteritems(to_class.types):
-                    if attr in json_dump:
-                        val = json_dump[attr]
-
-                        if not val:
-                            continue
-
-                        if attr_type == datetime:
-                            val = dateutil.parser.parse(val)
-
-                        elif attr_type == str or attr_type == int or attr_type == dict or attr_type == bool:
-                            pass
+        return Deserializer.decode(json_dump, to_class, timestamps, lazy, track)
 
-                        else:
-                            val = Utils.deserialize(val, attr_type)
-
-                        custom_setattr(obj, attr, val)
-
-            # Otherwise, assume all the properties are strings
-            else:
-                for key, value in six.iteritems(json_dump):
-                    if key in to_class.__dict__:
-                        custom_setattr(obj, key, json_dump[key])
-
-            # Some models have dicts as values
-            if hasattr(to_class, 'dict_types'):
-                for attr, attr_type in six.iteritems(to_class.dict_types):
-                    if attr in json_dump:
-                        dictionary = json_dump[attr]
-                        new_dict = dict()
-
-                        for key, value in six.iteritems(dictionary):
-                            val = Utils.deserialize(value, attr_type)
-                            new_dict[key] = val
-
-                        custom_setattr(obj, attr, new_dict)
-
-            return obj
+    @staticmethod
+    def deserialize_stream(chunks, to_class, timestamps='parse', lazy=False, codec=None, track=False):
+        """Decode a JSON array read from byte chunks into to_class objects, one item at a time
+
+        :param chunks: the UTF-8 encoded array
+        :type chunks: iterable of bytes
+        :param to_class: the model class to decode into
+        :param timestamps: how timestamps are decoded, one of Deserializer.TIMESTAMP_MODES
+        :type timestamps: str
+        :param lazy: whether nested models and timestamps are decoded on first read
+        :type lazy: bool
+        :param codec: unused, accepted so a client's deserialize_options can be passed
+        :param track: whether objects keep the JSON they were decoded from, for the ChangeTracker
+        :type track: bool
+        :rtype: generator of to_class
+        """
+        decode = Deserializer.decoder_for(to_class, timestamps, lazy, track)
+        for item in JsonStream.iter_array(chunks):
+            yield decode(item)
 
     @staticmethod
     def remove_nulls(d):
@@ -87,13 +48,27 @@ class Utils(object):
                 built[k] = Utils.remove_nulls(v)
 
             if isinstance(v, object) and hasattr(v, '__dict__'):
-                built[k] = Utils.remove_nulls(v.__dict__)
+                built[k] = Utils.remove_nulls(Utils.model_attributes(v))
 
             else:
                 built[k] = v
 
         return built
 
+    @staticmethod
+    def model_attributes(obj):
+        """Get the attributes of a model object, including lazily decoded ones not read yet
+
+        :param obj: a model object
+        :rtype: dict
+        """
+        if not hasattr(obj, '__dict__'):
+            # A slot-based model
+            return dict((k, getattr(obj, k, None)) for k in obj.attribute_names())
+
+        Deserializer.materialize(obj)
+        return dict((k, v) for k, v in six.iteritems(obj.__dict__) if not k.startswith('_'))
+
     @staticmethod
     def replace_alt_names(obj, d):
         built = d.copy()
@@ -0,0 +1,38 @@
+import six
+
+
+class CompactModel(object):
+    """Base class of the slot-based model variants
+
+    Compact models keep their attributes in fixed __slots__ rather than a
+    per-instance __dict__, which makes each object several times smaller.
+    They decode and serialize like the regular models. Subclasses that add
+    attributes (e.g. custom profile attributes) list them in their own
+    __slots__ and types.
+    """
+
+    __slots__ = ()
+
+    __attribute_names = {}
+
+    def __init__(self, **kwargs):
+        for attr in self.attribute_names():
+            setattr(self, attr, None)
+
+    @classmethod
+    def attribute_names(cls):
+        """Get the names of all the slots of the class and its bases
+
+        :rtype: tuple of str
+        """
+        names = CompactModel.__attribute_names.get(cls)
+        if names is None:
+            names = []
+            for klass in reversed(cls.__mro__):
+                slots = klass.__dict__.get('__slots__', ())
+                if isinstance(slots, six.string_types):
+                    slots = (slots,)
+                names.extend(slot for slot in slots if slot not in names and not slot.startswith('__'))
+            names = tuple(names)
+            CompactModel.__attribute_names[cls] = names
+        return names
@@ -0,0 +1,10 @@
+from okta.models.CompactModel import CompactModel
+from okta.models.event.Event import Event
+
+
+class CompactEvent(CompactModel):
+    """An Event that keeps its attributes in slots"""
+
+    types = Event.types
+
+    __slots__ = tuple(Event.types)
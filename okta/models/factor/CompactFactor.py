@@ -0,0 +1,14 @@
+from okta.models.CompactModel import CompactModel
+from okta.models.factor.Factor import Factor
+
+
+class CompactFactor(CompactModel):
+    """A Factor that keeps its attributes in slots"""
+
+    types = Factor.types
+
+    dict_types = Factor.dict_types
+
+    alt_names = Factor.alt_names
+
+    __slots__ = ('id', 'factorType', 'provider', 'status', 'created', 'lastUpdated', 'profile', 'links', 'embedded')
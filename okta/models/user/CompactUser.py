@@ -0,0 +1,28 @@
+from okta.models.CompactModel import CompactModel
+from okta.models.user.CompactUserProfile import CompactUserProfile
+from okta.models.user.User import User
+
+
+class CompactUser(CompactModel):
+    """A User that keeps its attributes in slots, for holding large directories in memory"""
+
+    types = dict(User.types, profile=CompactUserProfile)
+
+    dict_types = User.dict_types
+
+    alt_names = User.alt_names
+
+    __slots__ = ('id', 'status', 'created', 'activated', 'statusChanged', 'lastLogin', 'lastUpdated',
+                 'passwordChanged', 'transitioningToStatus', 'profile', 'credentials', 'links')
+
+    def __init__(self, **kwargs):
+        CompactModel.__init__(self)
+        self.set_profile(**kwargs)
+
+    def set_profile(self, **kwargs):
+        # Populate profile, using the profile class of any subclass that extends it
+        self.profile = self.profile or self.types['profile']()
+        profile_attrs = self.profile.types
+        for attr in profile_attrs:
+            if attr in kwargs:
+                setattr(self.profile, attr, kwargs[attr])
@@ -0,0 +1,17 @@
+from okta.models.CompactModel import CompactModel
+from okta.models.user.UserProfile import UserProfile
+
+
+class CompactUserProfile(CompactModel):
+    """A UserProfile that keeps its attributes in slots
+
+    Extend it for custom profile attributes like this::
+
+        class ExtendedProfile(CompactUserProfile):
+            __slots__ = ('windows_username',)
+            types = dict(CompactUserProfile.types, windows_username=str)
+    """
+
+    types = UserProfile.types
+
+    __slots__ = tuple(UserProfile.types)
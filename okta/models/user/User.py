@@ -67,8 +67,8 @@ class User:
         self.set_profile(**kwargs)
 
     def set_profile(self, **kwargs):
-        # Populate profile
-        self.profile = self.profile or UserProfile()
+        # Populate profile, using the profile class of any subclass that extends it
+        self.profile = self.profile or self.types['profile']()
         profile_attrs = self.profile.types
         for attr in profile_attrs:
             if attr in kwargs:
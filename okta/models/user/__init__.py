@@ -2,6 +2,8 @@ from .ActivationResponse import ActivationResponse
 from .AppLinks import AppLinks
 from .ChangePasswordRequest import ChangePasswordRequest
 from .ChangeRecoveryQuestionRequest import ChangeRecoveryQuestionRequest
+from .CompactUser import CompactUser
+from .CompactUserProfile import CompactUserProfile
 from .LoginCredentials import LoginCredentials
 from .Password import Password
 from .Provider import Provider
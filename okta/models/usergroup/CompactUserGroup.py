@@ -0,0 +1,25 @@
+from okta.models.CompactModel import CompactModel
+from okta.models.usergroup.UserGroup import UserGroup
+from okta.models.usergroup.UserGroupProfile import UserGroupProfile
+
+
+class CompactUserGroup(CompactModel):
+    """A UserGroup that keeps its attributes in slots"""
+
+    types = UserGroup.types
+
+    dict_types = UserGroup.dict_types
+
+    alt_names = UserGroup.alt_names
+
+    __slots__ = ('id', 'objectClass', 'profile', 'links')
+
+    def __init__(self, **kwargs):
+        CompactModel.__init__(self)
+
+        # Populate profile
+        profile_attrs = ['name', 'description']
+        for attr in profile_attrs:
+            if attr in kwargs:
+                self.profile = self.profile or UserGroupProfile()
+                setattr(self.profile, attr, kwargs[attr])
@@ -1,2 +1,3 @@
+from .CompactUserGroup import CompactUserGroup
 from .UserGroup import UserGroup
 from .UserGroupProfile import UserGroupProfile
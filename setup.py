@@ -29,7 +29,10 @@ REQUIRED = [
 
 # What packages are optional?
 EXTRAS = {
-    # 'fancy feature': ['django'],
+    'aio': ['aiohttp>=3.6; python_version>="3.6"'],
+    'json': ['orjson>=3.4; python_version>="3.6"'],
+    'ujson': ['ujson>=1.35'],
+    'arrow': ['pyarrow>=1.0; python_version>="3.6"'],
 }
 
 # The rest you shouldn't have to touch too much :)
@@ -0,0 +1,185 @@
+import asyncio
+import json
+import unittest
+
+from unittest.mock import AsyncMock, patch
+from okta.aio import EventsClient, UsersClient, UserGroupsClient
+from okta.aio.ApiClient import Response
+from okta.framework.OktaError import OktaError
+from okta.framework.PagedResults import PagedResults
+from okta.models.user.User import User
+from okta.models.usergroup.UserGroup import UserGroup
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class AioClientsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UsersClient(base_url="https://mockta.com",
+                                  api_token="abcdefg")
+
+        with open("tests/data/user.json", "r") as file:
+            self.user = file.read()
+
+        with open("tests/data/users.json", "r") as file:
+            self.users = file.read()
+
+        with open("tests/data/user_groups.json", "r") as file:
+            self.user_groups = file.read()
+
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_get_user_returns_user(self, mock_send):
+        mock_send.return_value = Response(200, self.user, {}, {})
+        response = run(self.client.get_user("00ub0oNGTSWTBKOLGLNR"))
+
+        self.assertIsInstance(response, User)
+        mock_send.assert_awaited_once_with(
+            "GET", "https://mockta.com/api/v1/users/00ub0oNGTSWTBKOLGLNR", None)
+
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_get_users_concurrently(self, mock_send):
+        mock_send.return_value = Response(200, self.user_groups, {}, {})
+
+        async def fan_out():
+            uids = ["user{0}".format(i) for i in range(50)]
+            return await asyncio.gather(*[self.client.get_user_groups(uid) for uid in uids])
+
+        results = run(fan_out())
+
+        self.assertEqual(len(results), 50)
+        self.assertIsInstance(results[0][0], UserGroup)
+        self.assertEqual(mock_send.await_count, 50)
+
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_paged_users_follow_next_link(self, mock_send):
+        next_url = "https://mockta.com/api/v1/users?after=abc"
+        mock_send.return_value = Response(200, self.users, {}, {"next": {"url": next_url}})
+        page = run(self.client.get_paged_users(limit=2))
+
+        self.assertIsInstance(page, PagedResults)
+        self.assertFalse(page.is_last_page())
+        self.assertEqual(page.next_url, next_url)
+        self.assertIsInstance(page.result[0], User)
+
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_iter_users_follows_every_page(self, mock_send):
+        next_url = "https://mockta.com/api/v1/users?after=abc"
+        mock_send.side_effect = [Response(200, self.users, {}, {"next": {"url": next_url}}),
+                                 Response(200, self.users, {}, {})]
+
+        async def collect():
+            return [user async for user in self.client.iter_users(limit=5)]
+        users = run(collect())
+
+        self.assertEqual(len(users), 10)
+        self.assertIsInstance(users[0], User)
+        self.assertEqual(mock_send.await_args_list[1][0][1], next_url)
+
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_iter_users_prefetches(self, mock_send):
+        next_url = "https://mockta.com/api/v1/users?after=abc"
+        mock_send.side_effect = [Response(200, self.users, {}, {"next": {"url": next_url}}),
+                                 Response(200, self.users, {}, {})]
+
+        async def first_then_rest():
+            users = self.client.iter_users(prefetch=1)
+            first = await users.__anext__()
+            await asyncio.sleep(0)
+            fetched = mock_send.await_count
+            return [first] + [user async for user in users], fetched
+        users, fetched = run(first_then_rest())
+
+        self.assertEqual(len(users), 10)
+        self.assertEqual(fetched, 2)
+
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_iter_members_of_groups(self, mock_send):
+        groups_client = UserGroupsClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        async def send(method, url, data):
+            if "after" in url:
+                return Response(200, self.users, {}, {})
+            return Response(200, self.users, {}, {"next": {"url": url + "?after=abc"}})
+        mock_send.side_effect = send
+
+        async def collect():
+            return [member async for member in groups_client.iter_members_of_groups(["00g1", "00g2", "00g3"],
+                                                                                     workers=2)]
+        members = run(collect())
+
+        self.assertEqual(len(members), 30)
+        self.assertEqual(set(gid for gid, user in members), {"00g1", "00g2", "00g3"})
+        self.assertIsInstance(members[0][1], User)
+        self.assertEqual(mock_send.await_count, 6)
+
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_follow_events(self, mock_send):
+        events_client = EventsClient(base_url="https://mockta.com", api_token="abcdefg")
+        polls = ['[{"eventId": "tev1", "published": "2020-01-01T00:00:01.000Z"}]',
+                 '[{"eventId": "tev1", "published": "2020-01-01T00:00:01.000Z"},'
+                 ' {"eventId": "tev2", "published": "2020-01-01T00:00:02.000Z"}]']
+        mock_send.side_effect = [Response(200, text, {}, {}) for text in polls]
+
+        async def collect():
+            events = []
+            async for event in events_client.follow(start_date="2020-01-01T00:00:00.000Z", min_interval=0,
+                                                    max_interval=0):
+                events.append(event.eventId)
+                if len(events) == 2:
+                    break
+            return events
+
+        self.assertEqual(run(collect()), ["tev1", "tev2"])
+        self.assertEqual(mock_send.await_count, 2)
+
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_partial_update_of_tracked_user(self, mock_send):
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", track_changes=True)
+        mock_send.return_value = Response(200, self.user, {}, {})
+        user = run(client.get_user("00ub0oNGTSWTBKOLGLNR"))
+
+        self.assertIs(run(client.update_user(user)), user)
+        self.assertEqual(mock_send.await_count, 1)
+
+        user.profile.department = "Engineering"
+        run(client.update_user(user))
+        method, url, data = mock_send.await_args[0]
+        self.assertEqual((method, json.loads(data)), ("POST", {"profile": {"department": "Engineering"}}))
+
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_error_raises_okta_error(self, mock_send):
+        error = '{"errorCode": "E0000007", "errorSummary": "Not found", "errorCauses": []}'
+        mock_send.return_value = Response(404, error, {}, {})
+        groups_client = UserGroupsClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        with self.assertRaises(OktaError) as context:
+            run(groups_client.get_group("missing"))
+        self.assertEqual(context.exception.status_code, 404)
+
+    @patch("okta.aio.ApiClient.asyncio.sleep", new_callable=AsyncMock)
+    @patch("okta.aio.ApiClient.ApiClient._send", new_callable=AsyncMock)
+    def test_rate_limited_request_is_retried(self, mock_send, mock_sleep):
+        limited = Response(429, '{"errorSummary": "Too many requests", "errorCauses": []}', {}, {})
+        mock_send.side_effect = [limited, Response(200, self.user, {}, {})]
+        response = run(self.client.get_user("00ub0oNGTSWTBKOLGLNR"))
+
+        self.assertIsInstance(response, User)
+        self.assertEqual(mock_send.await_count, 2)
+        mock_sleep.assert_awaited_once()
+
+    def test_options_are_read_like_the_sync_client(self):
+        client = UsersClient("https://mockta.com", "abcdefg", headers={"X-Test": "1"}, timestamps="raw",
+                             track_changes=True)
+
+        self.assertEqual(client.base_url, "https://mockta.com/api/v1/users")
+        self.assertEqual(client.headers["Authorization"], "SSWS abcdefg")
+        self.assertEqual(client.headers["X-Test"], "1")
+        self.assertEqual(client.deserialize_options["timestamps"], "raw")
+        self.assertTrue(client.deserialize_options["track"])
+        with self.assertRaises(ValueError):
+            UsersClient("https://mockta.com", "abcdefg", timestamps="bogus")
+        with self.assertRaises(ValueError):
+            UsersClient(base_url="https://mockta.com")
@@ -0,0 +1,65 @@
+import unittest
+
+import requests
+from http.client import HTTPMessage
+from requests.cookies import MockRequest, MockResponse
+from unittest.mock import Mock, patch
+from okta.EventsClient import EventsClient
+from okta.UserGroupsClient import UserGroupsClient
+from okta.UsersClient import UsersClient
+from okta.framework.ApiClient import ApiClient
+
+
+class ApiClientSessionTest(unittest.TestCase):
+
+    def test_clients_share_pooled_session(self):
+        users_client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        groups_client = UserGroupsClient(base_url="https://mockta.com", api_token="abcdefg")
+        events_client = EventsClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        self.assertIsInstance(users_client.session, requests.Session)
+        self.assertIs(users_client.session, groups_client.session)
+        self.assertIs(users_client.session, events_client.session)
+
+    def test_pool_settings_create_separate_session(self):
+        default_client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        pooled_client = UsersClient(base_url="https://mockta.com", api_token="abcdefg",
+                                    pool_connections=2, pool_maxsize=32)
+
+        self.assertIsNot(default_client.session, pooled_client.session)
+        adapter = pooled_client.session.get_adapter("https://mockta.com")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_pooled_session_keeps_no_cookies(self):
+        # Shared by clients of different orgs and users, so a cookie set for one must not reach the others
+        session = ApiClient.create_pooled_session()
+        headers = HTTPMessage()
+        headers["Set-Cookie"] = "JSESSIONID=abc; Path=/"
+        request = requests.Request("POST", "https://mockta.com/api/v1/authn").prepare()
+        session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+        self.assertEqual(len(session.cookies), 0)
+
+    def test_explicit_session_is_used(self):
+        session = ApiClient.create_pooled_session(pool_maxsize=4)
+        session.get = Mock(return_value=Mock(status_code=200, text="[]"))
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", session=session)
+
+        self.assertEqual(client.get_users(), [])
+        session.get.assert_called_once()
+
+    def test_keep_alive_disabled_closes_connection(self):
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", keep_alive=False)
+
+        self.assertEqual(client.headers["Connection"], "close")
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_request_sends_client_headers(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text="[]")
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        client.get_users(limit=5)
+
+        args, kwargs = mock_get.call_args
+        self.assertEqual(args[0], "https://mockta.com/api/v1/users/?limit=5")
+        self.assertEqual(kwargs["headers"]["Authorization"], "SSWS abcdefg")
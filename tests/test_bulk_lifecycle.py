@@ -0,0 +1,127 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.UsersClient import UsersClient
+from okta.framework.OktaError import OktaError
+from okta.framework.RetryPolicy import RetryPolicy
+
+NOT_FOUND = json.dumps({"errorCode": "E0000007", "errorSummary": "Not found: Resource not found: missing (User)",
+                        "errorCauses": []})
+UNAVAILABLE = json.dumps({"errorSummary": "Service unavailable", "errorCauses": []})
+
+
+class BulkLifecycleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        self.no_wait = RetryPolicy(base_delay=0, max_delay=0)
+
+        with open("tests/data/user.json", "r") as file:
+            self.user = file.read()
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_deactivates_every_user(self, mock_post):
+        flaky = {"count": 0}
+
+        def post(url, headers=None, data=None):
+            if "/missing/" in url:
+                return Mock(status_code=404, text=NOT_FOUND, headers={})
+            if "/flaky/" in url and flaky["count"] == 0:
+                flaky["count"] += 1
+                return Mock(status_code=503, text=UNAVAILABLE, headers={})
+            return Mock(status_code=200, text=self.user, headers={})
+        mock_post.side_effect = post
+
+        uids = ["00u{0}".format(n) for n in range(20)] + ["missing", "flaky"]
+        result = self.client.bulk_lifecycle(uids, "deactivate", workers=4, retry_policy=self.no_wait)
+
+        self.assertEqual([outcome.key for outcome in result.succeeded],
+                         ["deactivate " + uid for uid in uids[:20] + ["flaky"]])
+        self.assertEqual(result.succeeded[-1].attempts, 2)
+        self.assertEqual(len(result.failed), 1)
+        self.assertIsInstance(result.failed[0].error, OktaError)
+        self.assertEqual(result.failed[0].error.status_code, 404)
+        self.assertTrue(mock_post.call_args_list[0][0][0].endswith("/lifecycle/deactivate"))
+
+        stats = result.stats()
+        self.assertEqual((stats["processed"], stats["succeeded"], stats["failed"], stats["retried"]), (22, 21, 1, 1))
+        self.assertGreater(stats["per_second"], 0)
+        self.assertLessEqual(stats["latency_p50"], stats["latency_max"])
+
+        report = result.report()
+        self.assertEqual(report["failures"][0]["key"], "deactivate missing")
+        self.assertEqual(report["failures"][0]["status_code"], 404)
+        json.dumps(report)
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_client_errors_are_not_retried(self, mock_post):
+        mock_post.return_value = Mock(status_code=404, text=NOT_FOUND, headers={})
+
+        result = self.client.bulk_lifecycle(["missing"], "suspend", retry_policy=self.no_wait)
+
+        self.assertEqual(result.failed[0].attempts, 1)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_options_reach_the_action(self, mock_post):
+        mock_post.return_value = Mock(status_code=200, text="{}", headers={})
+
+        self.client.bulk_lifecycle(["00u1"], "reset_password", send_email=False)
+
+        self.assertEqual(mock_post.call_args[0][0],
+                         "https://mockta.com/api/v1/users/00u1/lifecycle/reset_password?sendEmail=false")
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_emailing_actions_are_retried_only_without_email(self, mock_post):
+        mock_post.return_value = Mock(status_code=503, text=UNAVAILABLE, headers={})
+
+        result = self.client.bulk_lifecycle(["00u1"], "reset_password", retry_policy=self.no_wait)
+        self.assertEqual(result.failed[0].attempts, 1)
+        result = self.client.bulk_lifecycle(["00u1"], "activate", retry_policy=self.no_wait)
+        self.assertEqual(result.failed[0].attempts, 1)
+
+        result = self.client.bulk_lifecycle(["00u1"], "reset_password", retry_policy=self.no_wait,
+                                            send_email=False)
+        self.assertEqual(result.failed[0].attempts, self.no_wait.max_attempts)
+
+    @patch("okta.framework.ApiClient.requests.Session.delete")
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_checkpoint_is_kept_per_action(self, mock_post, mock_delete):
+        mock_post.return_value = Mock(status_code=200, text=self.user, headers={})
+        mock_delete.return_value = Mock(status_code=204, text="", headers={})
+        checkpoint = os.path.join(tempfile.mkdtemp(), "offboarding.checkpoint")
+        self.addCleanup(shutil.rmtree, os.path.dirname(checkpoint))
+
+        self.client.bulk_lifecycle(["00u1", "00u2"], "deactivate", checkpoint=checkpoint)
+        result = self.client.bulk_lifecycle(["00u1", "00u2"], "delete", checkpoint=checkpoint)
+
+        self.assertEqual(result.skipped, [])
+        self.assertEqual(mock_delete.call_count, 2)
+        result = self.client.bulk_lifecycle(["00u1", "00u2"], "delete", checkpoint=checkpoint)
+        self.assertEqual(result.skipped, ["delete 00u1", "delete 00u2"])
+
+    @patch("okta.framework.ApiClient.time.sleep")
+    @patch("okta.framework.ApiClient.requests.Session.delete")
+    def test_deletes_are_never_retried(self, mock_delete, mock_sleep):
+        mock_delete.return_value = Mock(status_code=503, text=UNAVAILABLE, headers={})
+
+        result = self.client.bulk_lifecycle(["00u1", "00u2"], "delete", retry_policy=self.no_wait)
+
+        self.assertEqual([outcome.attempts for outcome in result.failed], [1, 1])
+        self.assertEqual(mock_delete.call_count, 2)
+        self.assertEqual(mock_sleep.call_count, 0)
+
+    @patch("okta.framework.ApiClient.time.sleep")
+    @patch("okta.framework.ApiClient.requests.Session.delete")
+    def test_delete_user_is_not_retried_by_the_client(self, mock_delete, mock_sleep):
+        mock_delete.return_value = Mock(status_code=503, text=UNAVAILABLE, headers={})
+
+        self.assertRaises(OktaError, self.client.delete_user, "00u1")
+        self.assertEqual(mock_delete.call_count, 1)
+
+    def test_unknown_action(self):
+        self.assertRaises(ValueError, self.client.bulk_lifecycle, ["00u1"], "terminate")
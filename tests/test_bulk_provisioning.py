@@ -0,0 +1,117 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.UsersClient import UsersClient
+from okta.framework.BulkExecutor import BulkExecutor
+from okta.framework.OktaError import OktaError
+from okta.framework.UserRecords import UserRecords
+from okta.models.user.User import User
+
+CSV = u"""login,email,firstName,lastName,password
+ann@example.com,ann@example.com,Ann,Lee,Secret-123
+bob@example.com,bob@example.com,Bob,,
+taken@example.com,taken@example.com,Tim,Taken,
+"""
+
+CONFLICT = json.dumps({
+    "errorCode": "E0000001",
+    "errorSummary": "Api validation failed: login",
+    "errorCauses": [{"errorSummary": "login: An object with this field already exists in the current organization"}]
+})
+
+
+def created(request_body):
+    user = json.loads(request_body.decode("utf-8"))
+    user["id"] = "00u" + user["profile"]["login"].split("@")[0]
+    return json.dumps(user)
+
+
+def fake_post(url, headers=None, data=None):
+    if b"taken@example.com" in data:
+        return Mock(status_code=400, text=CONFLICT, headers={})
+    return Mock(status_code=200, text=created(data), headers={})
+
+
+class UserRecordsTest(unittest.TestCase):
+
+    def test_from_csv(self):
+        users = list(UserRecords.from_csv(io.StringIO(CSV)))
+
+        self.assertEqual([user.profile.login for user in users],
+                         ["ann@example.com", "bob@example.com", "taken@example.com"])
+        self.assertEqual(users[0].profile.firstName, "Ann")
+        self.assertEqual(users[0].credentials.password.value, "Secret-123")
+        self.assertIsNone(users[1].profile.lastName)
+        self.assertIsNone(users[1].credentials)
+
+    def test_from_ndjson(self):
+        lines = u'{"login": "ann@example.com", "firstName": "Ann"}\n\n' \
+                u'{"profile": {"login": "bob@example.com"}, "credentials": {"password": {"value": "pw"}}}\n'
+        users = list(UserRecords.from_ndjson(io.StringIO(lines)))
+
+        self.assertIsInstance(users[0], User)
+        self.assertEqual(users[0].profile.firstName, "Ann")
+        self.assertEqual(users[1].profile.login, "bob@example.com")
+        self.assertEqual(users[1].credentials.password.value, "pw")
+
+
+class BulkCreateUsersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        self.directory = tempfile.mkdtemp()
+        self.checkpoint = os.path.join(self.directory, "onboarding.checkpoint")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_collects_successes_and_failures(self, mock_post):
+        mock_post.side_effect = fake_post
+
+        result = self.client.bulk_create_users(UserRecords.from_csv(io.StringIO(CSV)), activate=False, workers=3)
+
+        self.assertEqual([user.id for user in result.values], ["00uann", "00ubob"])
+        self.assertEqual(len(result.failed), 1)
+        failure = result.failed[0]
+        self.assertEqual(failure.key, "taken@example.com")
+        self.assertIsInstance(failure.error, OktaError)
+        self.assertIn("already exists", failure.error_causes)
+        self.assertTrue(all(call[0][0].endswith("?activate=false") for call in mock_post.call_args_list))
+        self.assertIsNone(self.client.rate_limiter)
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_resumes_from_checkpoint(self, mock_post):
+        mock_post.side_effect = fake_post
+        self.client.bulk_create_users(UserRecords.from_csv(io.StringIO(CSV)), checkpoint=self.checkpoint)
+
+        # A line cut short by a crash is ignored
+        with open(self.checkpoint, "a") as checkpoint:
+            checkpoint.write('{"key": "carl@exa')
+
+        mock_post.reset_mock()
+        more = CSV + u"carl@example.com,carl@example.com,Carl,Cox,\n"
+        result = self.client.bulk_create_users(UserRecords.from_csv(io.StringIO(more)), checkpoint=self.checkpoint)
+
+        self.assertEqual(sorted(result.skipped), ["ann@example.com", "bob@example.com"])
+        self.assertEqual([user.profile.login for user in result.values], ["carl@example.com"])
+        self.assertEqual([outcome.key for outcome in result.failed], ["taken@example.com"])
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_executor_keeps_input_order(self):
+        result = BulkExecutor(workers=4).run(range(50), lambda n: n * n, key=str)
+
+        self.assertEqual(result.values, [n * n for n in range(50)])
+        self.assertEqual([outcome.index for outcome in result.succeeded], list(range(50)))
+
+    def test_executor_records_unexpected_errors(self):
+        result = BulkExecutor(workers=2).run([1, 0, 2], lambda n: 1 // n, key=str)
+
+        self.assertEqual(result.values, [1, 0])
+        self.assertIsInstance(result.failed[0].error, ZeroDivisionError)
+        self.assertIsNone(result.failed[0].error_causes)
@@ -0,0 +1,270 @@
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.AppInstanceClient import AppInstanceClient
+from okta.UserGroupsClient import UserGroupsClient
+from okta.UsersClient import UsersClient
+from okta.framework.Cache import Cache
+
+USER_ID = "00upofwtwaGmrmIsm0h7"
+
+
+class CacheTest(unittest.TestCase):
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = Cache(max_size=2)
+        cache.set(("user", "a"), 1)
+        cache.set(("user", "b"), 2)
+        cache.get(("user", "a"))
+        cache.set(("user", "c"), 3)
+
+        self.assertEqual(cache.get(("user", "a")), 1)
+        self.assertIs(cache.get(("user", "b")), Cache.MISSING)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    @patch("okta.framework.Cache.time.time")
+    def test_expired_entries_with_an_etag_are_kept_for_revalidation(self, mock_time):
+        mock_time.return_value = 1000
+        cache = Cache(ttl=60)
+        cache.set(("user", "a"), 1, etag='W/"1"')
+        cache.set(("user", "b"), 2)
+
+        mock_time.return_value = 1061
+        self.assertIs(cache.get(("user", "a")), Cache.MISSING)
+        self.assertIs(cache.get(("user", "b")), Cache.MISSING)
+        self.assertEqual(cache.get_stale(("user", "a")), (1, 'W/"1"'))
+        self.assertEqual(cache.get_stale(("user", "b")), (Cache.MISSING, None))
+
+        cache.renew(("user", "a"))
+        self.assertEqual(cache.get(("user", "a")), 1)
+        self.assertEqual(cache.stats()["revalidations"], 1)
+
+    @patch("okta.framework.Cache.time.time")
+    def test_entries_expire(self, mock_time):
+        mock_time.return_value = 1000
+        cache = Cache(ttl=60)
+        cache.set(("user", "a"), 1)
+        cache.set(("user", "b"), 2, ttl=600)
+
+        mock_time.return_value = 1061
+        self.assertIs(cache.get(("user", "a")), Cache.MISSING)
+        self.assertEqual(cache.get(("user", "b")), 2)
+
+    def test_counters(self):
+        cache = Cache()
+        cache.set(("user", "a"), None)
+        cache.get(("user", "a"))
+        cache.get(("user", "b"))
+        cache.peek(("user", "a"))
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+
+    def test_links(self):
+        cache = Cache(max_size=2)
+        cache.link(("user", "00u1"), ("user", "ann@example.com"))
+        cache.link(("user", "ann@example.com"), ("user", "ann@example.org"))
+
+        self.assertEqual(cache.linked(("user", "00u1")),
+                         {("user", "00u1"), ("user", "ann@example.com"), ("user", "ann@example.org")})
+        self.assertEqual(cache.linked(("user", "00u2")), {("user", "00u2")})
+
+        # Twice max_size keys are kept
+        cache.link(("user", "00u2"), ("user", "bob@example.com"))
+        self.assertEqual(cache.linked(("user", "00u1")), {("user", "00u1")})
+
+class CachedClientsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = Cache()
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", cache=self.cache)
+        self.groups_client = UserGroupsClient(base_url="https://mockta.com", api_token="abcdefg", cache=self.cache)
+
+        with open("tests/data/user.json", "r") as file:
+            self.user = file.read()
+
+        with open("tests/data/user_groups.json", "r") as file:
+            self.user_groups = file.read()
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_get_user_reads_through_by_id_and_login(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.user, headers={})
+
+        user = self.client.get_user(USER_ID)
+        self.assertIs(self.client.get_user(USER_ID), user)
+        self.assertIs(self.client.get_user(user.profile.login), user)
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.cache.hits, 2)
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_writes_invalidate_the_user(self, mock_get, mock_post):
+        mock_get.return_value = Mock(status_code=200, text=self.user, headers={})
+        mock_post.return_value = Mock(status_code=200, text=self.user, headers={})
+        user = self.client.get_user(USER_ID)
+        login = user.profile.login
+
+        self.client.update_user(user)
+        self.client.get_user(login)
+        self.assertEqual(mock_get.call_count, 2)
+
+        self.client.suspend_user(USER_ID)
+        self.client.get_user(USER_ID)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("okta.framework.ApiClient.requests.Session.put")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_group_membership_invalidates_user_groups(self, mock_get, mock_put):
+        mock_get.return_value = Mock(status_code=200, text=self.user_groups, headers={})
+        mock_put.return_value = Mock(status_code=204, text="", headers={})
+
+        self.client.get_user_groups(USER_ID)
+        self.client.get_user_groups(USER_ID)
+        self.assertEqual(mock_get.call_count, 1)
+
+        self.groups_client.add_user_to_group_by_id("00g1", USER_ID)
+        self.client.get_user_groups(USER_ID)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("okta.framework.ApiClient.requests.Session.put")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_groups_listed_by_login_are_invalidated_by_id(self, mock_get, mock_put):
+        mock_get.return_value = Mock(status_code=200, text=self.user_groups, headers={})
+        mock_put.return_value = Mock(status_code=204, text="", headers={})
+
+        self.client.get_user_groups("ann@example.com")
+        self.groups_client.add_user_to_group_by_id("00g2", USER_ID)
+        self.client.get_user_groups("ann@example.com")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("okta.framework.ApiClient.requests.Session.put")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_groups_of_a_looked_up_login_are_cached_under_the_id(self, mock_get, mock_put):
+        def get(url, **kwargs):
+            return Mock(status_code=200, text=self.user_groups if url.endswith("/groups") else self.user, headers={})
+        mock_get.side_effect = get
+        mock_put.return_value = Mock(status_code=204, text="", headers={})
+
+        login = self.client.get_user(USER_ID).profile.login
+        self.client.get_user_groups(login)
+        self.client.get_user_groups(login.upper())
+        self.client.get_user_groups(USER_ID)
+        self.assertEqual(mock_get.call_count, 2)
+
+        self.groups_client.add_user_to_group_by_id("00g2", USER_ID)
+        self.client.get_user_groups(login)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_writes_by_id_invalidate_only_that_user(self, mock_post):
+        mock_post.return_value = Mock(status_code=200, text="{}", headers={})
+        self.cache.set(("user_groups", "00uanotherusersid1234"), [])
+
+        with patch.object(self.cache, "invalidate_where") as invalidate_where:
+            self.client.suspend_user(USER_ID)
+            invalidate_where.assert_not_called()
+        self.assertEqual(len(self.cache), 1)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_ids_are_case_sensitive(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.user, headers={})
+
+        self.client.get_user(USER_ID)
+        self.client.get_user(USER_ID.lower())
+        self.assertEqual(UsersClient.cache_key(USER_ID), USER_ID)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_logins_are_looked_up_ignoring_case(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.user, headers={})
+
+        user = self.client.get_user(USER_ID)
+        self.assertIs(self.client.get_user(user.profile.login.upper()), user)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_no_cache_by_default(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.user, headers={})
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        client.get_user(USER_ID)
+        client.get_user(USER_ID)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class ConditionalRequestsTest(unittest.TestCase):
+
+    GROUP = '{"id": "00g1", "profile": {"name": "Engineering"}}'
+    APP = '{"id": "0oa1", "name": "bookmark", "label": "Wiki"}'
+
+    def setUp(self):
+        self.cache = Cache(ttl=0)
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", cache=self.cache)
+
+        with open("tests/data/user.json", "r") as file:
+            self.user = file.read()
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_not_modified_returns_the_cached_user(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.user, headers={"ETag": 'W/"1"'})
+        user = self.client.get_user(USER_ID)
+
+        mock_get.return_value = Mock(status_code=304, text="", headers={})
+        with patch("okta.framework.ApiClient.ApiClient.deserialize") as mock_deserialize:
+            self.assertIs(self.client.get_user(USER_ID), user)
+            mock_deserialize.assert_not_called()
+
+        headers = mock_get.call_args[1]["headers"]
+        self.assertEqual(headers["If-None-Match"], 'W/"1"')
+        self.assertEqual(headers["Authorization"], "SSWS abcdefg")
+        self.assertEqual(self.cache.revalidations, 1)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_changed_resource_is_decoded_again(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.user, headers={"ETag": 'W/"1"'})
+        user = self.client.get_user(USER_ID)
+
+        mock_get.return_value = Mock(status_code=200, text=self.user, headers={"ETag": 'W/"2"'})
+        self.assertIsNot(self.client.get_user(USER_ID), user)
+        self.assertEqual(self.cache.get_stale(("user", UsersClient.cache_key(USER_ID)))[1], 'W/"2"')
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_no_conditional_request_without_an_etag(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.user, headers={})
+        self.client.get_user(USER_ID)
+        self.client.get_user(USER_ID)
+
+        self.assertNotIn("If-None-Match", mock_get.call_args[1]["headers"])
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_groups_and_apps_are_revalidated(self, mock_get):
+        groups_client = UserGroupsClient(base_url="https://mockta.com", api_token="abcdefg", cache=self.cache)
+        apps_client = AppInstanceClient(base_url="https://mockta.com", api_token="abcdefg", cache=self.cache)
+
+        mock_get.return_value = Mock(status_code=200, text=self.GROUP, headers={"ETag": '"g1"'})
+        group = groups_client.get_group("00g1")
+        mock_get.return_value = Mock(status_code=200, text=self.APP, headers={"ETag": '"a1"'})
+        app = apps_client.get_app_instance("0oa1")
+
+        mock_get.return_value = Mock(status_code=304, text="", headers={})
+        self.assertIs(groups_client.get_group("00g1"), group)
+        self.assertIs(apps_client.get_app_instance("0oa1"), app)
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_writes_drop_the_etag(self, mock_get, mock_post):
+        apps_client = AppInstanceClient(base_url="https://mockta.com", api_token="abcdefg", cache=self.cache)
+        mock_get.return_value = Mock(status_code=200, text=self.APP, headers={"ETag": '"a1"'})
+        mock_post.return_value = Mock(status_code=200, text="{}", headers={})
+
+        apps_client.get_app_instance("0oa1")
+        apps_client.deactivate_app_instance("0oa1")
+        apps_client.get_app_instance("0oa1")
+
+        self.assertNotIn("If-None-Match", mock_get.call_args[1]["headers"])
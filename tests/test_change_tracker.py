@@ -0,0 +1,120 @@
+import json
+import unittest
+from datetime import datetime
+
+from unittest.mock import Mock, patch
+from okta.UsersClient import UsersClient
+from okta.framework.ChangeTracker import ChangeTracker
+from okta.framework.Utils import Utils
+from okta.models.user.Password import Password
+from okta.models.user.User import User
+from okta.models.user.UserProfile import UserProfile
+
+
+class TrackedUserProfile(UserProfile):
+    # Primitive attributes keep the JSON value as it is, so emails is a list
+    types = dict(UserProfile.types, extra=dict, emails=str)
+
+
+class TrackedUser(User):
+    types = dict(User.types, profile=TrackedUserProfile)
+
+
+class ChangeTrackerTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/user.json", "r") as file:
+            self.user_json = file.read()
+
+    def test_decoded_user_is_clean(self):
+        for lazy in (False, True):
+            for timestamps in ("parse", "lazy", "raw"):
+                user = Utils.deserialize(self.user_json, User, timestamps=timestamps, lazy=lazy, track=True)
+                self.assertEqual(ChangeTracker.changes(user), {})
+                self.assertFalse(ChangeTracker.is_dirty(user))
+
+    def test_changed_profile_attributes(self):
+        user = Utils.deserialize(self.user_json, User, track=True)
+        user.profile.department = "Engineering"
+        user.profile.title = None
+
+        self.assertEqual(ChangeTracker.changes(user), {"profile": {"department": "Engineering", "title": None}})
+
+    def test_changed_timestamp_and_lazy_user(self):
+        user = Utils.deserialize(self.user_json, User, lazy=True, track=True)
+        user.profile.city = "Leeds"
+        user.lastLogin = datetime(2021, 1, 1)
+
+        self.assertEqual(ChangeTracker.changes(user), {"profile": {"city": "Leeds"}, "lastLogin": datetime(2021, 1, 1)})
+
+    def test_replaced_models_are_given_whole(self):
+        user = Utils.deserialize(self.user_json, User, track=True)
+        user.credentials.password = Password()
+        user.credentials.password.value = "Abcd1234"
+
+        changes = ChangeTracker.changes(user)
+        self.assertIs(changes["credentials"]["password"], user.credentials.password)
+
+    def test_lists_and_dicts_changed_in_place(self):
+        data = json.loads(self.user_json)
+        data["profile"]["extra"] = {"badge": "1234"}
+        data["profile"]["emails"] = ["a@example.com"]
+        user = Utils.deserialize(json.dumps(data), TrackedUser, track=True)
+        user.profile.extra["badge"] = "5678"
+        user.profile.emails.append("b@example.com")
+
+        self.assertEqual(ChangeTracker.changes(user), {"profile": {"extra": {"badge": "5678"},
+                                                                   "emails": ["a@example.com", "b@example.com"]}})
+
+    def test_models_built_in_code_are_not_tracked(self):
+        self.assertIsNone(ChangeTracker.changes(User(login="a@example.com")))
+        self.assertIsNone(ChangeTracker.changes(UserProfile()))
+
+    def test_tracking_is_opt_in(self):
+        user = Utils.deserialize(self.user_json, User)
+
+        self.assertFalse(ChangeTracker.is_tracked(user))
+        self.assertFalse(ChangeTracker.is_tracked(user.profile))
+        self.assertIsNone(ChangeTracker.changes(user))
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_client_tracks_changes_when_asked(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.user_json, headers={})
+
+        user = UsersClient(base_url="https://mockta.com", api_token="abcdefg").get_user("00u1")
+        tracked = UsersClient(base_url="https://mockta.com", api_token="abcdefg", track_changes=True).get_user("00u1")
+
+        self.assertFalse(ChangeTracker.is_tracked(user))
+        self.assertTrue(ChangeTracker.is_tracked(tracked))
+        self.assertTrue(ChangeTracker.is_tracked(tracked.profile))
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_unchanged_user_is_not_sent(self, mock_post):
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        user = Utils.deserialize(self.user_json, User, track=True)
+
+        self.assertIs(client.update_user(user), user)
+        self.assertEqual(mock_post.call_count, 0)
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_partial_update_sends_only_changes(self, mock_post):
+        mock_post.return_value = Mock(status_code=200, text=self.user_json)
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        user = Utils.deserialize(self.user_json, User, track=True)
+        user.profile.department = "Engineering"
+
+        client.update_user(user)
+
+        self.assertEqual(json.loads(mock_post.call_args[1]["data"]), {"profile": {"department": "Engineering"}})
+
+    @patch("okta.framework.ApiClient.requests.Session.put")
+    def test_full_update_sends_the_whole_user(self, mock_put):
+        mock_put.return_value = Mock(status_code=200, text=self.user_json)
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        user = Utils.deserialize(self.user_json, User, track=True)
+
+        client.update_user(user, partial=False)
+
+        body = json.loads(mock_put.call_args[1]["data"])
+        self.assertEqual(body["profile"]["login"], "gordon@mailinator.com")
+        self.assertNotIn("_original", body)
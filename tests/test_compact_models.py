@@ -0,0 +1,84 @@
+import json
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.UsersClient import UsersClient
+from okta.framework.Serializer import Serializer
+from okta.framework.Utils import Utils
+from okta.models.event.CompactEvent import CompactEvent
+from okta.models.event.Event import Event
+from okta.models.factor.CompactFactor import CompactFactor
+from okta.models.factor.Factor import Factor
+from okta.models.user.CompactUser import CompactUser
+from okta.models.user.CompactUserProfile import CompactUserProfile
+from okta.models.user.User import User
+from okta.models.usergroup.CompactUserGroup import CompactUserGroup
+from okta.models.usergroup.UserGroup import UserGroup
+
+
+class ExtendedCompactProfile(CompactUserProfile):
+    __slots__ = ('windows_username',)
+    types = dict(CompactUserProfile.types, windows_username=str)
+
+
+class ExtendedCompactUser(CompactUser):
+    __slots__ = ()
+    types = dict(CompactUser.types, profile=ExtendedCompactProfile)
+
+
+def serialize(obj):
+    return json.loads(json.dumps(obj, cls=Serializer))
+
+
+class CompactModelsTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/users.json", "r") as file:
+            self.users = file.read()
+
+    def test_compact_users_have_no_instance_dict(self):
+        user = Utils.deserialize(self.users, CompactUser)[0]
+
+        self.assertFalse(hasattr(user, "__dict__"))
+        self.assertFalse(hasattr(user.profile, "__dict__"))
+        self.assertIsNone(user.profile.middleName)
+
+    def test_compact_and_regular_models_serialize_alike(self):
+        for fixture, regular, compact in [("users", User, CompactUser),
+                                          ("user_groups", UserGroup, CompactUserGroup),
+                                          ("factors", Factor, CompactFactor)]:
+            with open("tests/data/{0}.json".format(fixture), "r") as file:
+                text = file.read()
+            self.assertEqual(serialize(Utils.deserialize(text, regular)),
+                             serialize(Utils.deserialize(text, compact)))
+
+    def test_compact_events(self):
+        data = [{"eventId": "tev1", "published": "2015-04-06T18:55:36.000Z",
+                 "actors": [{"id": "00u1", "objectType": "User"}]}]
+
+        self.assertEqual(serialize(Utils.deserialize(data, Event)),
+                         serialize(Utils.deserialize(data, CompactEvent)))
+
+    def test_custom_profile_attributes(self):
+        data = {"id": "00u1", "profile": {"login": "a@example.com", "windows_username": "DOMAIN\\a"}}
+        user = Utils.deserialize(data, ExtendedCompactUser)
+
+        self.assertIsInstance(user.profile, ExtendedCompactProfile)
+        self.assertEqual(user.profile.windows_username, "DOMAIN\\a")
+        self.assertEqual(serialize(user)["profile"]["windows_username"], "DOMAIN\\a")
+
+        created = ExtendedCompactUser(login="b@example.com", windows_username="DOMAIN\\b")
+        self.assertEqual(created.profile.windows_username, "DOMAIN\\b")
+
+    def test_lazy_decoding_falls_back_to_eager(self):
+        user = Utils.deserialize(self.users, CompactUser, lazy=True, timestamps="lazy")[0]
+
+        self.assertIs(type(user), CompactUser)
+        self.assertEqual(user.created.year, 2017)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_client_with_compact_user_class(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.users, headers={})
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", user_class=CompactUser)
+
+        self.assertIsInstance(client.get_users()[0], CompactUser)
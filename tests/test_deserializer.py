@@ -0,0 +1,72 @@
+import unittest
+
+from okta.framework.Deserializer import Deserializer
+from okta.framework.Utils import Utils
+from okta.models.Link import Link
+from okta.models.user.User import User
+from okta.models.user.UserProfile import UserProfile
+
+
+class ExtendedUserProfile(UserProfile):
+    types = dict(UserProfile.types, windows_username=str)
+
+    def __init__(self):
+        UserProfile.__init__(self)
+        self.windows_username = None
+
+
+class ExtendedUser(User):
+    types = dict(User.types, profile=ExtendedUserProfile)
+
+
+class DeserializerTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/user.json", "r") as file:
+            self.user = file.read()
+
+    def test_decoder_is_compiled_once_per_class(self):
+        self.assertIs(Deserializer.decoder_for(User), Deserializer.decoder_for(User))
+        self.assertIsNot(Deserializer.decoder_for(User), Deserializer.decoder_for(ExtendedUser))
+
+    def test_nested_models_and_alt_names(self):
+        user = Utils.deserialize(self.user, User)
+
+        self.assertIsInstance(user.profile, UserProfile)
+        self.assertEqual(user.profile.firstName, "Gordon")
+        self.assertIsInstance(user.links["self"], Link)
+        self.assertFalse(hasattr(user, "_links"))
+        self.assertEqual(user.created.year, 2020)
+
+    def test_extended_user_decodes_custom_attributes(self):
+        data = {"id": "00u1", "profile": {"login": "a@example.com", "windows_username": "DOMAIN\\a"}}
+        user = Utils.deserialize(data, ExtendedUser)
+
+        self.assertIsInstance(user, ExtendedUser)
+        self.assertIsInstance(user.profile, ExtendedUserProfile)
+        self.assertEqual(user.profile.windows_username, "DOMAIN\\a")
+
+        # the base class is left untouched
+        plain = Utils.deserialize(data, User)
+        self.assertNotIsInstance(plain.profile, ExtendedUserProfile)
+        self.assertFalse(hasattr(plain.profile, "windows_username"))
+
+    def test_extended_user_builds_extended_profile(self):
+        user = ExtendedUser(login="a@example.com", windows_username="DOMAIN\\a")
+
+        self.assertIsInstance(user.profile, ExtendedUserProfile)
+        self.assertEqual(user.profile.windows_username, "DOMAIN\\a")
+
+    def test_empty_values_are_skipped(self):
+        user = Utils.deserialize({"id": "00u1", "status": "", "lastLogin": None, "profile": {}}, User)
+
+        self.assertEqual(user.id, "00u1")
+        self.assertIsNone(user.status)
+        self.assertIsNone(user.lastLogin)
+
+    def test_list_of_objects(self):
+        users = Utils.deserialize([{"id": "00u1"}, {}], User)
+
+        self.assertEqual(len(users), 2)
+        self.assertEqual(users[0].id, "00u1")
+        self.assertIsNone(users[1].id)
@@ -0,0 +1,104 @@
+import json
+import threading
+import unittest
+from datetime import datetime
+
+import dateutil.tz
+from unittest.mock import Mock, patch
+from okta.EventsClient import EventsClient
+from okta.framework.EventFollower import EventFollower
+from okta.models.event.Event import Event
+
+START = datetime(2020, 1, 1, tzinfo=dateutil.tz.tzutc())
+
+
+def event(event_id, second):
+    return {"eventId": event_id, "published": "2020-01-01T00:00:{0:02d}.000Z".format(second)}
+
+
+def page(events, next_url=None):
+    links = {"next": {"url": next_url}} if next_url else {}
+    return Mock(status_code=200, text=json.dumps(events), headers={}, links=links)
+
+
+class EventFollowTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = EventsClient(base_url="https://mockta.com", api_token="abcdefg")
+
+    def follow(self, mock_get, polls, count):
+        mock_get.side_effect = polls + [page([])] * 20
+        follower = self.client.follow(start_date=START, min_interval=0, max_interval=0)
+        events = []
+        for followed in follower:
+            events.append(followed)
+            if len(events) == count:
+                follower.stop()
+        return follower, events
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_events_at_the_boundary_are_yielded_once(self, mock_get):
+        polls = [page([event("tev1", 1), event("tev2", 3)]),
+                 page([event("tev2", 3), event("tev3", 3), event("tev4", 4)])]
+
+        follower, events = self.follow(mock_get, polls, 4)
+
+        self.assertEqual([followed.eventId for followed in events], ["tev1", "tev2", "tev3", "tev4"])
+        self.assertIsInstance(events[0], Event)
+        self.assertEqual(follower.published, datetime(2020, 1, 1, 0, 0, 4, tzinfo=dateutil.tz.tzutc()))
+        self.assertEqual(follower.last_event_id, "tev4")
+        self.assertEqual(mock_get.call_args_list[0][0][0],
+                         'https://mockta.com/api/v1/events/?filter=published gt "2019-12-31T23:59:55.000Z"')
+        self.assertEqual(mock_get.call_args_list[1][0][0],
+                         'https://mockta.com/api/v1/events/?filter=published gt "2019-12-31T23:59:58.000Z"')
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_a_poll_follows_next_links(self, mock_get):
+        next_url = "https://mockta.com/api/v1/events/?after=tev2"
+        polls = [page([event("tev1", 1), event("tev2", 2)], next_url), page([event("tev3", 2)])]
+
+        follower, events = self.follow(mock_get, polls, 3)
+
+        self.assertEqual(len(events), 3)
+        self.assertEqual(mock_get.call_args_list[1][0][0], next_url)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_filter_is_combined_with_the_cursor(self, mock_get):
+        mock_get.return_value = page([event("tev1", 1)])
+        follower = EventFollower(self.client, start_date="2020-01-01T00:00:00.000Z",
+                                 filter_string='target.id eq "00u1"')
+
+        self.assertEqual([followed.eventId for followed in follower.poll()], ["tev1"])
+        self.assertEqual(mock_get.call_args[0][0], 'https://mockta.com/api/v1/events/?filter=(target.id eq "00u1") '
+                                                   'and published gt "2019-12-31T23:59:55.000Z"')
+
+    def test_interval_backs_off_while_idle(self):
+        follower = EventFollower(self.client, start_date=START, min_interval=1, max_interval=10)
+
+        intervals = []
+        for found in (0, 0, 0, 0, 0, 3, 0):
+            follower.polled(found)
+            intervals.append(follower.interval)
+
+        self.assertEqual(intervals, [2, 4, 8, 10, 10, 1, 2])
+        self.assertRaises(ValueError, EventFollower, self.client, min_interval=5, max_interval=1)
+        self.assertRaises(ValueError, EventFollower, self.client, backoff=0.5)
+
+    def test_no_min_interval_still_backs_off(self):
+        follower = EventFollower(self.client, start_date=START, min_interval=0, max_interval=3)
+
+        intervals = []
+        for found in (0, 0, 0, 0, 0, 3):
+            follower.polled(found)
+            intervals.append(follower.interval)
+
+        self.assertEqual(intervals, [0.5, 1, 2, 3, 3, 0])
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_stop_cuts_the_wait_short(self, mock_get):
+        mock_get.return_value = page([])
+        follower = self.client.follow(start_date=START, min_interval=30, max_interval=30)
+        threading.Timer(0.1, follower.stop).start()
+
+        self.assertEqual(list(follower), [])
+        self.assertEqual(follower.polls, 1)
@@ -28,7 +28,7 @@ class FactorsClientTest(unittest.TestCase):
     def tearDown(self):
         pass
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_get_factors(self, mock_get):
         # Configure the mock to return a response with an OK status code
         # and the raw text response (unparsed JSON)
@@ -41,7 +41,7 @@ class FactorsClientTest(unittest.TestCase):
         self.assertEqual(len(response), len(factor_json))
         self.assertIsInstance(response[0], Factor)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_get_factor_by_id(self, mock_get):
         mock_get.return_value = Mock(status_code=200, text=self.factor)
         response = self.client.get_factor(self.user_id, self.factor_id)
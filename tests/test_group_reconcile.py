@@ -0,0 +1,100 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.UserGroupsClient import UserGroupsClient
+from okta.framework.RetryPolicy import RetryPolicy
+
+MEMBERS = {"00g1": ["00ua", "00ub", "00uc"], "00g2": ["00ub"], "00g3": ["00ua"]}
+NOT_FOUND = json.dumps({"errorCode": "E0000007", "errorSummary": "Not found: Resource not found: 00ux (User)",
+                        "errorCauses": []})
+
+
+def get(url, **kwargs):
+    gid = url.split("/")[-2]
+    return Mock(status_code=200, text=json.dumps([{"id": uid} for uid in MEMBERS[gid]]), headers={}, links={})
+
+
+def change(url, **kwargs):
+    if url.endswith("/00ux"):
+        return Mock(status_code=404, text=NOT_FOUND, headers={})
+    return Mock(status_code=204, text="", headers={})
+
+
+@patch("okta.framework.ApiClient.requests.Session.delete", side_effect=change)
+@patch("okta.framework.ApiClient.requests.Session.put", side_effect=change)
+@patch("okta.framework.ApiClient.requests.Session.get", side_effect=get)
+class GroupReconcileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UserGroupsClient(base_url="https://mockta.com", api_token="abcdefg")
+        self.no_wait = RetryPolicy(base_delay=0, max_delay=0)
+        self.desired = {"00g1": ["00ub", "00uc", "00ud"], "00g2": {"00ub"}, "00g3": []}
+
+    def test_only_the_differences_are_changed(self, mock_get, mock_put, mock_delete):
+        result = self.client.reconcile_group_members(self.desired, workers=2, retry_policy=self.no_wait)
+
+        self.assertEqual(result.additions, {"00g1": ["00ud"]})
+        self.assertEqual(result.removals, {"00g1": ["00ua"], "00g3": ["00ua"]})
+        self.assertEqual(result.changes(), [("add", "00g1", "00ud"), ("remove", "00g1", "00ua"),
+                                            ("remove", "00g3", "00ua")])
+        self.assertEqual(mock_put.call_args[0][0], "https://mockta.com/api/v1/groups/00g1/users/00ud")
+        self.assertEqual(sorted(call[0][0] for call in mock_delete.call_args_list),
+                         ["https://mockta.com/api/v1/groups/00g1/users/00ua",
+                          "https://mockta.com/api/v1/groups/00g3/users/00ua"])
+        self.assertIsNone(self.client.rate_limiter)
+
+        summary = result.summary()
+        self.assertEqual((summary["groups"], summary["groups_changed"], summary["members"]), (3, 2, 5))
+        self.assertEqual((summary["to_add"], summary["to_remove"], summary["added"], summary["removed"]),
+                         (1, 2, 1, 2))
+        self.assertEqual((summary["failed"], summary["dry_run"]), (0, False))
+
+    def test_dry_run_changes_nothing(self, mock_get, mock_put, mock_delete):
+        result = self.client.reconcile_group_members(self.desired, dry_run=True)
+
+        self.assertEqual(len(result.changes()), 3)
+        self.assertIsNone(result.applied)
+        self.assertEqual(mock_put.call_count + mock_delete.call_count, 0)
+        summary = result.summary()
+        self.assertEqual((summary["to_add"], summary["to_remove"], summary["added"], summary["removed"]),
+                         (1, 2, 0, 0))
+        self.assertTrue(summary["dry_run"])
+
+    def test_groups_in_line_make_no_requests(self, mock_get, mock_put, mock_delete):
+        result = self.client.reconcile_group_members({"00g1": ["00uc", "00ua", "00ub"]})
+
+        self.assertEqual(result.changes(), [])
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_put.call_count + mock_delete.call_count, 0)
+
+    def test_failed_changes_are_collected(self, mock_get, mock_put, mock_delete):
+        result = self.client.reconcile_group_members({"00g2": ["00ub", "00ux", "00uy"]}, retry_policy=self.no_wait)
+
+        self.assertEqual([outcome.key for outcome in result.failed], ["add 00g2 00ux"])
+        self.assertEqual(result.failed[0].error.status_code, 404)
+        self.assertEqual(result.summary()["added"], 1)
+        self.assertEqual(result.summary()["failed"], 1)
+
+    def test_checkpoint_lasts_one_run(self, mock_get, mock_put, mock_delete):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        checkpoint = os.path.join(directory, "groups.checkpoint")
+
+        self.client.reconcile_group_members(self.desired, checkpoint=checkpoint)
+        self.assertFalse(os.path.exists(checkpoint))
+
+        # The members listed haven't changed, so the next run needs the same changes again
+        result = self.client.reconcile_group_members(self.desired, checkpoint=checkpoint)
+        self.assertEqual(result.applied.skipped, [])
+        self.assertEqual(result.summary()["added"] + result.summary()["removed"], 3)
+
+    def test_members_are_listed_under_the_rate_limits(self, mock_get, mock_put, mock_delete):
+        with patch("okta.framework.RateLimiter.RateLimiter.reserve", return_value=0) as reserve:
+            self.client.reconcile_group_members(self.desired, dry_run=True)
+
+        self.assertEqual(reserve.call_count, mock_get.call_count)
+        self.assertIsNone(self.client.rate_limiter)
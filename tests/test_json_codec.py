@@ -0,0 +1,97 @@
+import json
+import unittest
+from datetime import datetime
+
+from unittest.mock import Mock, patch
+
+from okta.UsersClient import UsersClient
+from okta.framework.JsonCodec import JsonCodec
+from okta.framework.OktaError import OktaError
+from okta.framework.Serializer import Serializer
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+
+class JsonCodecTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/user.json", "r") as file:
+            self.user = file.read()
+
+    def test_backends_encode_models_alike(self):
+        user = Utils.deserialize(self.user, User)
+        user.created = datetime(2020, 1, 2, 3, 4, 5)
+        expected = json.loads(json.dumps(user, cls=Serializer))
+        self.assertEqual(expected["created"], "dt(2020-01-02T03:04:05Z)")
+        self.assertIn("_links", expected)
+
+        for backend in JsonCodec.available_backends():
+            codec = JsonCodec(backend)
+            encoded = codec.dumps(user)
+            self.assertIsInstance(encoded, bytes)
+            self.assertEqual(json.loads(encoded.decode("utf-8")), expected, backend)
+
+    def test_backends_decode_bytes_and_text(self):
+        for backend in JsonCodec.available_backends():
+            codec = JsonCodec(backend)
+            self.assertEqual(codec.loads(self.user.encode("utf-8")), codec.loads(self.user), backend)
+            self.assertEqual(codec.loads(u'{"name": "Jürgen"}'.encode("utf-8")), {"name": u"Jürgen"})
+
+    def test_stdlib_is_always_available(self):
+        self.assertEqual(JsonCodec.available_backends()[-1], "json")
+        self.assertEqual(JsonCodec().backend, JsonCodec.available_backends()[0])
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, JsonCodec, "simplejson")
+
+    def test_set_default(self):
+        original = JsonCodec.default()
+        try:
+            JsonCodec.set_default("json")
+            self.assertEqual(JsonCodec.default().backend, "json")
+            self.assertEqual(UsersClient("http://okta.mock.invalid", "mock-api-key").json_codec.backend, "json")
+        finally:
+            JsonCodec.set_default(original)
+
+    def test_body_prefers_bytes(self):
+        self.assertEqual(JsonCodec.body(Mock(content=b"[]", text="{}")), b"[]")
+        self.assertEqual(JsonCodec.body(Mock(text="{}")), "{}")
+
+
+class ClientJsonCodecTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/user.json", "r") as file:
+            self.user = file.read()
+        self.codec = JsonCodec("json")
+        self.client = UsersClient("http://okta.mock.invalid", "mock-api-key", json_codec=self.codec)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_decodes_response_bytes(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, content=self.user.encode("utf-8"), text=None)
+
+        with patch.object(self.codec, "loads", wraps=self.codec.loads) as loads:
+            user = self.client.get_user("00ub0oNGTSWTBKOLGLNR")
+
+        self.assertEqual(user.profile.firstName, "Gordon")
+        loads.assert_called_once_with(self.user.encode("utf-8"))
+
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_encodes_request_bodies(self, mock_post):
+        mock_post.return_value = Mock(status_code=200, text=self.user)
+        user = Utils.deserialize(self.user, User)
+
+        self.client.create_user(user)
+
+        body = mock_post.call_args[1]["data"]
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body.decode("utf-8"))["profile"]["firstName"], "Gordon")
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_decodes_errors(self, mock_get):
+        error = b'{"errorSummary": "Not found", "errorCauses": []}'
+        mock_get.return_value = Mock(status_code=404, content=error, text=None, headers={})
+
+        with self.assertRaises(OktaError) as context:
+            self.client.get_user("missing")
+        self.assertEqual(context.exception.error_summary, "Not found")
@@ -0,0 +1,108 @@
+import io
+import json
+import unittest
+
+import requests
+from unittest.mock import Mock, patch
+from okta.EventsClient import EventsClient
+from okta.UserGroupsClient import UserGroupsClient
+from okta.UsersClient import UsersClient
+from okta.framework.JsonStream import JsonStream
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+
+def streamed(body, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(body)
+    response.url = "https://mockta.com/api/v1/users"
+    return response
+
+
+class JsonStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/users.json", "rb") as file:
+            self.users = file.read()
+
+    def test_items_split_across_chunks(self):
+        body = u'[ {"name": "Jürgen", "tags": ["a", "]"]}, 12345, "x\\"y" , [1, {}], null ]'.encode("utf-8")
+        expected = json.loads(body.decode("utf-8"))
+
+        for size in range(1, len(body) + 1):
+            chunks = [body[i:i + size] for i in range(0, len(body), size)]
+            self.assertEqual(list(JsonStream.iter_array(chunks)), expected, size)
+
+    def test_empty_documents(self):
+        self.assertEqual(list(JsonStream.iter_array([b"[]"])), [])
+        self.assertEqual(list(JsonStream.iter_array([b" [\n] "])), [])
+        self.assertEqual(list(JsonStream.iter_array([])), [])
+
+    def test_truncated_array(self):
+        with self.assertRaises(ValueError):
+            list(JsonStream.iter_array([b'[{"a": 1}, {"b"']))
+        with self.assertRaises(ValueError):
+            list(JsonStream.iter_array([b'[{"a": 1}']))
+
+    def test_not_an_array(self):
+        with self.assertRaises(ValueError):
+            list(JsonStream.iter_array([b'{"a": 1}']))
+
+    def test_deserialize_stream_matches_deserialize(self):
+        chunks = [self.users[i:i + 100] for i in range(0, len(self.users), 100)]
+        streamed_users = list(Utils.deserialize_stream(chunks, User))
+        users = Utils.deserialize(self.users, User)
+
+        self.assertEqual([user.id for user in streamed_users], [user.id for user in users])
+        self.assertEqual(streamed_users[0].profile.login, users[0].profile.login)
+        self.assertEqual(streamed_users[0].created, users[0].created)
+
+
+class StreamingClientsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        with open("tests/data/users.json", "rb") as file:
+            self.users = file.read()
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_get_users_streams_the_body(self, mock_get):
+        response = streamed(self.users)
+        mock_get.return_value = response
+
+        users = self.client.get_users(stream=True)
+
+        self.assertTrue(mock_get.call_args[1]["stream"])
+        self.assertFalse(response._content_consumed)
+        first = next(users)
+        self.assertIsInstance(first, User)
+        self.assertEqual(len(list(users)), len(json.loads(self.users)) - 1)
+        self.assertTrue(response.raw.closed)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_errors_are_raised_before_streaming(self, mock_get):
+        mock_get.return_value = streamed(b'{"errorSummary": "Not found", "errorCauses": []}', 404)
+
+        with self.assertRaises(Exception) as context:
+            UserGroupsClient("https://mockta.com", "abcdefg").get_group_users("missing", stream=True)
+        self.assertEqual(context.exception.status_code, 404)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_paged_results_iter_result(self, mock_get):
+        mock_get.return_value = streamed(b"[]")
+        self.assertEqual(list(EventsClient("https://mockta.com", "abcdefg").get_events(stream=True)), [])
+
+        mock_get.return_value = streamed(self.users)
+        page = self.client.get_paged_users(stream=True)
+        self.assertEqual([user.id for user in page.iter_result()],
+                         [user["id"] for user in json.loads(self.users)])
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_iter_result_of_a_read_page(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.users.decode("utf-8"), headers={}, links={})
+        page = self.client.get_paged_users()
+        users = page.result
+
+        self.assertEqual(list(page.iter_result()), users)
@@ -0,0 +1,113 @@
+import json
+import pickle
+import sys
+import threading
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.UserGroupsClient import UserGroupsClient
+from okta.UsersClient import UsersClient
+from okta.framework.Serializer import Serializer
+from okta.framework.Utils import Utils
+from okta.models.Link import Link
+from okta.models.event.Actor import Actor
+from okta.models.event.Event import Event
+from okta.models.user.LoginCredentials import LoginCredentials
+from okta.models.user.User import User
+from okta.models.user.UserProfile import UserProfile
+
+
+class LazyModelsTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/users.json", "r") as file:
+            self.users = file.read()
+
+    def test_nested_models_decode_on_first_read(self):
+        user = Utils.deserialize(self.users, User, lazy=True)[0]
+
+        self.assertIsInstance(user, User)
+        for attr in ["profile", "credentials", "links", "created"]:
+            self.assertNotIn(attr, user.__dict__)
+
+        self.assertIsInstance(user.profile, UserProfile)
+        self.assertIn("profile", user.__dict__)
+        self.assertNotIn("credentials", user.__dict__)
+        self.assertIsInstance(user.credentials, LoginCredentials)
+        self.assertIsInstance(user.links["self"], Link)
+
+    def test_lazy_and_eager_decoding_agree(self):
+        eager = Utils.deserialize(self.users, User)
+        lazy = Utils.deserialize(self.users, User, lazy=True)
+
+        for a, b in zip(eager, lazy):
+            self.assertEqual(a.profile.login, b.profile.login)
+            self.assertEqual(a.lastUpdated, b.lastUpdated)
+        self.assertEqual(json.loads(json.dumps(eager, cls=Serializer)),
+                         json.loads(json.dumps(lazy, cls=Serializer)))
+
+    def test_lists_of_nested_models(self):
+        data = [{"eventId": "tev1", "actors": [{"id": "00u1", "objectType": "User"}]}]
+        event = Utils.deserialize(data, Event, lazy=True)[0]
+
+        self.assertNotIn("actors", event.__dict__)
+        self.assertIsInstance(event.actors[0], Actor)
+        self.assertEqual(event.actors[0].id, "00u1")
+
+    def test_lazy_objects_can_be_pickled(self):
+        eager = Utils.deserialize(self.users, User)
+        for options in ({"lazy": True}, {"timestamps": "lazy"}):
+            users = Utils.deserialize(self.users, User, **options)
+            users[0].profile.login = "changed@example.com"
+
+            copies = pickle.loads(pickle.dumps(users))
+
+            self.assertIs(type(copies[0]), User)
+            self.assertIs(type(copies[0].profile), UserProfile)
+            self.assertEqual(copies[0].profile.login, "changed@example.com")
+            self.assertEqual(copies[1].lastUpdated, eager[1].lastUpdated)
+            self.assertEqual(json.loads(json.dumps(copies[1:], cls=Serializer)),
+                             json.loads(json.dumps(eager[1:], cls=Serializer)))
+
+    def test_concurrent_first_reads(self):
+        # Lazy objects are shared between threads once cached
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        errors = []
+
+        def read(user, barrier):
+            barrier.wait()
+            try:
+                user.created, user.profile
+            except AttributeError as e:
+                errors.append(e)
+
+        try:
+            for _ in range(20):
+                for user in Utils.deserialize(self.users, User, timestamps="lazy", lazy=True):
+                    barrier = threading.Barrier(4)
+                    threads = [threading.Thread(target=read, args=(user, barrier)) for _ in range(4)]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(errors, [])
+
+    def test_raw_timestamps_stay_raw(self):
+        user = Utils.deserialize(self.users, User, lazy=True, timestamps="raw")[0]
+
+        self.assertIsInstance(user.created, str)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_client_option_applies_to_listings(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, text=self.users, headers={}, links={})
+        users_client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", lazy=True)
+        groups_client = UserGroupsClient(base_url="https://mockta.com", api_token="abcdefg", lazy=True)
+
+        for users in [users_client.get_users(), groups_client.get_group_users("00g1"),
+                      users_client.get_paged_users().result]:
+            self.assertNotIn("profile", users[0].__dict__)
+            self.assertIsNotNone(users[0].profile.login)
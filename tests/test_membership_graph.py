@@ -0,0 +1,62 @@
+import json
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.UserGroupsClient import UserGroupsClient
+from okta.framework.MembershipGraph import MembershipGraph
+
+
+def response(data, status_code=200):
+    return Mock(status_code=status_code, text=json.dumps(data), headers={}, links={})
+
+
+class MembershipGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = MembershipGraph()
+        self.graph.add_group("00g1", ["00ua", "00ub", "00uc"])
+        self.graph.add_group("00g2", ["00ub", "00uc", "00ud"])
+        self.graph.add_group("00g3", ["00uc"])
+
+    def test_both_directions(self):
+        self.assertEqual(self.graph.members_of("00g2"), ["00ub", "00uc", "00ud"])
+        self.assertEqual(self.graph.groups_of("00uc"), ["00g1", "00g2", "00g3"])
+        self.assertEqual(self.graph.groups_of("00ux"), [])
+        self.assertTrue(self.graph.is_member("00ua", "00g1"))
+        self.assertFalse(self.graph.is_member("00ua", "00g2"))
+        self.assertFalse(self.graph.is_member("00ux", "00g9"))
+
+    def test_set_queries(self):
+        self.assertEqual(self.graph.intersection("00g1", "00g2"), ["00ub", "00uc"])
+        self.assertEqual(self.graph.union("00g1", "00g2"), ["00ua", "00ub", "00uc", "00ud"])
+        self.assertEqual(self.graph.common_groups("00ub", "00uc"), ["00g1", "00g2"])
+        self.assertEqual(self.graph.intersection(), [])
+
+    def test_replacing_a_group_updates_the_reverse_index(self):
+        self.assertEqual(self.graph.groups_of("00ua"), ["00g1"])
+        self.graph.add_group("00g1", ["00ud"])
+
+        self.assertEqual(self.graph.groups_of("00ua"), [])
+        self.assertEqual(self.graph.groups_of("00ud"), ["00g1", "00g2"])
+        self.assertEqual(self.graph.stats(), {"groups": 3, "users": 4, "memberships": 5, "failed": 0})
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_crawl(self, mock_get):
+        members = {"00g1": [{"id": "00ua"}, {"id": "00ub"}], "00g2": [{"id": "00ub"}]}
+
+        def get(url, **kwargs):
+            if url.startswith("https://mockta.com/api/v1/groups/?"):
+                return response([{"id": "00g1"}, {"id": "00g2"}, {"id": "00g3"}])
+            gid = url.split("/")[-2]
+            if gid == "00g3":
+                return response({"errorCode": "E0000007", "errorSummary": "Not found"}, 404)
+            return response(members[gid])
+        mock_get.side_effect = get
+        client = UserGroupsClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        graph = MembershipGraph.crawl(client, workers=2)
+
+        self.assertEqual(graph.groups_of("00ub"), ["00g1", "00g2"])
+        self.assertEqual(graph.group_ids, ["00g1", "00g2"])
+        self.assertEqual([failure.key for failure in graph.failed], ["00g3"])
+        self.assertIsNone(client.rate_limiter)
@@ -0,0 +1,204 @@
+import itertools
+import json
+import threading
+import time
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.AppInstanceClient import AppInstanceClient
+from okta.EventsClient import EventsClient
+from okta.UserGroupsClient import UserGroupsClient
+from okta.UsersClient import UsersClient
+from okta.framework.OktaError import OktaError
+from okta.framework.PagePrefetcher import PagePrefetcher
+from okta.framework.PagedResults import PagedResults
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+from okta.models.usergroup.UserGroup import UserGroup
+
+NEXT_URL = "https://mockta.com/api/v1/users?after=abc"
+
+
+def page(text, next_url=None):
+    links = {"next": {"url": next_url}} if next_url else {}
+    return Mock(status_code=200, text=text, headers={}, links=links)
+
+
+class PagedIteratorsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        with open("tests/data/users.json", "r") as file:
+            self.users = file.read()
+
+        with open("tests/data/user_groups.json", "r") as file:
+            self.user_groups = file.read()
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_iter_users_follows_every_page(self, mock_get):
+        mock_get.side_effect = [page(self.users, NEXT_URL), page(self.users)]
+
+        users = list(self.client.iter_users(limit=5))
+
+        self.assertEqual(len(users), 10)
+        self.assertIsInstance(users[0], User)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args_list[0][0][0], "https://mockta.com/api/v1/users/?limit=5")
+        self.assertEqual(mock_get.call_args_list[1][0][0], NEXT_URL)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_nothing_is_fetched_until_iterated(self, mock_get):
+        users = self.client.iter_users()
+        self.assertEqual(mock_get.call_count, 0)
+
+        mock_get.return_value = page(self.users)
+        next(users)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_stopping_early_fetches_no_more_pages(self, mock_get):
+        mock_get.return_value = page(self.users, NEXT_URL)
+
+        users = list(itertools.islice(self.client.iter_users(), 5))
+
+        self.assertEqual(len(users), 5)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_each_page_is_decoded_once(self, mock_get):
+        mock_get.return_value = page(self.users)
+        paged = self.client.get_paged_users()
+
+        with patch.object(Utils, "deserialize", wraps=Utils.deserialize) as deserialize:
+            self.assertIs(paged.result, paged.result)
+            list(PagedResults.iterate(lambda **params: paged))
+
+        self.assertEqual(deserialize.call_count, 1)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_other_clients(self, mock_get):
+        mock_get.return_value = page(self.user_groups)
+        groups = list(UserGroupsClient("https://mockta.com", "abcdefg").iter_groups())
+        self.assertEqual(len(groups), len(json.loads(self.user_groups)))
+        self.assertIsInstance(groups[0], UserGroup)
+
+        mock_get.return_value = page("[]")
+        self.assertEqual(list(AppInstanceClient("https://mockta.com", "abcdefg").iter_app_instances()), [])
+
+        mock_get.return_value = page("[]")
+        self.assertEqual(list(EventsClient("https://mockta.com", "abcdefg").iter_events(start_date="2020")), [])
+        self.assertEqual(mock_get.call_args[0][0], "https://mockta.com/api/v1/events/?startDate=2020")
+
+
+class PrefetchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        with open("tests/data/users.json", "r") as file:
+            self.users = file.read()
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_prefetch_yields_every_page_in_order(self, mock_get):
+        urls = ["https://mockta.com/api/v1/users?after={0}".format(n) for n in range(4)]
+        mock_get.side_effect = [page(self.users, url) for url in urls] + [page("[]")]
+
+        users = list(self.client.iter_users(prefetch=2))
+
+        self.assertEqual(len(users), 20)
+        self.assertEqual([call[0][0] for call in mock_get.call_args_list[1:]], urls)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_next_page_is_fetched_while_the_current_one_is_used(self, mock_get):
+        fetched = threading.Event()
+
+        def get(url, **kwargs):
+            if "after" in url:
+                fetched.set()
+                return page(self.users)
+            return page(self.users, NEXT_URL)
+        mock_get.side_effect = get
+
+        users = self.client.iter_users(prefetch=1)
+        next(users)
+        self.assertTrue(fetched.wait(5))
+        self.assertEqual(len(list(users)), 9)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_errors_reach_the_caller(self, mock_get):
+        error = '{"errorSummary": "Bad filter", "errorCauses": []}'
+        mock_get.side_effect = [page(self.users, NEXT_URL),
+                                Mock(status_code=400, text=error, headers={}, links={})]
+
+        users = self.client.iter_users(prefetch=1)
+        self.assertEqual(len(list(itertools.islice(users, 5))), 5)
+        with self.assertRaises(OktaError) as context:
+            next(users)
+        self.assertEqual(context.exception.error_summary, "Bad filter")
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_stopping_early_stops_the_worker(self, mock_get):
+        mock_get.return_value = page(self.users, NEXT_URL)
+
+        prefetcher = PagePrefetcher(self.client.get_paged_users, 1)
+        next(iter(prefetcher))
+        prefetcher.close()
+        time.sleep(PagePrefetcher.POLL_INTERVAL * 3)
+        calls = mock_get.call_count
+        time.sleep(PagePrefetcher.POLL_INTERVAL * 3)
+
+        self.assertEqual(mock_get.call_count, calls)
+        self.assertLessEqual(calls, 3)
+
+
+class GroupMembersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UserGroupsClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        with open("tests/data/users.json", "r") as file:
+            self.users = file.read()
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_iter_group_users_follows_every_page(self, mock_get):
+        next_url = "https://mockta.com/api/v1/groups/00g1/users?after=abc"
+        mock_get.side_effect = [page(self.users, next_url), page(self.users)]
+
+        users = list(self.client.iter_group_users("00g1", limit=5))
+
+        self.assertEqual(len(users), 10)
+        self.assertIsInstance(users[0], User)
+        self.assertEqual(mock_get.call_args_list[0][0][0], "https://mockta.com/api/v1/groups/00g1/users?limit=5")
+        self.assertEqual(mock_get.call_args_list[1][0][0], next_url)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_members_of_many_groups_concurrently(self, mock_get):
+        def get(url, **kwargs):
+            gid = url.split("/")[-2]
+            if "after" in url:
+                return page(self.users)
+            return page(self.users, "https://mockta.com/api/v1/groups/{0}/users?after=abc".format(gid))
+        mock_get.side_effect = get
+        gids = ["00g{0}".format(n) for n in range(6)]
+
+        members = list(self.client.iter_members_of_groups(gids, workers=3))
+
+        self.assertEqual(len(members), 60)
+        self.assertEqual(set(gid for gid, user in members), set(gids))
+        self.assertIsInstance(members[0][1], User)
+        self.assertEqual(mock_get.call_count, 12)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_a_failing_group_reaches_the_caller(self, mock_get):
+        error = '{"errorSummary": "Not found: Resource not found: 00g2 (UserGroup)", "errorCauses": []}'
+
+        def get(url, **kwargs):
+            if "/00g2/" in url:
+                return Mock(status_code=404, text=error, headers={}, links={})
+            return page(self.users)
+        mock_get.side_effect = get
+
+        with self.assertRaises(OktaError) as context:
+            list(self.client.iter_members_of_groups(["00g1", "00g2", "00g3"], workers=2))
+        self.assertEqual(context.exception.status_code, 404)
@@ -0,0 +1,122 @@
+import time
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.UsersClient import UsersClient
+from okta.framework.RateLimiter import RateLimiter
+
+NOW = 1600000000
+
+
+def rate_limit_headers(limit, remaining, reset):
+    return {
+        'X-Rate-Limit-Limit': str(limit),
+        'X-Rate-Limit-Remaining': str(remaining),
+        'X-Rate-Limit-Reset': str(reset)
+    }
+
+
+@patch("okta.framework.RateLimiter.time.time", return_value=NOW)
+class RateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.limiter = RateLimiter()
+        self.url = "https://mockta.com/api/v1/users?limit=200"
+
+    def test_buckets_by_endpoint(self, mock_time):
+        self.assertEqual(RateLimiter.bucket_for("https://mockta.com/api/v1/users/?q=a"), "/api/v1/users")
+        self.assertEqual(RateLimiter.bucket_for("https://mockta.com/api/v1/users/00u1/groups"), "/api/v1/users/*")
+        self.assertEqual(RateLimiter.bucket_for("https://mockta.com/api/v1/authn/factors"), "/api/v1/authn/*")
+
+    def test_unknown_budget_does_not_wait(self, mock_time):
+        self.assertEqual(self.limiter.reserve(self.url), 0)
+        self.assertIsNone(self.limiter.remaining(self.url))
+
+    def test_plenty_of_budget_does_not_wait(self, mock_time):
+        self.limiter.update(self.url, rate_limit_headers(600, 500, NOW + 30))
+
+        self.assertEqual(self.limiter.reserve(self.url), 0)
+        self.assertEqual(self.limiter.reserve(self.url), 0)
+        self.assertEqual(self.limiter.remaining(self.url), 498)
+
+    def test_low_budget_spaces_requests(self, mock_time):
+        self.limiter.update(self.url, rate_limit_headers(600, 11, NOW + 30))
+
+        self.assertEqual(self.limiter.reserve(self.url), 0)
+        # 10 requests left to spread over 30 seconds
+        self.assertAlmostEqual(self.limiter.reserve(self.url), 3.0)
+
+    def test_spent_budget_waits_for_reset(self, mock_time):
+        self.limiter.update(self.url, rate_limit_headers(600, 1, NOW + 12))
+
+        self.assertEqual(self.limiter.reserve(self.url), 12)
+        self.assertEqual(self.limiter.remaining(self.url), 599)
+
+    def test_buckets_are_independent(self, mock_time):
+        self.limiter.update(self.url, rate_limit_headers(600, 1, NOW + 12))
+
+        self.assertEqual(self.limiter.reserve("https://mockta.com/api/v1/groups"), 0)
+
+    def test_server_budget_does_not_undo_in_flight_requests(self, mock_time):
+        self.limiter.update(self.url, rate_limit_headers(600, 500, NOW + 30))
+        for _ in range(10):
+            self.limiter.reserve(self.url)
+        self.limiter.update(self.url, rate_limit_headers(600, 499, NOW + 30))
+
+        self.assertEqual(self.limiter.remaining(self.url), 490)
+
+    def test_new_window_replaces_budget(self, mock_time):
+        self.limiter.update(self.url, rate_limit_headers(600, 3, NOW + 5))
+        self.limiter.update(self.url, rate_limit_headers(600, 599, NOW + 65))
+
+        self.assertEqual(self.limiter.remaining(self.url), 599)
+
+    def test_missing_headers_are_ignored(self, mock_time):
+        self.limiter.update(self.url, {})
+        self.limiter.update(self.url, Mock())
+
+        self.assertIsNone(self.limiter.remaining(self.url))
+
+
+class ApiClientRateLimitTest(unittest.TestCase):
+
+    @patch("okta.framework.ApiClient.time.sleep")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_client_paces_with_shared_limiter(self, mock_get, mock_sleep):
+        limiter = RateLimiter()
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", rate_limiter=limiter)
+        reset = int(time.time()) + 30
+        mock_get.return_value = Mock(status_code=200, text="[]",
+                                     headers=rate_limit_headers(600, 1, reset))
+
+        client.get_users()
+        mock_sleep.assert_not_called()
+
+        client.get_users()
+        mock_sleep.assert_called_once()
+        self.assertGreater(mock_sleep.call_args[0][0], 25)
+
+    def test_paced_leaves_the_client_as_it_was(self):
+        limiter = RateLimiter()
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        limited = UsersClient(base_url="https://mockta.com", api_token="abcdefg", rate_limiter=limiter)
+
+        paced = client.paced()
+
+        self.assertIsNot(paced, client)
+        self.assertIsInstance(paced, UsersClient)
+        self.assertIsInstance(paced.rate_limiter, RateLimiter)
+        self.assertIs(paced.session, client.session)
+        self.assertIsNone(client.rate_limiter)
+        self.assertIs(limited.paced(), limited)
+
+    @patch("okta.framework.RateLimiter.RateLimiter.reserve", return_value=0)
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_bulk_runs_are_paced(self, mock_post, mock_reserve):
+        mock_post.return_value = Mock(status_code=200, text="{}", headers={})
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        client.bulk_lifecycle(["00u1", "00u2"], "suspend")
+
+        self.assertEqual(mock_reserve.call_count, 2)
+        self.assertIsNone(client.rate_limiter)
@@ -0,0 +1,134 @@
+import json
+import time
+import unittest
+
+import requests
+from unittest.mock import Mock, patch
+from okta.UsersClient import UsersClient
+from okta.framework.OktaError import OktaError
+from okta.framework.RetryPolicy import RetryPolicy
+from okta.models.user.User import User
+
+ERROR = json.dumps({"errorSummary": "Too many requests", "errorCauses": []})
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=4, base_delay=0.5, max_delay=30)
+
+    def test_rate_limited_waits_for_reset(self):
+        now = 1600000000
+        response = Mock(status_code=429, headers={
+            "X-Rate-Limit-Reset": str(now + 7),
+            "Date": "Sun, 13 Sep 2020 12:26:40 GMT"
+        })
+
+        self.assertEqual(self.policy.next_delay("POST", 1, 0, response=response), 7)
+
+    def test_retry_after_is_preferred(self):
+        response = Mock(status_code=429, headers={"Retry-After": "3", "X-Rate-Limit-Reset": "0"})
+
+        self.assertEqual(self.policy.next_delay("GET", 1, 0, response=response), 3)
+
+    def test_decorrelated_jitter_is_bounded(self):
+        response = Mock(status_code=503, headers={})
+        delay = None
+        for attempt in range(1, 4):
+            previous = delay
+            delay = self.policy.next_delay("GET", attempt, 0, delay, response=response)
+            self.assertGreaterEqual(delay, 0.5)
+            self.assertLessEqual(delay, 3 * (previous or 0.5))
+
+    def test_server_errors_only_retried_for_idempotent_methods(self):
+        response = Mock(status_code=502, headers={})
+
+        self.assertIsNotNone(self.policy.next_delay("DELETE", 1, 0, response=response))
+        self.assertIsNone(self.policy.next_delay("POST", 1, 0, response=response))
+
+    def test_connection_errors_only_retried_for_idempotent_methods(self):
+        error = requests.exceptions.ConnectionError()
+
+        self.assertIsNotNone(self.policy.next_delay("GET", 1, 0, error=error))
+        self.assertIsNone(self.policy.next_delay("POST", 1, 0, error=error))
+
+    def test_idempotence_can_be_given_explicitly(self):
+        response = Mock(status_code=503, headers={})
+
+        self.assertIsNotNone(self.policy.next_delay("POST", 1, 0, response=response, idempotent=True))
+        self.assertIsNone(self.policy.next_delay("PUT", 1, 0, response=response, idempotent=False))
+
+    def test_client_errors_are_not_retried(self):
+        self.assertIsNone(self.policy.next_delay("GET", 1, 0, response=Mock(status_code=404, headers={})))
+
+    def test_gives_up_after_max_attempts_or_deadline(self):
+        response = Mock(status_code=429, headers={"Retry-After": "5"})
+
+        self.assertIsNone(self.policy.next_delay("GET", 4, 0, response=response))
+        self.assertIsNone(RetryPolicy(deadline=10).next_delay("GET", 1, 6, response=response))
+
+
+class ApiClientRetryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+
+        with open("tests/data/created_user.json", "r") as file:
+            self.created_user = file.read()
+
+    @patch("okta.framework.ApiClient.time.sleep")
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_retry_sends_the_same_body(self, mock_post, mock_sleep):
+        reset = int(time.time()) + 2
+        limited = Mock(status_code=429, text=ERROR, headers={"X-Rate-Limit-Reset": str(reset)})
+        mock_post.side_effect = [limited, limited, Mock(status_code=200, text=self.created_user, headers={})]
+        user = User(login="a@example.com", firstName="A", lastName="B")
+
+        response = self.client.create_user(user)
+
+        self.assertIsInstance(response, User)
+        self.assertEqual(mock_post.call_count, 3)
+        bodies = [call[1]["data"] for call in mock_post.call_args_list]
+        self.assertEqual(bodies[0], bodies[2])
+        self.assertEqual(json.loads(bodies[0])["profile"]["login"], "a@example.com")
+        self.assertLessEqual(mock_sleep.call_args[0][0], 2)
+
+    @patch("okta.framework.ApiClient.time.sleep")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_connection_error_is_retried_for_get(self, mock_get, mock_sleep):
+        with open("tests/data/user.json", "r") as file:
+            user = file.read()
+        mock_get.side_effect = [requests.exceptions.ConnectionError(), Mock(status_code=200, text=user, headers={})]
+
+        self.assertIsInstance(self.client.get_user("00ub0oNGTSWTBKOLGLNR"), User)
+        mock_sleep.assert_called_once()
+
+    @patch("okta.framework.ApiClient.time.sleep")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_gives_up_with_okta_error(self, mock_get, mock_sleep):
+        mock_get.return_value = Mock(status_code=429, text=ERROR, headers={"Retry-After": "1"})
+
+        with self.assertRaises(OktaError) as context:
+            self.client.get_users()
+        self.assertEqual(context.exception.status_code, 429)
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch("okta.framework.ApiClient.time.sleep")
+    @patch("okta.framework.ApiClient.requests.Session.post")
+    def test_custom_policy_is_used(self, mock_post, mock_sleep):
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg",
+                             retry_policy=RetryPolicy(max_attempts=1))
+        mock_post.return_value = Mock(status_code=429, text=ERROR, headers={})
+
+        self.assertRaises(OktaError, client.deactivate_user, "00ub0oNGTSWTBKOLGLNR")
+        mock_sleep.assert_not_called()
+
+    @patch("okta.framework.ApiClient.time.sleep")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_max_attempts_set_on_the_client(self, mock_get, mock_sleep):
+        mock_get.return_value = Mock(status_code=429, text=ERROR, headers={})
+        self.client.max_attempts = 2
+
+        self.assertEqual(self.client.retry_policy.max_attempts, 2)
+        self.assertRaises(OktaError, self.client.get_users)
+        self.assertEqual(mock_get.call_count, 2)
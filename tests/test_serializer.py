@@ -0,0 +1,53 @@
+import json
+import unittest
+from datetime import datetime
+
+from okta.framework.Serializer import Serializer
+from okta.framework.Utils import Utils
+from okta.models.user.CompactUser import CompactUser
+from okta.models.user.User import User
+
+
+class SerializerTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/user.json", "r") as file:
+            self.user = file.read()
+
+    def test_encoder_is_compiled_once_per_class(self):
+        self.assertIs(Serializer.encoder_for(User), Serializer.encoder_for(User))
+
+    def test_matches_the_reflective_conversion(self):
+        for lazy in (False, True):
+            user = Utils.deserialize(self.user, User, lazy=lazy)
+            reflective = Utils.replace_alt_names(user, Utils.remove_nulls(Utils.model_attributes(user)))
+            self.assertEqual(Serializer.to_wire(user), json.loads(json.dumps(reflective, cls=Serializer)))
+
+    def test_one_pass_wire_dict(self):
+        user = User(login="a@example.com", firstName="A")
+        user.created = datetime(2020, 1, 2, 3, 4, 5)
+        user.links = {"self": {"href": "https://example.okta.com"}}
+
+        self.assertEqual(Serializer.to_wire(user), {
+            "created": "dt(2020-01-02T03:04:05Z)",
+            "profile": {"login": "a@example.com", "firstName": "A"},
+            "_links": {"self": {"href": "https://example.okta.com"}}
+        })
+
+    def test_nulls_in_plain_dicts_are_kept(self):
+        user = User(login="a@example.com")
+        self.assertEqual(Serializer.to_wire({"profile": {"title": None}, "users": [user]}),
+                         {"profile": {"title": None}, "users": [{"profile": {"login": "a@example.com"}}]})
+
+    def test_compact_models(self):
+        user = Utils.deserialize(self.user, CompactUser)
+        self.assertEqual(Serializer.to_wire(user), Serializer.to_wire(Utils.deserialize(self.user, User)))
+
+    def test_unsupported_values(self):
+        self.assertRaises(TypeError, Serializer.to_wire, object())
+
+    def test_timestamp_formats(self):
+        value = datetime(2020, 1, 2, 3, 4, 5, 678900)
+
+        self.assertEqual(Serializer.format_timestamp(value), "dt(2020-01-02T03:04:05Z)")
+        self.assertEqual(Serializer.format_filter_timestamp(value), "2020-01-02T03:04:05.678Z")
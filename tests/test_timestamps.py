@@ -0,0 +1,83 @@
+import json
+import unittest
+
+import dateutil.parser
+from datetime import datetime
+from unittest.mock import Mock, patch
+from okta.EventsClient import EventsClient
+from okta.UsersClient import UsersClient
+from okta.framework.Deserializer import Deserializer
+from okta.framework.Serializer import Serializer
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+
+class TimestampParsingTest(unittest.TestCase):
+
+    def test_okta_format_matches_dateutil(self):
+        for value in ["2020-01-01T00:00:00.000Z", "2015-04-06T18:55:36.123Z",
+                      "2019-12-31T23:59:59Z", "2020-02-29T12:00:00.5Z"]:
+            self.assertEqual(Deserializer.parse_timestamp(value), dateutil.parser.parse(value))
+            self.assertIsNotNone(Deserializer.parse_timestamp(value).tzinfo)
+
+    def test_other_formats_fall_back_to_dateutil(self):
+        value = "2020-01-01T10:00:00+02:00"
+
+        self.assertEqual(Deserializer.parse_timestamp(value), dateutil.parser.parse(value))
+
+    def test_invalid_timestamp_raises(self):
+        self.assertRaises(ValueError, Deserializer.parse_timestamp, "2020-13-01T00:00:00.000Z")
+
+
+class TimestampModesTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/user.json", "r") as file:
+            self.user = file.read()
+        self.created = json.loads(self.user)["created"]
+
+    def test_raw_mode_keeps_strings(self):
+        user = Utils.deserialize(self.user, User, timestamps="raw")
+
+        self.assertEqual(user.created, self.created)
+
+    def test_lazy_mode_parses_on_first_read(self):
+        user = Utils.deserialize(self.user, User, timestamps="lazy")
+
+        self.assertIsInstance(user, User)
+        self.assertNotIn("created", user.__dict__)
+        self.assertEqual(user.created, dateutil.parser.parse(self.created))
+        self.assertIsInstance(user.__dict__["created"], datetime)
+
+    def test_lazy_mode_assignment_before_read_wins(self):
+        user = Utils.deserialize(self.user, User, timestamps="lazy")
+        user.created = None
+
+        self.assertIsNone(user.created)
+        serialized = json.loads(json.dumps(user, cls=Serializer))
+        self.assertNotIn("created", serialized)
+        self.assertIn("lastUpdated", serialized)
+        self.assertNotIn("_lazy", serialized)
+
+    def test_unknown_mode_raises(self):
+        self.assertRaises(ValueError, Utils.deserialize, self.user, User, timestamps="never")
+        self.assertRaises(ValueError, UsersClient, base_url="https://mockta.com", api_token="abcdefg",
+                          timestamps="never")
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_client_option_applies_to_listings(self, mock_get):
+        with open("tests/data/users.json", "r") as file:
+            users = file.read()
+        mock_get.return_value = Mock(status_code=200, text=users, headers={}, links={})
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", timestamps="raw")
+
+        self.assertIsInstance(client.get_users()[0].created, str)
+        self.assertIsInstance(client.get_paged_users().result[0].created, str)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_lazy_events(self, mock_get):
+        events = '[{"eventId": "tev1", "published": "2015-04-06T18:55:36.000Z"}]'
+        mock_get.return_value = Mock(status_code=200, text=events, headers={})
+        client = EventsClient(base_url="https://mockta.com", api_token="abcdefg", timestamps="lazy")
+
+        self.assertEqual(client.get_events()[0].published.year, 2015)
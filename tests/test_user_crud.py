@@ -41,7 +41,7 @@ class UsersClientTest(unittest.TestCase):
     def tearDown(self):
         pass
 
-    @patch("okta.framework.ApiClient.requests.post")
+    @patch("okta.framework.ApiClient.requests.Session.post")
     def test_create_new_user_returns_ok(self, mock_post):
         user = self.created_user_json
         mock_post.return_value = Mock(
@@ -52,7 +52,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertIsInstance(response, User)
         #self.assertEqual(response.status, "STAGED")
 
-    @patch("okta.framework.ApiClient.requests.post")
+    @patch("okta.framework.ApiClient.requests.Session.post")
     def test_update_user_partial_update_returns_ok(self, mock_post):
         user = self.created_user_json
         mock_post.return_value = Mock(
@@ -63,7 +63,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertIsInstance(response, User)
         #self.assertEqual(response.status, "STAGED")
 
-    @patch("okta.framework.ApiClient.requests.put")
+    @patch("okta.framework.ApiClient.requests.Session.put")
     def test_update_user_full_update_returns_ok(self, mock_put):
         user = self.created_user_json
         mock_put.return_value = Mock(
@@ -74,7 +74,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertIsInstance(response, User)
         #self.assertEqual(response.status, "STAGED")
 
-    @patch("okta.framework.ApiClient.requests.delete")
+    @patch("okta.framework.ApiClient.requests.Session.delete")
     def test_delete_user_returns_ok(self, mock_delete):
         user_id = self.user_json.id
         mock_delete.return_value = Mock(
@@ -83,7 +83,7 @@ class UsersClientTest(unittest.TestCase):
 
         self.assertIsNotNone(response)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_get_users_returns_ok(self, mock_get):
         mock_get.return_value = Mock(
             status_code=status.HTTP_200_OK, text=self.users)
@@ -94,7 +94,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(len(response), len(self.users_json))
         self.assertIsInstance(response[0], User)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_get_user_by_id_returns_ok(self, mock_get):
         user_id = self.user_json.id
         mock_get.return_value = Mock(
@@ -105,7 +105,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertIsInstance(response, User)
         self.assertEqual(response.id, user_id)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_limit_returns_ok(self, mock_get):
         limit = 2
         # is it a valid test to manipulate the return data from a mocked function?
@@ -123,7 +123,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(len(response), limit)
         self.assertGreater(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_query_first_name_returns_ok(self, mock_get):
         # query supports searching by first name, last name and emails
         query = "Gordon"
@@ -139,7 +139,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(query, response[0].profile.firstName)
         self.assertGreater(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_query_last_name_returns_ok(self, mock_get):
         # query supports searching by first name, last name and emails
         query = "Sumner"
@@ -155,7 +155,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(query, response[0].profile.lastName)
         self.assertGreater(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_query_primary_email_returns_ok(self, mock_get):
         # query supports searching by first name, last name and emails
         query = "gordon@mailinator.com"
@@ -171,7 +171,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(query, response[0].profile.email)
         self.assertGreater(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_query_secondary_email_returns_nothing(self, mock_get):
         # query supports searching by first name, last name and emails
         query = "sting@mailinator.com"
@@ -183,7 +183,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertIsNotNone(response)
         self.assertEqual(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_filter_by_status_returns_ok(self, mock_get):
         # filter supports a limited set of properties:
         # status, lastUpdated, id, profile.login, profile.email,
@@ -201,7 +201,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertIsInstance(response[0], User)
         self.assertEqual(response[0].status, "ACTIVE")
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_filter_by_lastUpdated_returns_ok(self, mock_get):
         # filter supports a limited set of properties:
         # status, lastUpdated, id, profile.login, profile.email,
@@ -218,7 +218,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(len(response), 5)
         self.assertIsInstance(response[0], User)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_filter_by_id_returns_ok(self, mock_get):
         # filter supports a limited set of properties:
         # status, lastUpdated, id, profile.login, profile.email,
@@ -238,7 +238,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(response[0].id, user_id)
         self.assertGreater(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_filter_by_login_returns_ok(self, mock_get):
         # filter supports a limited set of properties:
         # status, lastUpdated, id, profile.login, profile.email,
@@ -258,7 +258,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(response[0].profile.login, login)
         self.assertGreater(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_filter_by_email_returns_ok(self, mock_get):
         # filter supports a limited set of properties:
         # status, lastUpdated, id, profile.login, profile.email,
@@ -278,7 +278,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(response[0].profile.email, email)
         self.assertGreater(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_filter_by_first_name_returns_ok(self, mock_get):
         # filter supports a limited set of properties:
         # status, lastUpdated, id, profile.login, profile.email,
@@ -298,7 +298,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(response[0].profile.firstName, first_name)
         self.assertGreater(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_list_users_with_filter_by_last_name_returns_ok(self, mock_get):
         # filter supports a limited set of properties:
         # status, lastUpdated, id, profile.login, profile.email,
@@ -318,7 +318,7 @@ class UsersClientTest(unittest.TestCase):
         self.assertEqual(response[0].profile.lastName, last_name)
         self.assertGreater(len(response), 0)
 
-    @patch("okta.framework.ApiClient.requests.get")
+    @patch("okta.framework.ApiClient.requests.Session.get")
     def test_get_user_groups_returns_ok(self, mock_get):
         user_id = self.user_json.id
         mock_get.return_value = Mock(
@@ -0,0 +1,116 @@
+import csv
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.UsersClient import UsersClient
+from okta.framework.UserExporter import UserExporter, pyarrow
+from okta.models.user.User import User
+from okta.models.user.UserProfile import UserProfile
+
+NEXT_URL = "https://mockta.com/api/v1/users?after=abc"
+
+
+def page(text, next_url=None):
+    links = {"next": {"url": next_url}} if next_url else {}
+    return Mock(status_code=200, text=text, headers={}, links=links)
+
+
+class ExtendedUserProfile(UserProfile):
+    types = dict(UserProfile.types, windows_username=str)
+
+    def __init__(self):
+        UserProfile.__init__(self)
+        self.windows_username = None
+
+
+class ExtendedUser(User):
+    types = dict(User.types, profile=ExtendedUserProfile)
+
+
+class UserExporterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        self.directory = tempfile.mkdtemp()
+
+        with open("tests/data/users.json", "r") as file:
+            self.users = file.read()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_batches_are_columns_of_every_page(self, mock_get):
+        mock_get.side_effect = [page(self.users, NEXT_URL), page(self.users)]
+        exporter = UserExporter(self.client, batch_size=3)
+
+        with patch("okta.framework.Deserializer.Deserializer.decoder_for") as decoder_for:
+            batches = list(exporter.batches())
+            decoder_for.assert_not_called()
+
+        self.assertEqual([len(batch["id"]) for batch in batches], [3, 3, 3, 1])
+        self.assertEqual(exporter.exported, 10)
+        self.assertIn("profile.login", exporter.columns)
+        self.assertIn("lastUpdated", exporter.columns)
+        self.assertTrue(mock_get.call_args_list[0][1]["stream"])
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_prefetched_pages_are_not_decoded_into_models(self, mock_get):
+        mock_get.side_effect = [page(self.users, NEXT_URL), page(self.users)]
+        exporter = UserExporter(self.client, batch_size=3, prefetch=1)
+
+        with patch("okta.framework.Deserializer.Deserializer.decoder_for") as decoder_for:
+            batches = list(exporter.batches())
+            decoder_for.assert_not_called()
+
+        self.assertEqual(exporter.exported, 10)
+        self.assertEqual(sum(len(batch["id"]) for batch in batches), 10)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_csv(self, mock_get):
+        mock_get.return_value = page(self.users)
+        target = io.StringIO()
+
+        count = UserExporter(self.client, columns=["id", "status", "profile.login"]).to_csv(target)
+
+        rows = list(csv.reader(io.StringIO(target.getvalue())))
+        self.assertEqual(count, 5)
+        self.assertEqual(rows[0], ["id", "status", "profile.login"])
+        self.assertEqual(len(rows), 6)
+        self.assertTrue(all(row[2] for row in rows[1:]))
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_extended_and_custom_profile_attributes(self, mock_get):
+        mock_get.return_value = page(self.users)
+        client = UsersClient(base_url="https://mockta.com", api_token="abcdefg", user_class=ExtendedUser)
+
+        exporter = UserExporter(client, profile_attributes=["costCenter", "badge"])
+
+        self.assertIn("profile.windows_username", exporter.columns)
+        self.assertEqual(exporter.columns.count("profile.costCenter"), 1)
+        self.assertEqual(exporter.columns[-1], "profile.badge")
+        self.assertEqual(list(exporter.batches())[0]["profile.badge"], [None] * 5)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_parquet_and_arrow(self, mock_get):
+        import pyarrow.parquet
+
+        mock_get.side_effect = lambda *args, **kwargs: page(self.users)
+        exporter = UserExporter(self.client, batch_size=2)
+
+        path = os.path.join(self.directory, "users.parquet")
+        self.assertEqual(exporter.to_parquet(path), 5)
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.num_rows, 5)
+        self.assertEqual(table.schema.field("created").type, pyarrow.timestamp("ms", tz="UTC"))
+        self.assertEqual(table.schema.field("profile.login").type, pyarrow.string())
+
+        path = os.path.join(self.directory, "users.arrow")
+        self.assertEqual(exporter.to_arrow(path), 5)
+        with pyarrow.memory_map(path) as source:
+            self.assertEqual(pyarrow.ipc.open_file(source).read_all().num_rows, 5)
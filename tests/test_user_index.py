@@ -0,0 +1,85 @@
+import json
+import unittest
+
+from unittest.mock import Mock, patch
+from okta.UsersClient import UsersClient
+from okta.framework.UserIndex import UserIndex
+from okta.framework.UserSync import UserSync
+from okta.framework.Utils import Utils
+from okta.models.user.User import User
+
+
+class UserIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/data/users.json", "r") as file:
+            self.users = json.load(file)
+        self.index = UserIndex(users=Utils.deserialize(self.users, User))
+
+    def test_point_lookups_ignore_case(self):
+        login = self.users[1]["profile"]["login"]
+
+        self.assertEqual(self.index.find_one("login", login.upper()).id, self.users[1]["id"])
+        self.assertEqual(self.index.find_one("email", self.users[1]["profile"]["email"]).id, self.users[1]["id"])
+        self.assertIsNone(self.index.find_one("login", "nobody@example.com"))
+        self.assertEqual(len(self.index), 5)
+
+    def test_prefix_queries_are_ordered(self):
+        logins = sorted(user["profile"]["login"].lower() for user in self.users)
+        prefix = logins[0][:1]
+
+        found = [user.profile.login.lower() for user in self.index.find_prefix("login", prefix)]
+
+        self.assertEqual(found, [login for login in logins if login.startswith(prefix)])
+        self.assertEqual(list(self.index.find_prefix("login", "zzz")), [])
+
+    def test_replacing_and_removing_users_updates_the_indexes(self):
+        user = self.index[self.users[0]["id"]]
+        old_login = user.profile.login
+        user.profile.login = "renamed@example.com"
+        self.index[user.id] = user
+
+        self.assertIsNone(self.index.find_one("login", old_login))
+        self.assertIs(self.index.find_one("login", "renamed@example.com"), user)
+        self.assertEqual([u.profile.login for u in self.index.find_prefix("login", "renamed")],
+                         ["renamed@example.com"])
+
+        del self.index[user.id]
+        self.assertIsNone(self.index.find_one("login", "renamed@example.com"))
+        self.assertNotIn(user.id, self.index)
+
+    def test_shared_values(self):
+        index = UserIndex(attributes=["department", "countryCode"])
+        index.load(Utils.deserialize(self.users, User))
+        department = next(user["profile"]["department"] for user in self.users if user["profile"].get("department"))
+
+        expected = [user["id"] for user in self.users if user["profile"].get("department") == department]
+        self.assertEqual(sorted(user.id for user in index.find("department", department)), sorted(expected))
+        self.assertEqual(sum(index.values_of("department").values()),
+                         sum(1 for user in self.users if user["profile"].get("department")))
+        self.assertRaises(KeyError, index.find, "login", "a@example.com")
+
+    def test_custom_and_list_attributes(self):
+        users = Utils.deserialize(self.users, User)
+        users[0].profile.badges = ["B-1", "B-2"]
+        users[1].profile.badges = ["b-2"]
+
+        index = UserIndex(attributes=["badges"], users=users)
+
+        self.assertEqual([user.id for user in index.find("badges", "B-1")], [users[0].id])
+        self.assertEqual(sorted(user.id for user in index.find("badges", "B-2")), sorted([users[0].id, users[1].id]))
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_kept_up_to_date_by_a_sync(self, mock_get):
+        index = UserIndex()
+        sync = UserSync(UsersClient(base_url="https://mockta.com", api_token="abcdefg"), store=index)
+        mock_get.return_value = Mock(status_code=200, text=json.dumps(self.users), headers={}, links={})
+        sync.run()
+
+        changed = dict(self.users[2], lastUpdated="2021-01-01T00:00:00.000Z")
+        changed["profile"] = dict(changed["profile"], email="moved@example.com")
+        mock_get.return_value = Mock(status_code=200, text=json.dumps([changed]), headers={}, links={})
+        sync.run()
+
+        self.assertEqual(index.find_one("email", "MOVED@example.com").id, self.users[2]["id"])
+        self.assertIsNone(index.find_one("email", self.users[2]["profile"]["email"]))
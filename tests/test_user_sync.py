@@ -0,0 +1,112 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+import dateutil.tz
+from unittest.mock import Mock, patch
+from okta.UsersClient import UsersClient
+from okta.framework.UserSync import UserSync
+
+UTC = dateutil.tz.tzutc()
+
+
+def page(users):
+    return Mock(status_code=200, text=json.dumps(users), headers={}, links={})
+
+
+class UserSyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = UsersClient(base_url="https://mockta.com", api_token="abcdefg")
+        self.directory = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.directory, "sync.json")
+
+        with open("tests/data/users.json", "r") as file:
+            self.users = json.load(file)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def changed(self, index, last_updated, **changes):
+        user = dict(self.users[index], lastUpdated=last_updated)
+        user.update(changes)
+        return user
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_first_run_lists_everyone(self, mock_get):
+        mock_get.return_value = page(self.users)
+        sync = UserSync(self.client, state_file=self.state_file)
+
+        result = sync.run()
+
+        self.assertTrue(result.full)
+        self.assertEqual(len(result.created), 5)
+        self.assertEqual(len(sync.store), 5)
+        self.assertNotIn("filter", mock_get.call_args[0][0])
+        self.assertEqual(sync.high_water_mark, datetime(2020, 6, 9, 21, 6, 7, tzinfo=UTC))
+        with open(self.state_file) as state:
+            self.assertEqual(json.load(state), {"high_water_mark": "2020-06-09T21:06:07.000Z"})
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_next_run_fetches_changes_since_the_mark(self, mock_get):
+        mock_get.return_value = page(self.users)
+        UserSync(self.client, state_file=self.state_file).run()
+
+        store = {}
+        sync = UserSync(self.client, store=store, state_file=self.state_file, overlap=60)
+        store.update((user.id, user) for user in self.client.get_users())
+        mock_get.return_value = page([
+            self.users[2],
+            self.changed(0, "2020-07-01T10:00:00.000Z"),
+            self.changed(1, "2020-07-01T11:00:00.000Z", status="DEPROVISIONED"),
+            dict(self.changed(3, "2020-07-01T12:30:00.000Z"), id="00unew")
+        ])
+
+        result = sync.run()
+
+        url = mock_get.call_args[0][0]
+        self.assertIn('filter=lastUpdated gt "2020-06-09T21:05:07.000Z"', url)
+        self.assertFalse(result.full)
+        self.assertEqual([user.id for user in result.created], ["00unew"])
+        self.assertEqual([user.id for user in result.updated], [self.users[0]["id"]])
+        self.assertEqual([user.id for user in result.deprovisioned], [self.users[1]["id"]])
+        self.assertEqual(store[self.users[1]["id"]].status, "DEPROVISIONED")
+        self.assertEqual(result.summary()["high_water_mark"], "2020-07-01T12:30:00.000Z")
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_filter_is_combined_with_the_mark(self, mock_get):
+        mock_get.return_value = page(self.users)
+        sync = UserSync(self.client, filter_string='status eq "ACTIVE"')
+        sync.run()
+        self.assertIn('filter=status eq "ACTIVE"', mock_get.call_args[0][0])
+
+        sync.run()
+        self.assertIn('filter=(status eq "ACTIVE") and lastUpdated gt', mock_get.call_args[0][0])
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_full_run_drops_users_no_longer_listed(self, mock_get):
+        mock_get.return_value = page(self.users)
+        sync = UserSync(self.client)
+        sync.run()
+
+        mock_get.return_value = page(self.users[1:])
+        result = sync.run(full=True)
+
+        self.assertEqual([user.id for user in result.removed], [self.users[0]["id"]])
+        self.assertEqual(result.summary()["updated"], 0)
+        self.assertNotIn(self.users[0]["id"], sync.store)
+
+    @patch("okta.framework.ApiClient.requests.Session.get")
+    def test_failed_run_keeps_the_mark(self, mock_get):
+        mock_get.return_value = page(self.users)
+        sync = UserSync(self.client, state_file=self.state_file)
+        sync.run()
+
+        mock_get.return_value = Mock(status_code=500, text='{"errorCode": "E0000009"}', headers={}, links={})
+        self.client.retry_policy = None
+        self.assertRaises(Exception, sync.run)
+        with open(self.state_file) as state:
+            self.assertEqual(json.load(state)["high_water_mark"], "2020-06-09T21:06:07.000Z")